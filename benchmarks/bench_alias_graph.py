@@ -0,0 +1,54 @@
+"""Per-edit cost of keeping the alias graph: full rebuild vs. AliasGraph.update.
+
+    python benchmarks/bench_alias_graph.py [waves ...]
+
+Each "edit" changes one wave's objdata; the incremental cost should stay flat
+as the level grows while the full rebuild grows with it.
+"""
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_parser import generate_level  # noqa: E402
+from level_core.alias_graph import AliasGraph  # noqa: E402
+from level_core.aliases import build_alias_tree  # noqa: E402
+from level_core.document import LevelDocument  # noqa: E402
+from level_core.level import split_level  # noqa: E402
+
+
+def per_edit(fn, objects, edits):
+    rng = random.Random(0)
+    times = []
+    for _ in range(edits):
+        obj = objects[rng.randrange(1, len(objects))]  # a wave, not the WaveManager
+        obj["objdata"]["AdditionalPlantfood"] = rng.randrange(3)
+        t0 = time.perf_counter()
+        fn(obj)
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times) * 1e6
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [100, 1000, 10000]
+    print(f"{'waves':>7}  {'full rebuild':>14}  {'incremental':>12}")
+    for waves in sizes:
+        _, objects = split_level(json.loads(generate_level(waves)))
+        document = LevelDocument(objects)
+        graph = AliasGraph(document, debug=False)
+        edits = max(20, min(200, 200000 // waves))
+        full = per_edit(lambda obj: build_alias_tree(document), objects, edits)
+        incremental = per_edit(graph.update, objects, edits)
+        if graph.verify():
+            print("alias graph out of sync!")
+            return 1
+        print(f"{waves:>7}  {full:>11.1f} us  {incremental:>9.1f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""Import-time budget for the Qt-free level_core package.
+
+Imports every level_core module in a fresh interpreter, checks that PyQt6 was
+not pulled in, and exits non-zero if the median import time is over budget:
+
+    python benchmarks/bench_core_import.py [--runs N] [--budget-ms MS]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CORE = os.path.join(ROOT, "level_core")
+
+DEFAULT_BUDGET_MS = 40.0
+
+
+def core_modules():
+    return ["level_core"] + sorted(
+        f"level_core.{name[:-3]}" for name in os.listdir(CORE)
+        if name.endswith(".py") and name != "__init__.py"
+    )
+
+
+def sample(modules):
+    body = (
+        "import sys, time, importlib\n"
+        "t0 = time.perf_counter()\n"
+        f"for name in {modules!r}:\n"
+        "    importlib.import_module(name)\n"
+        "elapsed = time.perf_counter() - t0\n"
+        "print(elapsed, 'PyQt6' in sys.modules)\n"
+    )
+    out = subprocess.check_output([sys.executable, "-c", body], cwd=ROOT, text=True)
+    elapsed, qt_loaded = out.strip().splitlines()[-1].split()
+    return float(elapsed), qt_loaded == "True"
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=7)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    args = parser.parse_args()
+
+    modules = core_modules()
+    sample(modules)  # warm the OS file cache
+    results = [sample(modules) for _ in range(args.runs)]
+    times = [t for t, _ in results]
+    median_ms = statistics.median(times) * 1000
+
+    print(f"{len(modules)} modules   median {median_ms:6.1f} ms   "
+          f"min {min(times) * 1000:6.1f} ms   budget {args.budget_ms:.1f} ms")
+
+    if any(qt for _, qt in results):
+        print("FAIL: importing level_core loaded PyQt6")
+        return 1
+    if median_ms > args.budget_ms:
+        print("FAIL: level_core import is over budget")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""Cold vs. warm GameData.load timings.
+
+    python benchmarks/bench_game_data.py [path/to/game_data.json] [runs]
+
+"plain json" is the old json.load path, "cold" parses the JSON, builds the
+indexes and writes the snapshot, "warm" loads an up-to-date snapshot.
+"""
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_loader import GameData, snapshot_path  # noqa: E402
+
+
+def timed(fn, runs):
+    times = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times) * 1000, min(times) * 1000
+
+
+def plain(path):
+    with open(path, "r", encoding="utf-8") as f:
+        json.load(f)
+
+
+def cold(path):
+    try:
+        os.remove(snapshot_path(path))
+    except OSError:
+        pass
+    GameData.reload(path)
+
+
+def warm(path):
+    GameData.reload(path)
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else "game_data.json"
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    for name, fn in (("plain json", plain), ("cold (rebuild)", cold), ("warm (snapshot)", warm)):
+        median, best = timed(lambda: fn(path), runs)
+        print(f"{name:<18} median {median:7.3f} ms   min {best:7.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Cycle (Tarjan SCC) + orphan analysis time of the alias graph.
+
+    python benchmarks/bench_graph_analysis.py [waves ...]
+
+Both passes are linear, so time per object should stay flat as levels grow.
+"update" is GraphReport.update() after renaming one wave, which should not
+grow with the level.
+"""
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_parser import generate_level  # noqa: E402
+from level_core.alias_graph import AliasGraph  # noqa: E402
+from level_core.aliases import split_suffix  # noqa: E402
+from level_core.document import LevelDocument  # noqa: E402
+from level_core.graph_analysis import GraphReport  # noqa: E402
+from level_core.level import split_level  # noqa: E402
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [1000, 10000, 100000]
+    print(f"{'objects':>8}  {'median':>10}  {'per object':>10}  {'update':>10}")
+    for waves in sizes:
+        _, objects = split_level(json.loads(generate_level(waves)))
+        objects.insert(0, {
+            "aliases": ["WaveManagerModule"],
+            "objclass": "WaveManagerModuleProperties",
+            "objdata": {"WaveManagerProps": "RTID(WaveManager@CurrentLevel)"},
+        })
+        document = LevelDocument(objects)
+        graph = AliasGraph(document, debug=False)
+        times = []
+        for _ in range(3):
+            t0 = time.perf_counter()
+            report = GraphReport(document, graph)
+            times.append(time.perf_counter() - t0)
+        if report.cycles or report.orphans:
+            print("unexpected cycles/orphans in a generated level!")
+            return 1
+        median = statistics.median(times)
+
+        index = next(i for i, o in enumerate(document) if split_suffix(o["aliases"][0]) == ("Wave", 1))
+        alias = document[index]["aliases"][0]
+        update_times = []
+        for name in (alias + "X", alias) * 3:
+            document.set_aliases(index, [name])
+            t0 = time.perf_counter()
+            report.update(graph.take_changed())
+            update_times.append(time.perf_counter() - t0)
+        update = statistics.median(update_times)
+        print(f"{len(objects):>8}  {median * 1000:7.1f} ms  {median / len(objects) * 1e6:7.1f} us"
+              f"  {update * 1e6:7.1f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
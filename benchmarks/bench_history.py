@@ -0,0 +1,83 @@
+"""Undo history cost: structurally shared steps vs. a deep-copy snapshot per edit.
+
+    python benchmarks/bench_history.py [objects] [edits]
+
+Defaults to 10k edits on a 2k-object level. Every edit replaces one object's
+objdata (as the editor dialogs do), renames it or moves it; memory is what
+the undo stack keeps alive (tracemalloc), then everything is undone and redone.
+"""
+import copy
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_parser import generate_level  # noqa: E402
+from level_core.document import LevelDocument  # noqa: E402
+from level_core.history import History  # noqa: E402
+from level_core.level import split_level  # noqa: E402
+
+
+def edit(document, rng, i):
+    index = rng.randrange(1, len(document))
+    kind = rng.randrange(10)
+    if kind < 8:
+        objdata = dict(document[index]["objdata"])  # shallow: Zombies list is shared
+        objdata["AdditionalPlantfood"] = i % 3
+        document.set_objdata(index, objdata)
+    elif kind == 8:
+        document.set_aliases(index, [f"Edited{i}"])
+    else:
+        document.move(index, rng.randrange(1, len(document)))
+
+
+def main():
+    n_objects = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    edits = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    _, objects = split_level(json.loads(generate_level(n_objects - 1)))
+
+    document = LevelDocument(objects)
+    history = History(document, max_steps=edits, max_bytes=1 << 40)
+    rng = random.Random(0)
+    tracemalloc.start()
+    base = tracemalloc.get_traced_memory()[0]
+    t0 = time.perf_counter()
+    for i in range(edits):
+        edit(document, rng, i)
+    t_edit = time.perf_counter() - t0
+    kept = tracemalloc.get_traced_memory()[0] - base
+
+    t0 = time.perf_counter()
+    while history.undo():
+        pass
+    t_undo = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    while history.redo():
+        pass
+    t_redo = time.perf_counter() - t0
+    tracemalloc.stop()
+
+    # one deep-copy snapshot of the level, what a snapshot-per-step undo would keep each step
+    tracemalloc.start()
+    snapshot = copy.deepcopy(list(document))
+    one_snapshot = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del snapshot
+
+    print(f"{len(document)} objects, {edits} edits")
+    print(f"edit (incl. journaling)  {t_edit / edits * 1e6:8.1f} us/edit")
+    print(f"undo all                 {t_undo / edits * 1e6:8.1f} us/step")
+    print(f"redo all                 {t_redo / edits * 1e6:8.1f} us/step")
+    print(f"history memory           {kept / 1024 / 1024:8.1f} MiB ({kept / edits:.0f} B/step,"
+          f" estimate {history.nbytes / 1024 / 1024:.1f} MiB)")
+    print(f"deep-copy snapshots      {one_snapshot * edits / 1024 / 1024:8.1f} MiB"
+          f" ({one_snapshot / 1024:.0f} KiB/step)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""Parse time of generated large levels with each available backend.
+
+    python benchmarks/bench_parser.py [waves ...]
+
+Levels are strict JSON, so parse_level() takes the fast path; json5 is timed
+directly to show what the old loader paid. Backends that are not installed
+are skipped.
+"""
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from level_parser import parse_level, orjson  # noqa: E402
+
+
+def generate_level(waves):
+    objects = [{
+        "objclass": "LevelDefinition",
+        "objdata": {"Modules": ["RTID(WaveManagerModule@CurrentLevel)"], "Name": "Generated"},
+    }, {
+        "aliases": ["WaveManager"],
+        "objclass": "WaveManagerProperties",
+        "objdata": {
+            "FlagWaveInterval": 10,
+            "WaveCount": waves,
+            "Waves": [[f"RTID(Wave{i}@CurrentLevel)"] for i in range(1, waves + 1)],
+        },
+    }]
+    for i in range(1, waves + 1):
+        objects.append({
+            "aliases": [f"Wave{i}"],
+            "objclass": "SpawnZombiesJitteredWaveActionProps",
+            "objdata": {
+                "AdditionalPlantfood": i % 3,
+                "Zombies": [
+                    {"Type": "RTID(mummy@ZombieTypes)", "Row": (i + k) % 5 + 1}
+                    for k in range(8)
+                ],
+            },
+        })
+    return json.dumps({"objects": objects, "version": 1}, indent=2)
+
+
+def timed(fn, runs):
+    times = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return statistics.median(times) * 1000
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [100, 1000, 5000]
+    try:
+        import json5
+    except ImportError:
+        json5 = None
+
+    for waves in sizes:
+        text = generate_level(waves)
+        raw = text.encode("utf-8")
+        print(f"{waves} waves, {len(raw) / 1024:.0f} KiB")
+        rows = [
+            ("parse_level (auto)", lambda: parse_level(raw), 5),
+            ("parse_level (stdlib json)", lambda: parse_level(raw, fast=False), 5),
+        ]
+        if orjson is not None:
+            rows.append(("orjson.loads", lambda: orjson.loads(raw), 5))
+        if json5 is not None:
+            rows.append(("json5.loads (old loader)", lambda: json5.loads(text), 1))
+        else:
+            print("  json5 not installed: old-loader timing skipped")
+        for name, fn, runs in rows:
+            print(f"  {name:<28} {timed(fn, runs):10.2f} ms")
+        print(f"  backend chosen: {parse_level(raw).backend}")
+
+
+if __name__ == "__main__":
+    main()
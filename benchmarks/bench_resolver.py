@@ -0,0 +1,37 @@
+"""Whole-level reference validation time (level_core.resolver.resolve_level).
+
+    python benchmarks/bench_resolver.py [waves ...]
+
+One pass over every objdata string; each distinct RTID is parsed and looked
+up once, so the time grows with the level size only.
+"""
+import json
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_parser import generate_level  # noqa: E402
+from level_core.resolver import resolve_level  # noqa: E402
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [100, 1000, 5000]
+    resolve_level([])  # load GameData / LevelModules outside the timings
+    print(f"{'objects':>8}  {'references':>10}  {'median':>9}  {'diagnostics':>11}")
+    for waves in sizes:
+        objects = json.loads(generate_level(waves))["objects"]
+        references = sum(len(o["objdata"].get("Zombies", [])) for o in objects) + waves + 1
+        times = []
+        for _ in range(5):
+            t0 = time.perf_counter()
+            diagnostics = resolve_level(objects)
+            times.append(time.perf_counter() - t0)
+        print(f"{len(objects):>8}  {references:>10}  {statistics.median(times) * 1000:6.1f} ms  {len(diagnostics):>11}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""Schema validation time against parse time over many generated levels.
+
+    python benchmarks/bench_schemas.py [levels] [waves]
+
+Each (valid) level is parsed with parse_level(), once with the stdlib json
+fast path and once with the automatic backend (orjson when installed), and
+checked with level_core.schemas.validate_level(). The schemas are compiled
+once, before the timings, so the cost shown is one generated ok() call per
+object. The last lines say whether validation stays under each parse time.
+"""
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_parser import generate_level  # noqa: E402
+from level_core import schemas  # noqa: E402
+from level_parser import parse_level  # noqa: E402
+
+
+def valid_level(waves):
+    """generate_level() plus the StageModule every saved level has."""
+    data = json.loads(generate_level(waves))
+    data["objects"][0]["objdata"]["StageModule"] = "RTID(TutorialStage@LevelModules)"
+    return json.dumps(data).encode("utf-8")
+
+
+def main():
+    levels = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    waves = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    raw = [valid_level(waves + i % 5) for i in range(levels)]
+
+    t0 = time.perf_counter()
+    for objclass in schemas.SCHEMAS:
+        schemas.validator_for(objclass)
+    compile_ms = (time.perf_counter() - t0) * 1000
+
+    parse_s = {"stdlib json": 0.0, "auto": 0.0}
+    validate_s = 0.0
+    problems = 0
+    backend = None
+    for text in raw:
+        t0 = time.perf_counter()
+        parse_level(text, fast=False)
+        t1 = time.perf_counter()
+        data, backend = parse_level(text)
+        t2 = time.perf_counter()
+        problems += len(schemas.validate_level(data["objects"]))
+        t3 = time.perf_counter()
+        parse_s["stdlib json"] += t1 - t0
+        parse_s["auto"] += t2 - t1
+        validate_s += t3 - t2
+
+    print(f"{len(schemas.SCHEMAS)} schemas compiled in {compile_ms:.1f} ms")
+    print(f"{levels} levels   validate {validate_s * 1000:8.1f} ms   {problems} problems")
+    for name, seconds in parse_s.items():
+        if name == "auto":
+            name = f"auto ({backend})"
+        verdict = "validation under parse" if validate_s < seconds else "validation OVER parse"
+        print(f"  parse {name:<16} {seconds * 1000:8.1f} ms   validate/parse {validate_s / seconds:5.2f}x   {verdict}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+"""Compare editor registration cost: eager dialog imports vs. the lazy manifest.
+
+Each variant runs in a fresh interpreter so module caches do not leak between
+samples.  Run from the repository root:
+
+    python benchmarks/bench_startup.py [runs]
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_PRELUDE = "import time, importlib; t0 = time.perf_counter()\n"
+_EPILOGUE = "print(time.perf_counter() - t0)\n"
+
+VARIANTS = {
+    "eager (import every dialog)": (
+        "from editors.base import ObjectEditorFactory\n"
+        "from editors.manifest import EDITOR_MANIFEST\n"
+        "for objclass, target in EDITOR_MANIFEST.items():\n"
+        "    module_name, _, class_name = target.partition(':')\n"
+        "    ObjectEditorFactory.register(objclass, getattr(importlib.import_module(module_name), class_name))\n"
+    ),
+    "lazy (manifest only)": (
+        "from editors.base import ObjectEditorFactory\n"
+        "from editors.manifest import EDITOR_MANIFEST\n"
+        "ObjectEditorFactory.register_manifest(EDITOR_MANIFEST)\n"
+    ),
+    "lazy + 4 dialogs resolved": (
+        "from editors.base import ObjectEditorFactory\n"
+        "from editors.manifest import EDITOR_MANIFEST\n"
+        "ObjectEditorFactory.register_manifest(EDITOR_MANIFEST)\n"
+        "for objclass in ('WaveManagerProperties', 'WaveManagerModuleProperties',\n"
+        "                 'SpawnZombiesJitteredWaveActionProps', 'SeedBankProperties'):\n"
+        "    ObjectEditorFactory.resolve(objclass)\n"
+    ),
+}
+
+
+def sample(body):
+    out = subprocess.check_output(
+        [sys.executable, "-c", _PRELUDE + body + _EPILOGUE], cwd=ROOT, text=True
+    )
+    return float(out.strip().splitlines()[-1])
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+    # PyQt6 itself is imported by editors.base in every variant; warm the OS cache first.
+    sample("import editors.base\n")
+    for name, body in VARIANTS.items():
+        times = [sample(body) for _ in range(runs)]
+        print(f"{name:<32} median {statistics.median(times) * 1000:8.1f} ms   "
+              f"min {min(times) * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
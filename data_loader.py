@@ -2,18 +2,132 @@ import json
 import os
 
 
+# Bump whenever the layout of a snapshot payload changes.
+SNAPSHOT_VERSION = 2
+SNAPSHOT_SUFFIX = ".snapshot"
+
+
+def snapshot_path(path):
+    return path + SNAPSHOT_SUFFIX
+
+
+def load_snapshot(path, build):
+    """Return build(parsed_json) for path, reusing the binary snapshot next to it when fresh.
+
+    The snapshot is keyed on SNAPSHOT_VERSION, the builder, and the JSON file's
+    size, mtime and content hash, so any edit to the JSON rebuilds it. A missing,
+    stale or unreadable snapshot is rebuilt; failing to write one is not an error.
+    """
+    # Only needed here; kept out of module scope so headless imports stay cheap
+    import hashlib
+    import pickle
+
+    with open(path, "rb") as f:
+        raw = f.read()
+        st = os.fstat(f.fileno())
+    key = (
+        SNAPSHOT_VERSION,
+        build.__qualname__,
+        st.st_size,
+        st.st_mtime_ns,
+        hashlib.sha1(raw).hexdigest(),
+    )
+
+    cache = snapshot_path(path)
+    try:
+        with open(cache, "rb") as f:
+            # Header is pickled separately so a stale payload is never unpickled
+            if pickle.load(f) == key:
+                return pickle.load(f)
+    except Exception:
+        pass
+
+    payload = build(json.loads(raw.decode("utf-8")))
+    tmp = cache + ".tmp"
+    try:
+        with open(tmp, "wb") as f:
+            pickle.dump(key, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache)
+    except OSError:
+        # e.g. read-only install folder: keep working without a snapshot
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+    return payload
+
+
 class GameData:
     _data = None
+    _index = None     # derived lookups, see _build_snapshot
+    _generation = 0   # bumped on every (re)load so derived caches can notice
 
     @classmethod
     def load(cls, path="game_data.json"):
         if cls._data is None:
             if not os.path.exists(path):
                 raise FileNotFoundError(f"Cannot find {path}")
-            with open(path, "r", encoding="utf-8") as f:
-                cls._data = json.load(f)
+            snapshot = load_snapshot(path, cls._build_snapshot)
+            cls._data = snapshot["data"]
+            cls._index = snapshot["index"]
+            cls._generation += 1
         return cls._data
 
+    @classmethod
+    def reload(cls, path="game_data.json"):
+        """Drop the loaded data and load path again."""
+        cls._data = None
+        cls._index = None
+        return cls.load(path)
+
+    @classmethod
+    def generation(cls):
+        return cls._generation
+
+    @staticmethod
+    def _build_snapshot(data):
+        """Raw game data plus every lookup index, built once per JSON version.
+
+        index[section] holds:
+          flat    sorted tuple of unique codes
+          codes   frozenset of codes
+          entries code -> entry dict (first occurrence wins)
+          names   display name -> code
+          worlds  world -> tuple of codes (nested sections only)
+        """
+        index = {}
+        for section, groups in data.items():
+            if isinstance(groups, dict):
+                worlds = {world: tuple(e["code"] for e in arr) for world, arr in groups.items()}
+                entries_iter = [e for arr in groups.values() for e in arr]
+            elif isinstance(groups, list):
+                worlds = {}
+                entries_iter = groups
+            else:
+                continue
+
+            entries = {}
+            names = {}
+            for e in entries_iter:
+                code = e["code"]
+                entries.setdefault(code, e)
+                names.setdefault(e.get("name", code), code)
+
+            index[section] = {
+                "flat": tuple(sorted(entries)),
+                "codes": frozenset(entries),
+                "entries": entries,
+                "names": names,
+                "worlds": worlds,
+            }
+        return {"data": data, "index": index}
+
+    @classmethod
+    def _section(cls, section):
+        cls.load()
+        return cls._index.get(section, _EMPTY_SECTION)
+
     @classmethod
     def get(cls, key):
         data = cls.load()
@@ -21,14 +135,117 @@ class GameData:
 
     @classmethod
     def get_flat_list(cls, section):
-        """Flatten nested section (like Zombies / Plants) into a single list of codes."""
-        data = cls.get(section)
-        codes = []
-        if isinstance(data, dict):
-            for sub, entries in data.items():
-                for e in entries:
-                    codes.append(e["code"])
-        elif isinstance(data, list):
-            for e in data:
-                codes.append(e["code"])
-        return sorted(set(codes))
\ No newline at end of file
+        """Sorted, de-duplicated tuple of every code in a section (like Zombies / Plants)."""
+        return cls._section(section)["flat"]
+
+    @classmethod
+    def has_code(cls, section, code):
+        return code in cls._section(section)["codes"]
+
+    @classmethod
+    def get_entry(cls, section, code):
+        """Entry dict ({"name", "code"}) for code, or None."""
+        return cls._section(section)["entries"].get(code)
+
+    @classmethod
+    def code_for_name(cls, section, name):
+        """Code whose display name is name, or None."""
+        return cls._section(section)["names"].get(name)
+
+    @classmethod
+    def name_map(cls, section):
+        """Display name -> code mapping of a section (do not mutate)."""
+        return cls._section(section)["names"]
+
+    @classmethod
+    def worlds(cls, section):
+        """World names of a nested section, in file order."""
+        return tuple(cls._section(section)["worlds"])
+
+    @classmethod
+    def codes_in_world(cls, section, world):
+        return cls._section(section)["worlds"].get(world, ())
+
+
+_EMPTY_SECTION = {
+    "flat": (),
+    "codes": frozenset(),
+    "entries": {},
+    "names": {},
+    "worlds": {},
+}
+
+
+class LevelModules:
+    """Registry of the shared objects in LevelModules.json (RTID(X@LevelModules)).
+
+    Nothing is read at startup: the file (through the same snapshot cache as
+    GameData) and its indexes are loaded on the first lookup.
+    """
+    _path = "LevelModules.json"
+    _index = None
+
+    @classmethod
+    def set_path(cls, path):
+        cls._path = path
+        cls._index = None
+
+    @classmethod
+    def load(cls, path=None):
+        """Read the file now (FileNotFoundError if missing); lookups call this."""
+        if path is not None and path != cls._path:
+            cls.set_path(path)
+        if cls._index is None:
+            if not os.path.exists(cls._path):
+                raise FileNotFoundError(f"Cannot find {cls._path}")
+            cls._index = load_snapshot(cls._path, cls._build_snapshot)
+
+    @classmethod
+    def reload(cls, path=None):
+        cls._index = None
+        cls.load(path)
+
+    @classmethod
+    def is_loaded(cls):
+        return cls._index is not None
+
+    @staticmethod
+    def _build_snapshot(data):
+        """alias -> object and objclass -> tuple of aliases."""
+        by_alias = {}
+        by_class = {}
+        for obj in data.get("objects", []):
+            aliases = obj.get("aliases", [])
+            for alias in aliases:
+                by_alias.setdefault(alias, obj)
+            by_class.setdefault(obj.get("objclass", ""), []).extend(aliases)
+        return {
+            "aliases": by_alias,
+            "classes": {c: tuple(a) for c, a in by_class.items()},
+        }
+
+    @classmethod
+    def _lookup(cls, key):
+        try:
+            cls.load()
+        except FileNotFoundError:
+            return {}
+        return cls._index[key]
+
+    @classmethod
+    def get(cls, alias):
+        """The LevelModules object registered under alias, or None."""
+        return cls._lookup("aliases").get(alias)
+
+    @classmethod
+    def has_alias(cls, alias):
+        return alias in cls._lookup("aliases")
+
+    @classmethod
+    def objclass_of(cls, alias):
+        obj = cls.get(alias)
+        return obj.get("objclass") if obj else None
+
+    @classmethod
+    def aliases_for(cls, objclass):
+        return cls._lookup("classes").get(objclass, ())
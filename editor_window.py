@@ -1,17 +1,23 @@
 import json
-import json5
 import os
 
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QTextEdit, QPushButton,
     QFileDialog, QVBoxLayout, QHBoxLayout, QMessageBox,
-    QLabel, QTabWidget
+    QLabel, QTabWidget, QProgressDialog
 )
 from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, QTimer
 
-from info_tab import InfoTab
-from objects_tab import ObjectsTab
-from leveldef_tab import LevelDefinitionTab
+from lazy_tab import LazyTab
+from problems_panel import ProblemsPanel
+from level_core.graph_analysis import analyse_level
+from level_core.level import assemble_level
+from level_core.resolver import ERROR, resolve_level
+from level_core.schemas import validate_level
+from level_loader import start_level_load
+
+MAX_LISTED_DIAGNOSTICS = 30
 
 
 class EditorWindow(QMainWindow):
@@ -26,16 +32,23 @@ class EditorWindow(QMainWindow):
         self.json_editor.setFont(QFont("Consolas", 11))
         self.json_editor.setPlaceholderText("Paste or type your level JSON here...")
 
-        # Initialize tabs
-        self.info_tab = InfoTab(self.json_editor)
-        self.leveldef_tab = LevelDefinitionTab()
-        self.objects_tab = ObjectsTab(self.json_editor)
+        self.level_data = None  # last loaded level document
+        self._load_threads = set()  # background loads still running, cancelled ones included
+        self._load_worker = None    # the load whose result will be applied, see start_level_load
+        self._load_progress = None
+        self._load_notify = False
+
+        # Tabs are built on first activation or first data access (see LazyTab)
+        self.info_page = LazyTab(self._build_info_tab)
+        self.leveldef_page = LazyTab(self._build_leveldef_tab)
+        self.objects_page = LazyTab(self._build_objects_tab)
 
         # Add tabs
-        self.tabs.addTab(self.info_tab, "Level Information")
-        self.tabs.addTab(self.leveldef_tab, "Level Definition")
-        self.tabs.addTab(self.objects_tab, "Objects")
+        self.tabs.addTab(self.info_page, "Level Information")
+        self.tabs.addTab(self.leveldef_page, "Level Definition")
+        self.tabs.addTab(self.objects_page, "Objects")
         self.tabs.addTab(self.create_json_tab(), "JSON Editor")
+        self.tabs.currentChanged.connect(self._materialize_tab)
 
         # Generate full JSON button
         self.btn_generate_all = QPushButton("🌍 Generate Full JSON")
@@ -48,41 +61,76 @@ class EditorWindow(QMainWindow):
         container = QWidget()
         container.setLayout(main_layout)
         self.setCentralWidget(container)
-        
-        tutorial_path = "tutorial_level.json"
+
+        # Live reference problems of the Objects tab (attached when the tab is built)
+        self.problems_panel = ProblemsPanel(self)
+        self.problems_panel.object_activated.connect(self._show_object)
+        self.addDockWidget(Qt.DockWidgetArea.BottomDockWidgetArea, self.problems_panel)
+
+    # ---------------------------------------------------
+    def _build_info_tab(self):
+        from info_tab import InfoTab
+        return InfoTab(self.json_editor)
+
+    def _build_leveldef_tab(self):
+        from leveldef_tab import LevelDefinitionTab
+        return LevelDefinitionTab()
+
+    def _build_objects_tab(self):
+        from objects_tab import ObjectsTab
+        tab = ObjectsTab(self.json_editor)
+        self.problems_panel.set_validator(tab.validator)
+        return tab
+
+    @property
+    def info_tab(self):
+        return self.info_page.widget()
+
+    @property
+    def leveldef_tab(self):
+        return self.leveldef_page.widget()
+
+    @property
+    def objects_tab(self):
+        return self.objects_page.widget()
+
+    def _show_object(self, obj):
+        self.tabs.setCurrentWidget(self.objects_page)
+        self.objects_tab.select_object(obj)
+
+    def _materialize_tab(self, index):
+        page = self.tabs.widget(index)
+        if isinstance(page, LazyTab):
+            page.widget()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Build the visible tab only after the window itself is on screen
+        QTimer.singleShot(0, lambda: self._materialize_tab(self.tabs.currentIndex()))
+
+    def load_startup_level(self, tutorial_path="tutorial_level.json"):
+        """Start loading the template level shipped next to the executable, if any.
+
+        Runs in the background like any other load, so the window does not wait
+        for it. Returns the load worker (its finished signal comes after the level
+        is in the tabs, or after a failure or cancel), None without a file.
+        """
         if os.path.exists(tutorial_path):
-            try:
-                self.load_json_from_path(tutorial_path)
-            except Exception as e:
-                a = 1
+            return self.load_json_from_path(tutorial_path, show_progress=False)
+        return None
 
     # ---------------------------------------------------
     def generate_full_json(self):
         """Combine all sections into one final JSON structure."""
-        # Get Information
-        info = self.info_tab
-        info_data = {
-            "Information": {
-                "Author": info.author.text() or "Unknown",
-                "Introduction": info.introduction.toPlainText() or "",
-                "Version": info.version.text(),
-                "CreatedAt": info.created_at.text(),
-                "UpdatedAt": info.updated_at.text(),
-                "Difficulty": info.difficulty.currentText(),
-                "Category": info.category.currentText()
-            }
-        }
-
         # Collect aliases from all root objects
         alias_modules = self.objects_tab.get_root_aliases()
 
-        # Build LevelDefinition object
-        level_def = self.leveldef_tab.build_level_definition(alias_modules)
-
-        # Combine all into final structure
-        final_json = info_data.copy()
-        final_json["objects"] = [level_def] + self.objects_tab.objects
-        final_json["version"] = 1
+        final_json = assemble_level(
+            self.info_tab.get_data(),
+            self.leveldef_tab.get_settings(),
+            self.objects_tab.objects,
+            alias_modules,
+        )
 
         # Update editor + tree
         self.json_editor.setText(json.dumps(final_json, indent=2, ensure_ascii=False))
@@ -122,64 +170,102 @@ class EditorWindow(QMainWindow):
         )
         if not file_name:
             return
+        self.start_level_load(file_name, notify=True)
 
-        try:
-            with open(file_name, "r", encoding="utf-8") as f:
-                data = json5.load(f)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Could not read file:\n{e}")
-            return
-
-        # Cập nhật text editor
-        self.json_editor.setText(json.dumps(data, indent=2, ensure_ascii=False))
+    def load_json_from_path(self, file_name, show_progress=True):
+        """Load JSON from a direct file path without dialog."""
+        return self.start_level_load(file_name, notify=False, show_progress=show_progress)
+
+    def start_level_load(self, file_name, notify=False, show_progress=True):
+        """Read and parse file_name on a worker thread; the tabs are filled when it is done.
+
+        Returns the LevelLoadWorker.
+        """
+        self.cancel_level_load()
+        self._close_load_progress()
+
+        thread, worker = start_level_load(file_name, self)
+        self._load_worker = worker
+        self._load_threads.add(thread)
+        thread.finished.connect(lambda: self._load_threads.discard(thread))
+        self._load_notify = notify
+
+        if show_progress:
+            progress = QProgressDialog(f"Loading {os.path.basename(file_name)}...", "Cancel", 0, 100, self)
+            progress.setWindowTitle("Loading Level")
+            progress.setWindowModality(Qt.WindowModality.WindowModal)
+            progress.setMinimumDuration(300)  # no flash for small files
+            progress.setAutoClose(False)
+            progress.setAutoReset(False)
+            progress.canceled.connect(self.cancel_level_load)
+            progress.canceled.connect(self._close_load_progress)
+            worker.progress.connect(progress.setValue)
+            self._load_progress = progress
+
+        worker.loaded.connect(self._on_level_loaded)
+        worker.failed.connect(self._on_level_load_failed)
+        worker.finished.connect(self._on_level_load_finished)
+        thread.start()
+        return worker
+
+    def cancel_level_load(self):
+        """Stop the current load; whatever it still reports is ignored."""
+        if self._load_worker is not None:
+            self._load_worker.cancel()
+            self._load_worker = None
+
+    def _on_level_loaded(self, result):
+        """UI-thread half of a load: push the parsed level into the widgets."""
+        if self.sender() is not self._load_worker:
+            return  # superseded by a newer load
+
+        data = result["data"]
+        self.json_editor.setPlainText(result["text"])
 
         # --- Cập nhật các tab ---
+        self.level_data = data
         if "Information" in data:
-            self.info_tab.load_from_json(data["Information"])
+            self.info_page.load_from_json(data["Information"])
 
         # Lấy LevelDefinition từ danh sách objects
-        level_def = next(
-            (obj for obj in data.get("objects", []) if obj.get("objclass") == "LevelDefinition"), None
-        )
+        level_def = result["level_definition"]
         if level_def:
-            self.leveldef_tab.load_from_json(level_def["objdata"])
+            self.leveldef_page.load_from_json(level_def["objdata"])
 
         # Các object khác (ngoại trừ LevelDefinition)
-        other_objs = [
-            o for o in data.get("objects", [])
-            if o.get("objclass") != "LevelDefinition"
-        ]
-        self.objects_tab.load_from_json(other_objs)
+        self.objects_page.load_from_json(result["objects"])
 
-        QMessageBox.information(self, "Loaded", "File loaded and state updated successfully!")
+        message = f"Loaded {os.path.basename(result['path'])} (parser: {result['parser']})"
+        if result["schema_diagnostics"]:
+            message += f" — {len(result['schema_diagnostics'])} schema problem(s), see Problems"
+        self.statusBar().showMessage(message, 5000)
+        if self._load_notify:
+            QMessageBox.information(self, "Loaded", "File loaded and state updated successfully!")
 
-    def load_json_from_path(self, file_name):
-        """Load JSON from a direct file path without dialog."""
-        try:
-            with open(file_name, "r", encoding="utf-8") as f:
-                data = json5.load(f)
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Could not read file:\n{e}")
+    def _on_level_load_failed(self, message):
+        if self.sender() is not self._load_worker:
             return
+        self._close_load_progress()
+        QMessageBox.critical(self, "Error", f"Could not read file:\n{message}")
 
-        # Cập nhật text editor
-        self.json_editor.setText(json.dumps(data, indent=2, ensure_ascii=False))
-
-        # --- Cập nhật các tab ---
-        if "Information" in data:
-            self.info_tab.load_from_json(data["Information"])
-
-        level_def = next(
-            (obj for obj in data.get("objects", []) if obj.get("objclass") == "LevelDefinition"), None
-        )
-        if level_def:
-            self.leveldef_tab.load_from_json(level_def["objdata"])
-
-        other_objs = [
-            o for o in data.get("objects", [])
-            if o.get("objclass") != "LevelDefinition"
-        ]
-        self.objects_tab.load_from_json(other_objs)
+    def _on_level_load_finished(self):
+        if self.sender() is not self._load_worker:
+            return
+        self._close_load_progress()
+        self._load_worker = None
+
+    def _close_load_progress(self):
+        if self._load_progress is not None:
+            self._load_progress.close()
+            self._load_progress.deleteLater()
+            self._load_progress = None
+
+    def closeEvent(self, event):
+        self.cancel_level_load()
+        for thread in list(self._load_threads):
+            thread.quit()
+            thread.wait()
+        super().closeEvent(event)
 
     def save_json(self):
         try:
@@ -188,6 +274,17 @@ class EditorWindow(QMainWindow):
             QMessageBox.warning(self, "Invalid JSON", f"Syntax error:\n{e}")
             return
 
+        objects = data.get("objects", []) if isinstance(data, dict) else []
+        diagnostics = validate_level(o for o in objects if isinstance(o, dict))
+        if diagnostics:
+            answer = QMessageBox.question(
+                self, "Schema Errors",
+                f"{len(diagnostics)} value(s) are outside what the game accepts:\n\n"
+                + _format_diagnostics(diagnostics) + "\n\nSave anyway?"
+            )
+            if answer != QMessageBox.StandardButton.Yes:
+                return
+
         file_name, _ = QFileDialog.getSaveFileName(self, "Save JSON File", "", "JSON Files (*.json *.json5)")
         if not file_name:
             return
@@ -198,7 +295,33 @@ class EditorWindow(QMainWindow):
 
     def validate_json(self):
         try:
-            json.loads(self.json_editor.toPlainText())
-            QMessageBox.information(self, "Valid", "✅ JSON structure is valid!")
+            data = json.loads(self.json_editor.toPlainText())
         except json.JSONDecodeError as e:
-            QMessageBox.warning(self, "Invalid", f"❌ JSON syntax error:\n{e}")
\ No newline at end of file
+            QMessageBox.warning(self, "Invalid", f"❌ JSON syntax error:\n{e}")
+            return
+
+        objects = data.get("objects", []) if isinstance(data, dict) else []
+        objects = [o for o in objects if isinstance(o, dict)]
+        diagnostics = validate_level(objects)
+        diagnostics += resolve_level(objects)
+        diagnostics += [d for _, d in analyse_level({"objects": objects}).diagnostics()]
+        if not diagnostics:
+            QMessageBox.information(self, "Valid", "✅ JSON structure, values and all references are valid!")
+            return
+
+        errors = sum(1 for d in diagnostics if d.severity == ERROR)
+        QMessageBox.warning(
+            self, "Problems",
+            f"JSON syntax is valid, but {errors} error(s) and "
+            f"{len(diagnostics) - errors} warning(s) were found:\n\n" + _format_diagnostics(diagnostics)
+        )
+
+
+def _format_diagnostics(diagnostics):
+    lines = [
+        f"{'❌' if d.severity == ERROR else '⚠️'} {d.object} {d.path}: {d.reference} — {d.reason}"
+        for d in diagnostics[:MAX_LISTED_DIAGNOSTICS]
+    ]
+    if len(diagnostics) > MAX_LISTED_DIAGNOSTICS:
+        lines.append(f"... and {len(diagnostics) - MAX_LISTED_DIAGNOSTICS} more")
+    return "\n".join(lines)
\ No newline at end of file
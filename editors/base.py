@@ -1,20 +1,119 @@
+import importlib
+
 from PyQt6.QtWidgets import QLineEdit, QCompleter
 from PyQt6.QtCore import QStringListModel, Qt
 from data_loader import GameData
+from level_core.document import LevelDocument
+from level_core.references import ReferenceValidator  # re-exported for the dialogs
+from level_core.rtid import CURRENT_LEVEL, GRID_ITEM, PLANT_TYPES, ZOMBIE_TYPES, as_rtid, format_rtid
+
+_shared_models = {}  # GameData section -> (GameData generation, QStringListModel)
+
+
+def shared_completion_model(section):
+    """Process-wide completion model of a GameData section's codes.
+
+    Every line edit of that section shares it; it is rebuilt only after
+    GameData reloads. Treat it as read-only.
+    """
+    codes = GameData.get_flat_list(section)
+    generation = GameData.generation()
+    cached = _shared_models.get(section)
+    if cached is None or cached[0] != generation:
+        cached = (generation, QStringListModel(list(codes)))
+        _shared_models[section] = cached
+    return cached[1]
+
 
 class ReferenceLineEdit(QLineEdit):
-    """QLineEdit with autocomplete suggestions for RTID references."""
+    """QLineEdit with autocomplete suggestions for RTID references.
+
+    Given the Objects tab's LevelDocument, it follows its changes while shown
+    and only rebuilds the per-objclass alias buckets a change touched. Hiding
+    it (its dialog closing) unsubscribes; showing it again catches up.
+    """
     def __init__(self, object_list=None, allowed_classes=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.object_list = object_list or []
+        self._object_list = []
+        self._subscribed = False
+        self._stale = False  # missed changes while hidden
+        self._buckets = {}  # objclass -> aliases (document mode only)
         self.allowed_classes = allowed_classes
-        self.model = QStringListModel()
+        self.model = self._create_model()
         self.completer = QCompleter(self.model, self)
         self.completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
         self.setCompleter(self.completer)
+        self.object_list = object_list if object_list is not None else []
+
+    def _create_model(self):
+        return QStringListModel()
+
+    @property
+    def object_list(self):
+        return self._object_list
+
+    @object_list.setter
+    def object_list(self, objects):
+        self._unsubscribe()
+        self._object_list = objects
+        if self.isVisible():
+            self._subscribe()
         self.refresh_suggestions()
 
+    def _subscribe(self):
+        if not self._subscribed and isinstance(self._object_list, LevelDocument):
+            self._object_list.subscribe(self._on_document_changed)
+            self._subscribed = True
+
+    def _unsubscribe(self):
+        if self._subscribed:
+            self._object_list.unsubscribe(self._on_document_changed)
+            self._subscribed = False
+        self._stale = False
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        stale = self._stale
+        self._subscribe()
+        if stale:
+            self._stale = False
+            self.refresh_suggestions()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        subscribed = self._subscribed
+        self._unsubscribe()
+        self._stale = subscribed
+
+    def _bucket(self, objclass):
+        return [a for obj in self._object_list.objects_of_class(objclass) for a in obj.get("aliases", [])]
+
+    def _publish_buckets(self):
+        self.model.setStringList([a for aliases in self._buckets.values() for a in aliases])
+
+    def _on_document_changed(self, change):
+        if change.reset:
+            self.refresh_suggestions()
+            return
+        touched = change.objclasses()
+        if self.allowed_classes:
+            touched &= set(self.allowed_classes)
+        if not touched:
+            return
+        for objclass in touched:
+            bucket = self._bucket(objclass)
+            if bucket:
+                self._buckets[objclass] = bucket
+            else:
+                self._buckets.pop(objclass, None)
+        self._publish_buckets()
+
     def refresh_suggestions(self):
+        if isinstance(self.object_list, LevelDocument):
+            classes = self.allowed_classes or list(self.object_list.objclasses())
+            self._buckets = {c: b for c in dict.fromkeys(classes) if (b := self._bucket(c))}
+            self._publish_buckets()
+            return
         if not self.object_list:
             self.model.setStringList([])
             return
@@ -27,94 +126,96 @@ class ReferenceLineEdit(QLineEdit):
         self.model.setStringList(aliases)
 
     def get_rtid_value(self):
-        alias = self.text().strip()
-        if not alias:
-            return ""
-        if alias.startswith("RTID("):
-            return alias
-        return f"RTID({alias}@CurrentLevel)"
-    
-class PlantLineEdit(ReferenceLineEdit):
-    def __init__(self, *args, **kwargs):
-        plants = []
-        data = GameData.get("Plants")
-        for world, arr in data.items():
-            for e in arr:
-                plants.append(e["code"])
-        super().__init__(object_list=[{"aliases": plants}], *args, **kwargs)
+        return as_rtid(self.text(), CURRENT_LEVEL)
+
+
+class GameDataLineEdit(ReferenceLineEdit):
+    """Autocomplete over one GameData section, backed by the shared completion model."""
+    section = None
+
+    def _create_model(self):
+        return shared_completion_model(self.section)
+
+    def refresh_suggestions(self):
+        # Nothing to rebuild; only follow the shared model if GameData was reloaded
+        model = shared_completion_model(self.section)
+        if model is not self.model:
+            self.model = model
+            self.completer.setModel(model)
+
+
+class PlantLineEdit(GameDataLineEdit):
+    section = "Plants"
 
     def get_rtid_value(self):
         alias = self.text().strip()
         if not alias:
             return ""
-        return f"RTID({alias}@PlantTypes)"
+        return format_rtid(alias, PLANT_TYPES)
 
 
-class ZombieLineEdit(ReferenceLineEdit):
-    def __init__(self, *args, **kwargs):
-        zombies = []
-        data = GameData.get("Zombies")
-        for world, arr in data.items():
-            for e in arr:
-                zombies.append(e["code"])
-        super().__init__(object_list=[{"aliases": zombies}], *args, **kwargs)
+class ZombieLineEdit(GameDataLineEdit):
+    section = "Zombies"
 
     def get_rtid_value(self):
         alias = self.text().strip()
         if not alias:
             return ""
-        return f"RTID({alias}@ZombieTypes)"
+        return format_rtid(alias, ZOMBIE_TYPES)
 
-class GridItemLineEdit(ReferenceLineEdit):
+class GridItemLineEdit(GameDataLineEdit):
     """Autocomplete line edit for Grid Items from game_data.json."""
+    section = "Grid Items"
+
     def __init__(self, *args, **kwargs):
-        grid_items = GameData.get_flat_list("Grid Items")
-        super().__init__(object_list=[{"aliases": grid_items}], *args, **kwargs)
+        super().__init__(*args, **kwargs)
         self.setPlaceholderText("Enter grid item (e.g. gravestone_tutorial)")
 
     def get_rtid_value(self):
         alias = self.text().strip()
         if not alias:
             return ""
-        return f"RTID({alias}@GridItem)"
+        return format_rtid(alias, GRID_ITEM)
     
-class ConditionLineEdit(ReferenceLineEdit):
+class ConditionLineEdit(GameDataLineEdit):
     """Autocomplete for condition strings from GameData."""
+    section = "Conditions"
+
     def __init__(self, *args, **kwargs):
-        conditions = GameData.get_flat_list("Conditions")
-        super().__init__(object_list=[{"aliases": conditions}], *args, **kwargs)
+        super().__init__(*args, **kwargs)
         self.setPlaceholderText("Condition (e.g. icecubed, frozen, wet)")
 
-class ReferenceValidator:
-    """Cross-object RTID validator."""
-    @staticmethod
-    def is_reference_valid(reference: str, objects: list) -> bool:
-        if not reference.startswith("RTID(") or "@CurrentLevel)" not in reference:
-            return True
-        alias = reference.replace("RTID(", "").replace("@CurrentLevel)", "")
-        return any(alias in obj.get("aliases", []) for obj in objects)
-
-    @staticmethod
-    def list_missing_references(references: list[str], objects: list):
-        missing = []
-        for ref in references:
-            if not ReferenceValidator.is_reference_valid(ref, objects):
-                alias = ref.replace("RTID(", "").replace("@CurrentLevel)", "")
-                missing.append(alias)
-        return missing
-
-
 class ObjectEditorFactory:
     """Factory for creating object editor dialogs dynamically."""
-    _registry = {}
+    _registry = {}  # objclass -> dialog class, or "module:Class" until first use
 
     @classmethod
     def register(cls, objclass_name, dialog_cls):
         cls._registry[objclass_name] = dialog_cls
 
     @classmethod
-    def create(cls, objclass_name, parent=None, existing_data=None):
+    def register_manifest(cls, manifest):
+        """Register {objclass: "module:Class"} without importing the dialog modules."""
+        for objclass_name, target in manifest.items():
+            cls._registry[objclass_name] = target
+
+    @classmethod
+    def is_registered(cls, objclass_name):
+        return objclass_name in cls._registry
+
+    @classmethod
+    def resolve(cls, objclass_name):
+        """Return the dialog class for objclass, importing its module on first use."""
         dialog_cls = cls._registry.get(objclass_name)
+        if isinstance(dialog_cls, str):
+            module_name, _, class_name = dialog_cls.partition(":")
+            dialog_cls = getattr(importlib.import_module(module_name), class_name)
+            cls._registry[objclass_name] = dialog_cls
+        return dialog_cls
+
+    @classmethod
+    def create(cls, objclass_name, parent=None, existing_data=None):
+        dialog_cls = cls.resolve(objclass_name)
         if not dialog_cls:
             return None
         return dialog_cls(parent=parent, existing_data=existing_data)
\ No newline at end of file
@@ -5,6 +5,7 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 from editors.base import PlantLineEdit
+from level_core import objdata
 
 
 class ConveyorSeedBankDialog(QDialog):
@@ -193,25 +194,9 @@ class ConveyorSeedBankDialog(QDialog):
             maxpack = int(parts[-1])
             drop_conditions.append({"Delay": delay, "MaxPackets": maxpack})
 
-        # InitialPlantList (use stored dicts; omit zero fields)
+        # InitialPlantList (use stored dicts; zero fields are omitted on export)
         for i in range(self.plant_list.count()):
-            item = self.plant_list.item(i)
-            p = dict(item.data(Qt.ItemDataRole.UserRole) or {})
-            if p.get("Weight", 0) <= 0:
-                continue
-
-            out = {"PlantType": p.get("PlantType", "").strip(), "Weight": int(p.get("Weight", 0))}
-            # optional ints
-            for k in ("MaxCount", "MinCount",
-                      "MinCountCooldownSeconds", "MaxCountCooldownSeconds"):
-                v = int(p.get(k, 0)) if p.get(k) is not None else 0
-                if v > 0: out[k] = v
-            # optional floats
-            for k in ("MaxWeightFactor", "MinWeightFactor"):
-                v = float(p.get(k, 0.0)) if p.get(k) is not None else 0.0
-                if v > 0.0: out[k] = v
-
-            plants.append(out)
+            plants.append(dict(self.plant_list.item(i).data(Qt.ItemDataRole.UserRole) or {}))
 
         # SpeedConditions
         for i in range(self.speed_list.count()):
@@ -219,11 +204,7 @@ class ConveyorSeedBankDialog(QDialog):
             parts = text.replace("MaxPackets=", "").replace("Speed=", "").split(",")
             speeds.append({"MaxPackets": int(parts[0]), "Speed": int(parts[1])})
 
-        return {
-            "DropDelayConditions": drop_conditions,
-            "InitialPlantList": plants,
-            "SpeedConditions": speeds
-        }
+        return objdata.conveyor_seed_bank(drop_conditions, plants, speeds)
 
 
 # ---------------- Sub-dialogs ----------------
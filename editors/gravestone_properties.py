@@ -4,6 +4,7 @@ from PyQt6.QtWidgets import (
     QHBoxLayout, QMessageBox
 )
 from editors.base import GridItemLineEdit
+from level_core import objdata
 
 
 class GravestonePropertiesDialog(QDialog):
@@ -81,21 +82,11 @@ class GravestonePropertiesDialog(QDialog):
             txt = self.force_list.item(i).text()
             coords, name = txt.split(" - ")
             gx, gy = coords.strip("()").split(", ")
-            force_data.append({
-                "GridX": int(gx),
-                "GridY": int(gy),
-                "TypeName": name
-            })
-
-        data = {}
-        if self.gravestone_count.value() > 0:
-            data["GravestoneCount"] = self.gravestone_count.value()
-        if self.spawn_start.value() > 0 or self.spawn_end.value() > 0:
-            data["SpawnColumnStart"] = self.spawn_start.value()
-            data["SpawnColumnEnd"] = self.spawn_end.value()
-        if force_data:
-            data["ForceSpawnData"] = force_data
-        return data
+            force_data.append((gx, gy, name))
+
+        return objdata.gravestones(
+            self.gravestone_count.value(), self.spawn_start.value(), self.spawn_end.value(), force_data
+        )
 
 
 class ForceSpawnEntryDialog(QDialog):
@@ -4,6 +4,7 @@ from PyQt6.QtWidgets import (
     QSpinBox, QMessageBox
 )
 from editors.base import GridItemLineEdit
+from level_core import objdata
 
 
 class InitialGridItemDialog(QDialog):
@@ -98,13 +99,9 @@ class InitialGridItemDialog(QDialog):
             text = self.items_list.item(i).text()
             coords, t = text.split(" - ")
             gx, gy = coords.strip("()").split(",")
-            placements.append({
-                "GridX": int(gx),
-                "GridY": int(gy),
-                "TypeName": t.strip()
-            })
+            placements.append((gx, gy, t))
 
-        return {"InitialGridItemPlacements": placements}
+        return objdata.initial_grid_items(placements)
 
 
 # ============================================================
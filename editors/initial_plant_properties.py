@@ -5,6 +5,7 @@ from PyQt6.QtWidgets import (
 )
 
 from editors.base import PlantLineEdit, ConditionLineEdit
+from level_core import objdata
 
 
 class InitialPlantPropertiesEditor(QDialog):
@@ -82,7 +83,7 @@ class InitialPlantPropertiesEditor(QDialog):
     # ---------------------------------------------------
 
     def get_data(self):
-        return {"InitialPlantPlacements": self.placements}
+        return objdata.initial_plants(self.placements)
 
 class PlacementEditorDialog(QDialog):
     def __init__(self, parent=None, existing=None):
@@ -135,14 +136,7 @@ class PlacementEditorDialog(QDialog):
     # ---------------------------------------------------
 
     def get_data(self):
-        data = {
-            "TypeName": self.input_typename.text().strip(),
-            "GridX": int(self.input_gridx.value()),
-            "GridY": int(self.input_gridy.value()),
-        }
-
-        cond = self.input_condition.text().strip()
-        if cond:
-            data["Condition"] = cond
-
-        return data
\ No newline at end of file
+        return objdata.grid_placement(
+            self.input_typename.text(), self.input_gridx.value(), self.input_gridy.value(),
+            self.input_condition.text()
+        )
\ No newline at end of file
@@ -5,6 +5,7 @@ from PyQt6.QtWidgets import (
 )
 
 from editors.base import ZombieLineEdit, ConditionLineEdit
+from level_core import objdata
 
 
 class InitialZombiePropertiesEditor(QDialog):
@@ -84,7 +85,7 @@ class InitialZombiePropertiesEditor(QDialog):
     # ---------------------------------------------------
 
     def get_data(self):
-        return {"InitialZombiePlacements": self.placements}
+        return objdata.initial_zombies(self.placements)
 
 class ZombiePlacementEditorDialog(QDialog):
     def __init__(self, parent=None, existing=None):
@@ -138,14 +139,7 @@ class ZombiePlacementEditorDialog(QDialog):
     # ---------------------------------------------------
 
     def get_data(self):
-        data = {
-            "TypeName": self.input_typename.text().strip(),
-            "GridX": int(self.input_gridx.value()),
-            "GridY": int(self.input_gridy.value()),
-        }
-
-        cond = self.input_condition.text().strip()
-        if cond:
-            data["Condition"] = cond
-
-        return data
+        return objdata.grid_placement(
+            self.input_typename.text(), self.input_gridx.value(), self.input_gridy.value(),
+            self.input_condition.text()
+        )
@@ -1,6 +1,7 @@
 from PyQt6.QtWidgets import (
     QDialog, QFormLayout, QSpinBox, QDialogButtonBox
 )
+from level_core import objdata
 
 class LastStandMinigameDialog(QDialog):
     """Dialog for editing LastStandMinigameProperties."""
@@ -36,7 +37,4 @@ class LastStandMinigameDialog(QDialog):
 
     def get_data(self):
         """Return structured objdata for JSON export."""
-        return {
-            "StartingPlantfood": self.starting_plantfood.value(),
-            "StartingSun": self.starting_sun.value()
-        }
\ No newline at end of file
+        return objdata.last_stand(self.starting_plantfood.value(), self.starting_sun.value())
\ No newline at end of file
@@ -0,0 +1,34 @@
+"""objclass -> "module:Class" of its editor dialog.
+
+Kept free of Qt imports so the list of editable classes can be read
+without loading any dialog module (see ObjectEditorFactory.register_manifest).
+"""
+
+EDITOR_MANIFEST = {
+    "RailcartProperties": "editors.railcart_properties:RailcartPropertiesDialog",
+    "TrapTileProperties": "editors.trap_tile_properties:TrapTilePropertiesEditor",
+    "InitialZombieProperties": "editors.initial_zombie_properties:InitialZombiePropertiesEditor",
+    "InitialPlantProperties": "editors.initial_plant_properties:InitialPlantPropertiesEditor",
+    "InitialGridItemProperties": "editors.initial_grid_item:InitialGridItemDialog",
+    "PiratePlankProperties": "editors.pirate_plank_properties:PiratePlankDialog",
+    "MoldColonyChallengeProps": "editors.mold_colony_challenge:MoldColonyChallengeDialog",
+    "PowerTileProperties": "editors.power_tile_properties:PowerTileDialog",
+    "ModifyConveyorWaveActionProps": "editors.modify_conveyor:ModifyConveyorDialog",
+    "ConveyorSeedBankProperties": "editors.conveyor_seedbank:ConveyorSeedBankDialog",
+    "LastStandMinigameProperties": "editors.last_stand:LastStandMinigameDialog",
+    "SeedBankProperties": "editors.seedbank_properties:SeedBankPropertiesDialog",
+    "GravestoneProperties": "editors.gravestone_properties:GravestonePropertiesDialog",
+    "ZombiePotionModuleProperties": "editors.zombie_potion_module:ZombiePotionModuleDialog",
+    "ProtectThePlantChallengeProperties": "editors.protect_the_plant:ProtectThePlantDialog",
+    "WaveManagerProperties": "editors.wave_manager:WaveManagerDialog",
+    "SpawnZombiesJitteredWaveActionProps": "editors.spawn_zombies:SpawnZombiesJitteredDialog",
+    "WaveManagerModuleProperties": "editors.wave_manager_module:WaveManagerModuleDialog",
+    "StarChallengeBeatTheLevelProps": "editors.star_challenge_beat_level:StarChallengeBeatTheLevelDialog",
+    "StarChallengeKillZombiesInTimeProps": "editors.star_challenge_kill_zombies_time:StarChallengeKillZombiesInTimeDialog",
+    "StarChallengePlantsLostProps": "editors.star_challenge_plants_lost:StarChallengePlantsLostDialog",
+    "StarChallengeSimultaneousPlantsProps": "editors.star_challenge_simultaneous_plants:StarChallengeSimultaneousPlantsDialog",
+    "StarChallengeSunProducedProps": "editors.star_challenge_sun_produced:StarChallengeSunProducedDialog",
+    "StarChallengeZombieDistanceProps": "editors.star_challenge_zombie_distance:StarChallengeZombieDistanceDialog",
+    "StarChallengeModuleProperties": "editors.star_challenge_module:StarChallengeModuleDialog",
+    "StarChallengeSunUsedProps": "editors.star_challenge_sun_used:StarChallengeSunUsedPropsDialog",
+}
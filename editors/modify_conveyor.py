@@ -4,6 +4,8 @@ from PyQt6.QtWidgets import (
 )
 from editors.base import PlantLineEdit
 import re
+from level_core import objdata
+from level_core.rtid import PLANT_TYPES, format_rtid, strip_rtid
 
 
 class ModifyConveyorDialog(QDialog):
@@ -69,7 +71,7 @@ class ModifyConveyorDialog(QDialog):
     # ---------------- Utility: format display text ----------------
     def format_plant_entry(self, p):
         """Format plant entry into readable list text."""
-        name = p.get("Type", "").replace("RTID(", "").replace("@PlantTypes)", "")
+        name = strip_rtid(p.get("Type", ""), PLANT_TYPES)
         info = [f"W={p.get('Weight', 0)}"]
 
         if p.get("MinCount"):
@@ -94,7 +96,7 @@ class ModifyConveyorDialog(QDialog):
         inside = text[text.find("(") + 1:text.find(")")]
         parts = re.findall(r"(\w+)=([\w\.]+)", inside)
 
-        d = {"Type": f"RTID({name}@PlantTypes)"}
+        d = {"Type": format_rtid(name, PLANT_TYPES)}
         for key, val in parts:
             if key == "W":
                 d["Weight"] = int(val)
@@ -147,10 +149,7 @@ class ModifyConveyorDialog(QDialog):
                 result.append(self.parse_plant_entry(text))
             return result
 
-        return {
-            "Add": parse_list(self.add_list),
-            "Remove": parse_list(self.remove_list)
-        }
+        return objdata.modify_conveyor(parse_list(self.add_list), parse_list(self.remove_list))
 
 
 # ---------------- Sub-dialog for each plant entry ----------------
@@ -167,7 +166,7 @@ class ModifyPlantDialog(QDialog):
 
         self.plant_type = PlantLineEdit()
         self.plant_type.setText(
-            data.get("Type", "").replace("RTID(", "").replace("@PlantTypes)", "")
+            strip_rtid(data.get("Type", ""), PLANT_TYPES)
         )
         self.weight = QSpinBox(); self.weight.setRange(0, 1000)
         self.weight.setValue(data.get("Weight", 0))
@@ -206,20 +205,13 @@ class ModifyPlantDialog(QDialog):
 
     def get_data(self):
         """Return structured dict, omitting 0 values."""
-        d = {
-            "Type": f"RTID({self.plant_type.text().strip()}@PlantTypes)",
-            "Weight": self.weight.value()
-        }
-        if self.max_count.value() > 0:
-            d["MaxCount"] = self.max_count.value()
-        if self.max_count_cooldown.value() > 0:
-            d["MaxCountCooldownSeconds"] = self.max_count_cooldown.value()
-        if self.min_count.value() > 0:
-            d["MinCount"] = self.min_count.value()
-        if self.min_count_cooldown.value() > 0:
-            d["MinCountCooldownSeconds"] = self.min_count_cooldown.value()
-        if self.max_weight_factor.value() > 0:
-            d["MaxWeightFactor"] = self.max_weight_factor.value()
-        if self.min_weight_factor.value() > 0:
-            d["MinWeightFactor"] = self.min_weight_factor.value()
-        return d
\ No newline at end of file
+        return objdata.modify_conveyor_plant(
+            format_rtid(self.plant_type.text().strip(), PLANT_TYPES),
+            self.weight.value(),
+            MaxCount=self.max_count.value(),
+            MaxCountCooldownSeconds=self.max_count_cooldown.value(),
+            MinCount=self.min_count.value(),
+            MinCountCooldownSeconds=self.min_count_cooldown.value(),
+            MaxWeightFactor=self.max_weight_factor.value(),
+            MinWeightFactor=self.min_weight_factor.value(),
+        )
\ No newline at end of file
@@ -3,6 +3,7 @@ from PyQt6.QtWidgets import (
     QLabel, QPushButton, QDialogButtonBox
 )
 from PyQt6.QtCore import Qt
+from level_core import objdata
 
 
 class MoldColonyChallengeDialog(QDialog):
@@ -72,13 +73,5 @@ class MoldColonyChallengeDialog(QDialog):
     # ------------------------------------------------
     def get_data(self):
         """Convert grid state into MoldMatrix format."""
-        matrix = []
-        for row in self.checkboxes:
-            s = "".join("1" if cb.isChecked() else "0" for cb in row)
-            matrix.append(s)
-
-        obj = {"MoldMatrix": matrix}
-        if self.suppress_tip.isChecked():
-            obj["SuppressObjectiveTip"] = True
-
-        return obj
\ No newline at end of file
+        matrix = [[cb.isChecked() for cb in row] for row in self.checkboxes]
+        return objdata.mold_colony(matrix, self.suppress_tip.isChecked())
\ No newline at end of file
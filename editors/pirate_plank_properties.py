@@ -2,6 +2,7 @@ from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QCheckBox, QLabel,
     QDialogButtonBox, QHBoxLayout
 )
+from level_core import objdata
 
 
 class PiratePlankDialog(QDialog):
@@ -40,4 +41,4 @@ class PiratePlankDialog(QDialog):
     def get_data(self):
         """Return selected rows in JSON-ready format."""
         selected = [i for i, cb in enumerate(self.row_boxes) if cb.isChecked()]
-        return {"PlankRows": selected}
\ No newline at end of file
+        return objdata.pirate_planks(selected)
\ No newline at end of file
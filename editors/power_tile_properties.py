@@ -4,6 +4,7 @@ from PyQt6.QtWidgets import (
     QComboBox, QDialogButtonBox, QMessageBox
 )
 from PyQt6.QtCore import Qt
+from level_core import objdata
 
 
 class PowerTileDialog(QDialog):
@@ -104,17 +105,8 @@ class PowerTileDialog(QDialog):
         return base
 
     def get_data(self):
-        tiles = []
-        for i in range(self.list.count()):
-            item = self.list.item(i)
-            data = dict(item.data(Qt.ItemDataRole.UserRole) or {})
-            # ensure numeric types are correct on export
-            data["PropagationDelay"] = float(data.get("PropagationDelay", 0.0))
-            if float(data.get("PropagationInitialDelay", 0.0)) == 0.0 and "PropagationInitialDelay" in data:
-                # drop zero initial delay to keep JSON clean
-                data.pop("PropagationInitialDelay", None)
-            tiles.append(data)
-        return {"LinkedTiles": tiles}
+        links = [self.list.item(i).data(Qt.ItemDataRole.UserRole) or {} for i in range(self.list.count())]
+        return objdata.power_tiles(links)
 
 
 class PowerTileLinkDialog(QDialog):
@@ -163,12 +155,7 @@ class PowerTileLinkDialog(QDialog):
         self.setLayout(layout)
 
     def get_data(self):
-        data = {
-            "Group": self.group.currentText(),
-            "Location": {"mX": self.mx.value(), "mY": self.my.value()},
-            "PropagationDelay": self.propagation_delay.value()
-        }
-        # chỉ thêm khi khác 0 để tránh rác JSON
-        if self.propagation_init_delay.value() != 0:
-            data["PropagationInitialDelay"] = self.propagation_init_delay.value()
-        return data
\ No newline at end of file
+        return objdata.power_tile_link(
+            self.group.currentText(), self.mx.value(), self.my.value(),
+            self.propagation_delay.value(), self.propagation_init_delay.value()
+        )
\ No newline at end of file
@@ -1,5 +1,7 @@
 from PyQt6.QtWidgets import *
 from editors.base import PlantLineEdit
+from level_core import objdata
+from level_core.rtid import PLANT_TYPES, format_rtid, strip_rtid
 
 class ProtectThePlantDialog(QDialog):
     """Dialog for editing ProtectThePlantChallengeProperties."""
@@ -75,7 +77,7 @@ class ProtectThePlantDialog(QDialog):
         text = item.text()
         coords, plant_type = text.split(" - ")
         gridx, gridy = coords.strip("()").split(", ")
-        plant_type_clean = plant_type.replace("RTID(", "").replace("@PlantTypes)", "")
+        plant_type_clean = strip_rtid(plant_type, PLANT_TYPES)
 
         dlg = PlantEditorDialog(self)
         dlg.gridx.setValue(int(gridx))
@@ -100,16 +102,9 @@ class ProtectThePlantDialog(QDialog):
             text = self.plants_list.item(i).text()
             coords, plant_type = text.split(" - ")
             gridx, gridy = coords.strip("()").split(", ")
-            plants.append({
-                "GridX": int(gridx),
-                "GridY": int(gridy),
-                "PlantType": plant_type
-            })
+            plants.append((gridx, gridy, plant_type))
 
-        return {
-            "MustProtectCount": self.must_count.value(),
-            "Plants": plants
-        }
+        return objdata.protect_the_plant(self.must_count.value(), plants)
 
 
 class PlantEditorDialog(QDialog):
@@ -143,5 +138,5 @@ class PlantEditorDialog(QDialog):
         return {
             "GridX": self.gridx.value(),
             "GridY": self.gridy.value(),
-            "PlantType": f"RTID({self.plant_type.text().strip()}@PlantTypes)"
+            "PlantType": format_rtid(self.plant_type.text().strip(), PLANT_TYPES)
         }
\ No newline at end of file
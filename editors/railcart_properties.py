@@ -2,6 +2,7 @@ from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QLabel, QListWidget, QPushButton,
     QHBoxLayout, QDialogButtonBox, QFormLayout, QSpinBox, QComboBox
 )
+from level_core import objdata
 
 class RailcartPropertiesDialog(QDialog):
     """Dialog for editing RailcartProperties."""
@@ -149,7 +150,7 @@ class RailcartPropertiesDialog(QDialog):
             text = self.list_railcarts.item(i).text()
             col = int(text.split("Col ")[1].split(",")[0])
             row = int(text.split("Row ")[1])
-            railcarts.append({"Column": col, "Row": row})
+            railcarts.append((col, row))
 
         # Rails
         rails = []
@@ -159,17 +160,9 @@ class RailcartPropertiesDialog(QDialog):
             rest = text.split(":")[1].strip()
             row_start = int(rest.split("RowStart ")[1].split("→")[0])
             row_end = int(rest.split("RowEnd")[1].strip())
-            rails.append({
-                "Column": col,
-                "RowStart": row_start,
-                "RowEnd": row_end
-            })
+            rails.append((col, row_start, row_end))
 
-        return {
-            "RailcartType": self.combo_type.currentText(),
-            "Railcarts": railcarts,
-            "Rails": rails
-        }
+        return objdata.railcarts(self.combo_type.currentText(), railcarts, rails)
 
 
 # ===================================================================
@@ -4,6 +4,7 @@ from PyQt6.QtWidgets import (
     QComboBox, QMessageBox
 )
 from editors.base import PlantLineEdit
+from level_core import objdata
 
 
 class SeedBankPropertiesDialog(QDialog):
@@ -70,34 +71,15 @@ class SeedBankPropertiesDialog(QDialog):
     # ============================================================
     def get_data(self):
         """Return objdata for SeedBankProperties."""
-        obj = {}
-
-        if self.exclude_sun_producers.isChecked():
-            obj["ExcludeListSunProducers"] = "true"
-
-        preset_plants = self.preset_list.get_values()
-        exclude_plants = self.exclude_list.get_values()
-        include_plants = self.include_list.get_values()
-
-        if preset_plants:
-            obj["PresetPlantList"] = [
-                {"PlantType": plant, "Level": -1} for plant in preset_plants
-            ]
-        if exclude_plants:
-            obj["PlantExcludeList"] = exclude_plants
-        if include_plants:
-            obj["PlantIncludeList"] = include_plants
-
-        if self.selection_method.currentText():
-            obj["SelectionMethod"] = self.selection_method.currentText()
-
-        if self.suppress_tip.isChecked():
-            obj["SuppressObjectiveTip"] = True
-
-        if self.override_slots.value() > 0:
-            obj["OverrideSeedSlotsCount"] = self.override_slots.value()
-
-        return obj
+        return objdata.seed_bank(
+            preset_plants=self.preset_list.get_values(),
+            exclude_plants=self.exclude_list.get_values(),
+            include_plants=self.include_list.get_values(),
+            selection_method=self.selection_method.currentText(),
+            exclude_sun_producers=self.exclude_sun_producers.isChecked(),
+            suppress_tip=self.suppress_tip.isChecked(),
+            override_slots=self.override_slots.value(),
+        )
 
 
 # ============================================================
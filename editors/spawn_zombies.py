@@ -6,6 +6,8 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt
 from editors.base import ZombieLineEdit
 from data_loader import GameData
+from level_core import objdata
+from level_core.rtid import ZOMBIE_TYPES, format_rtid, strip_rtid
 
 
 class SpawnZombiesJitteredDialog(QDialog):
@@ -96,7 +98,7 @@ class SpawnZombiesJitteredDialog(QDialog):
         chosen_events = data.get("NotificationEvents", [])
         if chosen_events:
             first = chosen_events[0]
-            if first in available_events:
+            if GameData.has_code("Neon Jams", first):
                 self.event_combo.setCurrentText(first)
         else:
             self.event_combo.setCurrentText("None")
@@ -173,38 +175,15 @@ class SpawnZombiesJitteredDialog(QDialog):
 
     # ========================================================
     def get_data(self):
-        zombies = []
-
-        for i in range(self.zombie_list.count()):
-            z = self.parse_desc(self.zombie_list.item(i).text())
-            z_entry = {"Type": z["Type"]}
-
-            if z["Row"] != 0:
-                z_entry["Row"] = z["Row"]
-            if z["Column"] != 0:
-                z_entry["Column"] = z["Column"]
-            if z["CarrySun"] > 0:
-                z_entry["CarrySun"] = z["CarrySun"]
-
-            zombies.append(z_entry)
-
-        result = {"Zombies": zombies}
-
-        if self.additional_pf.value() > 0:
-            result["AdditionalPlantfood"] = self.additional_pf.value()
-
-        dyn = [sp.value() for sp in self.dynamic_pf]
-        if any(val != 0 for val in dyn):
-            result["DynamicPlantfood"] = dyn
-
-        if self.must_kill_all.isChecked():
-            result["MustKillAllToNextWave"] = True
-
+        zombies = [self.parse_desc(self.zombie_list.item(i).text()) for i in range(self.zombie_list.count())]
         ev = self.event_combo.currentText()
-        if ev != "None":
-            result["NotificationEvents"] = [ev]
-
-        return result
+        return objdata.spawn_zombies_jittered(
+            zombies,
+            additional_plantfood=self.additional_pf.value(),
+            dynamic_plantfood=[sp.value() for sp in self.dynamic_pf],
+            must_kill_all=self.must_kill_all.isChecked(),
+            notification_event=ev if ev != "None" else None,
+        )
 
 class OneZombieDialog(QDialog):
     """Dialog to create or edit one zombie entry."""
@@ -217,7 +196,7 @@ class OneZombieDialog(QDialog):
         form = QFormLayout()
 
         self.ztype = ZombieLineEdit()
-        cleaned = data.get("Type", "").replace("RTID(", "").replace("@ZombieTypes)", "")
+        cleaned = strip_rtid(data.get("Type", ""), ZOMBIE_TYPES)
         self.ztype.setText(cleaned)
 
         self.row = QSpinBox(); self.row.setRange(0, 5)
@@ -243,13 +222,7 @@ class OneZombieDialog(QDialog):
         self.setLayout(form)
 
     def get_data(self):
-        z = {
-            "Type": f"RTID({self.ztype.text().strip()}@ZombieTypes)"
-        }
-        if self.row.value() != 0:
-            z["Row"] = self.row.value()
-        if self.col.value() != 0:
-            z["Column"] = self.col.value()
-        if self.carry.value() > 0:
-            z["CarrySun"] = self.carry.value()
-        return z
\ No newline at end of file
+        return objdata.spawn_zombie_entry(
+            format_rtid(self.ztype.text().strip(), ZOMBIE_TYPES),
+            self.row.value(), self.col.value(), self.carry.value()
+        )
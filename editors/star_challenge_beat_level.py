@@ -2,6 +2,7 @@ from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QLabel, QListWidget, QPushButton,
     QDialogButtonBox, QHBoxLayout, QLineEdit, QFormLayout, QMessageBox
 )
+from level_core import objdata
 
 
 class StarChallengeBeatTheLevelDialog(QDialog):
@@ -125,7 +126,7 @@ class StarChallengeBeatTheLevelDialog(QDialog):
             txt = self.multi_list.item(i).text()
             pairs = dict(pair.split(": ", 1) for pair in txt.split(", "))
             multi.append(pairs)
-        return {"Descriptions": descs, "DescriptionsMultiLanguage": multi}
+        return objdata.beat_the_level(descs, multi)
 
 
 class LanguageEntryDialog(QDialog):
@@ -152,9 +153,4 @@ class LanguageEntryDialog(QDialog):
         self.setLayout(layout)
 
     def get_data(self):
-        d = {}
-        if self.en.text().strip():
-            d["en"] = self.en.text().strip()
-        if self.zh.text().strip():
-            d["zh"] = self.zh.text().strip()
-        return d
+        return objdata.language_entry(self.en.text(), self.zh.text())
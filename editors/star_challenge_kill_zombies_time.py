@@ -2,6 +2,7 @@ from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QFormLayout, QSpinBox,
     QDialogButtonBox, QCheckBox
 )
+from level_core import objdata
 
 
 class StarChallengeKillZombiesInTimeDialog(QDialog):
@@ -41,8 +42,4 @@ class StarChallengeKillZombiesInTimeDialog(QDialog):
 
     def get_data(self):
         """Return structured objdata for JSON export."""
-        obj = {
-            "Time": self.time_limit.value(),
-            "ZombiesToKill": self.zombies_to_kill.value()
-        }
-        return obj
\ No newline at end of file
+        return objdata.kill_zombies_in_time(self.time_limit.value(), self.zombies_to_kill.value())
\ No newline at end of file
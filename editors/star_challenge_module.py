@@ -4,6 +4,7 @@ from PyQt6.QtWidgets import (
     QMessageBox
 )
 from editors.base import ReferenceLineEdit, ReferenceValidator
+from level_core import objdata
 
 
 class StarChallengeModuleDialog(QDialog):
@@ -114,13 +115,7 @@ class StarChallengeModuleDialog(QDialog):
                 )
                 raise Exception("Invalid challenge references")
 
-        obj = {
-            "Challenges": challenges
-        }
-        if self.always_available.isChecked():
-            obj["ChallengesAlwaysAvailable"] = True
-
-        return obj
+        return objdata.star_challenge_module(challenges, self.always_available.isChecked())
 
 
 class ChallengeGroupDialog(QDialog):
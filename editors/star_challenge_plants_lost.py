@@ -2,6 +2,7 @@ from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QFormLayout, QSpinBox,
     QDialogButtonBox
 )
+from level_core import objdata
 
 
 class StarChallengePlantsLostDialog(QDialog):
@@ -35,6 +36,4 @@ class StarChallengePlantsLostDialog(QDialog):
 
     def get_data(self):
         """Return structured objdata for JSON export."""
-        return {
-            "MaximumPlantsLost": self.max_lost.value()
-        }
\ No newline at end of file
+        return objdata.plants_lost(self.max_lost.value())
\ No newline at end of file
@@ -2,6 +2,7 @@ from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QFormLayout, QSpinBox,
     QDialogButtonBox
 )
+from level_core import objdata
 
 
 class StarChallengeSimultaneousPlantsDialog(QDialog):
@@ -35,6 +36,4 @@ class StarChallengeSimultaneousPlantsDialog(QDialog):
 
     def get_data(self):
         """Return structured objdata for JSON export."""
-        return {
-            "MaximumPlants": self.max_plants.value()
-        }
\ No newline at end of file
+        return objdata.simultaneous_plants(self.max_plants.value())
\ No newline at end of file
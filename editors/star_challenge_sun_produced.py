@@ -2,6 +2,7 @@ from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QFormLayout, QSpinBox,
     QDialogButtonBox
 )
+from level_core import objdata
 
 
 class StarChallengeSunProducedDialog(QDialog):
@@ -35,6 +36,4 @@ class StarChallengeSunProducedDialog(QDialog):
 
     def get_data(self):
         """Return structured objdata for JSON export."""
-        return {
-            "TargetSun": self.target_sun.value()
-        }
\ No newline at end of file
+        return objdata.sun_produced(self.target_sun.value())
\ No newline at end of file
@@ -2,6 +2,7 @@ from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QFormLayout,
     QSpinBox, QDialogButtonBox
 )
+from level_core import objdata
 
 
 class StarChallengeSunUsedPropsDialog(QDialog):
@@ -39,6 +40,4 @@ class StarChallengeSunUsedPropsDialog(QDialog):
     # --------------------------
     def get_data(self):
         """Return JSON objdata."""
-        return {
-            "MaximumSun": self.max_sun.value()
-        }
\ No newline at end of file
+        return objdata.sun_used(self.max_sun.value())
\ No newline at end of file
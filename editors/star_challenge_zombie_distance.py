@@ -2,6 +2,7 @@ from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QFormLayout, QDoubleSpinBox,
     QDialogButtonBox
 )
+from level_core import objdata
 
 
 class StarChallengeZombieDistanceDialog(QDialog):
@@ -37,6 +38,4 @@ class StarChallengeZombieDistanceDialog(QDialog):
 
     def get_data(self):
         """Return structured objdata for JSON export."""
-        return {
-            "TargetDistance": round(self.target_distance.value(), 2)
-        }
\ No newline at end of file
+        return objdata.zombie_distance(self.target_distance.value())
\ No newline at end of file
@@ -3,6 +3,7 @@ from PyQt6.QtWidgets import (
     QLabel, QPushButton, QListWidget, QComboBox,
     QDoubleSpinBox
 )
+from level_core import objdata
 
 # Hardcoded list of trap tile groups (expandable later)
 TRAP_GROUPS = [
@@ -88,7 +89,7 @@ class TrapTilePropertiesEditor(QDialog):
     # -------------------------------------------------------------
 
     def get_data(self):
-        return {"TrapTiles": self.placements}
+        return objdata.trap_tiles(self.placements)
 
 class TrapTileEntryDialog(QDialog):
     def __init__(self, parent=None, existing=None):
@@ -147,11 +148,7 @@ class TrapTileEntryDialog(QDialog):
     # -------------------------------------------------
 
     def get_data(self):
-        return {
-            "Group": self.input_group.currentText(),
-            "Location": {
-                "mX": int(self.input_mX.currentText()),
-                "mY": int(self.input_mY.currentText())
-            },
-            "RecoverDelay": float(self.input_delay.value())
-        }
\ No newline at end of file
+        return objdata.trap_tile(
+            self.input_group.currentText(), self.input_mX.currentText(), self.input_mY.currentText(),
+            self.input_delay.value()
+        )
\ No newline at end of file
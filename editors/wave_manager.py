@@ -1,6 +1,6 @@
-from math import ceil
 from PyQt6.QtWidgets import *
 from editors.base import ReferenceValidator, ReferenceLineEdit
+from level_core import objdata
 
 
 class WaveManagerDialog(QDialog):
@@ -176,45 +176,25 @@ class WaveManagerDialog(QDialog):
                 )
                 raise Exception("Invalid references in Waves")
 
-        # Parse overrides
-        overrides = []
-        for val in self.flag_override.text().split(","):
-            val = val.strip()
-            if val.isdigit():
-                overrides.append(int(val))
-
-        # Validate override length
-        required = ceil(self.wave_count.value() / self.flag_wave_interval.value())
-        if len(overrides) not in (0, required):
+        try:
+            return objdata.wave_manager(
+                self.flag_wave_interval.value(),
+                self.wave_count.value(),
+                waves,
+                overrides=objdata.parse_int_list(self.flag_override.text()),
+                max_next_wave_health=self.max_next_hp.value(),
+                min_next_wave_health=self.min_next_hp.value(),
+                wave_spending_point_increment=self.wave_points_inc.value(),
+                wave_spending_points=self.wave_points.value(),
+            )
+        except objdata.ObjdataError as e:
             QMessageBox.warning(
                 self,
                 "Invalid FlagWaveVeteranOverrideTypes",
-                f"The number of override types must equal ceil(WaveCount / FlagWaveInterval).\n"
-                f"Expected: {required}, got: {len(overrides)}\n\n"
-                "Please correct the input before proceeding."
+                f"{e}\n\nPlease correct the input before proceeding."
             )
             return None
 
-        data = {
-            "FlagWaveInterval": self.flag_wave_interval.value(),
-            "WaveCount": self.wave_count.value(),
-            "Waves": waves
-        }
-        if overrides:
-            data["FlagWaveVeteranOverrideTypes"] = overrides
-
-        # Optional values — chỉ thêm khi khác 0
-        if self.max_next_hp.value() > 0:
-            data["MaxNextWaveHealthPercentage"] = round(self.max_next_hp.value(), 3)
-        if self.min_next_hp.value() > 0:
-            data["MinNextWaveHealthPercentage"] = round(self.min_next_hp.value(), 3)
-        if self.wave_points_inc.value() > 0:
-            data["WaveSpendingPointIncrement"] = self.wave_points_inc.value()
-        if self.wave_points.value() > 0:
-            data["WaveSpendingPoints"] = self.wave_points.value()
-
-        return data
-
 
 class WaveArrayDialog(QDialog):
     """Dialog for editing one wave (list of RTIDs)."""
@@ -1,5 +1,7 @@
 from PyQt6.QtWidgets import *
 from editors.base import ReferenceLineEdit, ReferenceValidator, ObjectEditorFactory, ZombieLineEdit
+from level_core import objdata
+from level_core.rtid import ZOMBIE_TYPES, format_rtid
 
 class WaveManagerModuleDialog(QDialog):
     """Dialog for editing WaveManagerModuleProperties."""
@@ -74,7 +76,7 @@ class WaveManagerModuleDialog(QDialog):
                                  "Please ensure the referenced object exists in Added Objects.")
             raise Exception("Invalid reference")
 
-        return {"DynamicZombies": self.dynamic_sets, "WaveManagerProps": ref}
+        return objdata.wave_manager_module(ref, self.dynamic_sets)
 
 
 class DynamicZombiesDialog(QDialog):
@@ -224,7 +226,7 @@ class OneDynamicZombieDialog(QDialog):
         if dlg.exec() == dlg.DialogCode.Accepted:
             text = line.text().strip()
             if text:
-                self.zombie_list.addItem(f"RTID({text}@ZombieTypes)")
+                self.zombie_list.addItem(format_rtid(text, ZOMBIE_TYPES))
 
     def remove_zombie(self):
         for item in self.zombie_list.selectedItems():
@@ -232,9 +234,6 @@ class OneDynamicZombieDialog(QDialog):
 
     def get_data(self):
         zombies = [self.zombie_list.item(i).text() for i in range(self.zombie_list.count())]
-        return {
-            "PointIncrementPerWave": self.point_inc.value(),
-            "StartingPoints": self.start_points.value(),
-            "StartingWave": self.start_wave.value(),
-            "ZombiePool": zombies
-        }
\ No newline at end of file
+        return objdata.dynamic_zombie(
+            self.point_inc.value(), self.start_points.value(), self.start_wave.value(), zombies
+        )
\ No newline at end of file
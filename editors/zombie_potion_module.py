@@ -3,6 +3,7 @@ from PyQt6.QtWidgets import (
     QDialogButtonBox, QHBoxLayout, QLabel, QListWidget, QListWidgetItem, QCheckBox
 )
 from PyQt6.QtCore import Qt
+from level_core import objdata
 
 
 class ZombiePotionModuleDialog(QDialog):
@@ -88,17 +89,8 @@ class ZombiePotionModuleDialog(QDialog):
             if item.checkState() == Qt.CheckState.Checked:
                 selected_potions.append(self.POTION_TYPES[item.text()])
         
-        obj = {
-            "InitialPotionCount": self.initial_count.value(),
-            "MaxPotionCount": self.max_count.value(),
-            "PotionSpawnTimer": {
-                "Min": round(self.timer_min.value(), 2),
-                "Max": round(self.timer_max.value(), 2)
-            },
-            "PotionTypes": selected_potions
-        }
-
-        if self.suppress_tip.isChecked():
-            obj["SuppressObjectiveTip"] = True
-
-        return obj
\ No newline at end of file
+        return objdata.zombie_potions(
+            self.initial_count.value(), self.max_count.value(),
+            self.timer_min.value(), self.timer_max.value(),
+            selected_potions, self.suppress_tip.isChecked()
+        )
\ No newline at end of file
@@ -12,6 +12,7 @@ main_script = "main.py"
 base_path = os.path.abspath(".")
 data_files = [
     (os.path.join(base_path, "game_data.json"), "."),
+    (os.path.join(base_path, "LevelModules.json"), "."),
 ]
 
 # Include folders (editors, ui, etc.)
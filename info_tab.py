@@ -4,6 +4,7 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QFormLayout,
     QLineEdit, QTextEdit, QComboBox, QPushButton, QLabel, QMessageBox
 )
+from level_core.level import CATEGORIES, DIFFICULTIES, build_information
 
 
 class InfoTab(QWidget):
@@ -26,8 +27,8 @@ class InfoTab(QWidget):
         self.category = QComboBox()
 
         # Populate combo boxes
-        self.difficulty.addItems(["Easy", "Normal", "Hard", "Extreme"])
-        self.category.addItems(["Adventure", "Survival", "Challenge", "MiniGame"])
+        self.difficulty.addItems(DIFFICULTIES)
+        self.category.addItems(CATEGORIES)
 
         # Add to form layout
         form_layout.addRow("Author:", self.author)
@@ -44,6 +45,17 @@ class InfoTab(QWidget):
         self.setLayout(main_layout)
 
 
+    def get_data(self):
+        return build_information(
+            self.author.text(),
+            self.introduction.toPlainText(),
+            self.version.text(),
+            self.created_at.text(),
+            self.updated_at.text(),
+            self.difficulty.currentText(),
+            self.category.currentText(),
+        )
+
     def load_from_json(self, info):
         self.author.setText(info.get("Author", ""))
         self.introduction.setPlainText(info.get("Introduction", ""))
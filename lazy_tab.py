@@ -0,0 +1,38 @@
+from PyQt6.QtWidgets import QWidget, QVBoxLayout
+
+
+class LazyTab(QWidget):
+    """Tab page that builds its real widget on first activation or first data access.
+
+    Level data loaded before that is kept and applied when the widget materializes.
+    """
+    def __init__(self, factory, parent=None):
+        super().__init__(parent)
+        self._factory = factory
+        self._widget = None
+        self._pending = None  # last load_from_json() payload not yet applied
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+    def is_built(self):
+        return self._widget is not None
+
+    def widget(self):
+        """Return the real tab widget, building it (and applying pending data) if needed."""
+        if self._widget is None:
+            self._widget = self._factory()
+            self.layout().addWidget(self._widget)
+            if self._pending is not None:
+                data, self._pending = self._pending, None
+                self._widget.load_from_json(data)
+        return self._widget
+
+    def load_from_json(self, data):
+        if self._widget is None:
+            self._pending = data
+        else:
+            self._widget.load_from_json(data)
+
+    def pending_data(self):
+        return self._pending
@@ -0,0 +1,8 @@
+"""Qt-free level data logic shared by the editor widgets and headless tooling.
+
+Nothing in this package imports PyQt6, so batch scripts can use it without a
+QApplication. Import the submodules directly, e.g.::
+
+    from level_core.aliases import extract_child_aliases
+    from level_core.level import assemble_level
+"""
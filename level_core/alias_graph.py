@@ -0,0 +1,214 @@
+import os
+
+from level_core.aliases import build_alias_tree, extract_child_aliases
+
+# Set LEVEL_CORE_DEBUG_GRAPH=1 to check every incremental update against a full rebuild
+DEBUG = os.environ.get("LEVEL_CORE_DEBUG_GRAPH", "") not in ("", "0")
+
+
+class AliasGraphMismatch(AssertionError):
+    pass
+
+
+class AliasGraph:
+    """Incrementally maintained @CurrentLevel reference graph of a LevelDocument.
+
+    Edges are stored per object, so after an edit only the touched object's
+    objdata is re-scanned (update/remove); nothing else is walked. The graph
+    follows the document's change notifications by itself. Reordering
+    objects does not change the graph. A reverse index (alias -> referencing
+    aliases with reference counts) answers where-used and root queries
+    without scanning. Edges are only between aliases, so the objects
+    referencing each alias are also indexed by identity: those without an
+    alias of their own are still found (referring_objects).
+
+    take_changed() drains the aliases whose incoming edges or existence
+    changed, which is what graph_analysis.GraphReport.update() needs.
+
+    In debug mode every update is compared with build_alias_tree() over the
+    whole document and AliasGraphMismatch is raised on any difference.
+    """
+
+    def __init__(self, document, debug=None):
+        self.document = document
+        self.debug = DEBUG if debug is None else debug
+        self._edges = {}  # id(obj) -> (aliases, child aliases) as last seen
+        self._out = {}    # alias -> {child alias: number of owners referencing it}
+        self._in = {}     # child alias -> {referencing alias: reference count}
+        self._sources = {}  # child alias -> {id(obj): obj} of every object referencing it
+        self._changed = set()  # see take_changed()
+        self.reset()
+        document.subscribe(self._on_document_changed)
+
+    # --------------------------------------------------------
+    def _add(self, obj, aliases, children):
+        key = id(obj)
+        self._edges[key] = (aliases, children)
+        for child in children:
+            self._sources.setdefault(child, {})[key] = obj
+        for alias in aliases:
+            out = self._out.setdefault(alias, {})
+            for child in children:
+                out[child] = out.get(child, 0) + 1
+                refs = self._in.setdefault(child, {})
+                refs[alias] = refs.get(alias, 0) + 1
+
+    def _discard(self, key):
+        aliases, children = self._edges.pop(key, ((), ()))
+        for child in children:
+            sources = self._sources.get(child)
+            if sources is not None:
+                sources.pop(key, None)
+                if not sources:
+                    del self._sources[child]
+        for alias in aliases:
+            out = self._out.get(alias)
+            if out is None:
+                continue
+            for child in children:
+                n = out.get(child, 0) - 1
+                if n > 0:
+                    out[child] = n
+                else:
+                    out.pop(child, None)
+                refs = self._in.get(child)
+                if refs is not None:
+                    n = refs.get(alias, 0) - 1
+                    if n > 0:
+                        refs[alias] = n
+                    else:
+                        refs.pop(alias, None)
+                        if not refs:
+                            del self._in[child]
+            if not out and not self._alias_still_owned(alias):
+                del self._out[alias]
+
+    def _alias_still_owned(self, alias):
+        return self.document.has_alias(alias)
+
+    def _rescan(self, obj):
+        key = id(obj)
+        old_aliases, old_children = self._edges.get(key, ((), ()))
+        aliases, children = tuple(obj.get("aliases", [])), tuple(extract_child_aliases(obj))
+        self._discard(key)
+        self._add(obj, aliases, children)
+        self._note(old_aliases, old_children, aliases, children)
+        # re-indexing can change which owner of a shared alias comes first
+        self._changed.update(a for a in aliases if len(self.document.objects_with_alias(a)) > 1)
+
+    def _drop(self, key):
+        old_aliases, old_children = self._edges.get(key, ((), ()))
+        self._discard(key)
+        self._note(old_aliases, old_children, (), ())
+
+    def _note(self, old_aliases, old_children, aliases, children):
+        # an edge appeared or went away: its child; other owners: every alias and child
+        if set(old_aliases) == set(aliases):
+            if aliases:
+                self._changed.update(set(old_children).symmetric_difference(children))
+            return
+        self._changed.update(old_aliases)
+        self._changed.update(aliases)
+        self._changed.update(old_children)
+        self._changed.update(children)
+
+    # --------------------------------------------------------
+    def reset(self):
+        """Full rebuild from the document (after loading a level)."""
+        self._edges = {}
+        self._out = {}
+        self._in = {}
+        self._sources = {}
+        self._changed = set()
+        for obj in self.document:
+            self._add(obj, tuple(obj.get("aliases", [])), tuple(extract_child_aliases(obj)))
+        self._check()
+
+    def _on_document_changed(self, change):
+        if change.reset:
+            self.reset()
+            return
+        for obj in change.removed:
+            if obj not in self.document:
+                self._drop(id(obj))
+        seen = set()
+        for obj in change.added + change.updated:
+            if id(obj) not in seen and obj in self.document:
+                seen.add(id(obj))
+                self._rescan(obj)
+        self._check()
+
+    def update(self, obj):
+        """Re-scan one added or edited object and patch its edges."""
+        self._rescan(obj)
+        self._check()
+
+    def remove(self, obj):
+        """Drop the edges of an object that left the document."""
+        self._drop(id(obj))
+        self._check()
+
+    def take_changed(self):
+        """Aliases whose owners or referrers changed since the last call (or reset)."""
+        changed, self._changed = self._changed, set()
+        return changed
+
+    # --------------------------------------------------------
+    def children(self, alias):
+        return list(self._out.get(alias, ()))
+
+    def referrers(self, alias):
+        """Aliases whose objects reference alias (the where-used answer)."""
+        return list(self._in.get(alias, ()))
+
+    def referring_objects(self, alias):
+        """Objects whose objdata references alias, with or without aliases themselves."""
+        return list(self._sources.get(alias, {}).values())
+
+    def in_degree(self, alias):
+        """Number of distinct aliases referencing alias."""
+        return len(self._in.get(alias, ()))
+
+    def reference_count(self, alias):
+        """Number of references to alias, counting every owner of every referencing alias."""
+        return sum(self._in.get(alias, {}).values())
+
+    def root_aliases(self):
+        """Aliases nothing references (zero in-degree), in document order."""
+        return [
+            alias for obj in self.document for alias in obj.get("aliases", [])
+            if alias not in self._in
+        ]
+
+    def tree(self):
+        """alias -> list of child aliases (same shape as build_alias_tree)."""
+        return {alias: list(out) for alias, out in self._out.items()}
+
+    def verify(self):
+        """Aliases whose children differ from a full rebuild (empty when consistent)."""
+        expected = {a: set(c) for a, c in build_alias_tree(self.document).items()}
+        actual = {a: set(c) for a, c in self._out.items()}
+        bad = {a for a in expected.keys() | actual.keys() if expected.get(a) != actual.get(a)}
+
+        expected_in = {}
+        for parent, children in expected.items():
+            for child in children:
+                expected_in.setdefault(child, set()).add(parent)
+        actual_in = {c: set(refs) for c, refs in self._in.items()}
+        bad.update(c for c in expected_in.keys() | actual_in.keys() if expected_in.get(c) != actual_in.get(c))
+
+        expected_sources = {}
+        for obj in self.document:
+            for child in extract_child_aliases(obj):
+                expected_sources.setdefault(child, set()).add(id(obj))
+        actual_sources = {c: set(objs) for c, objs in self._sources.items()}
+        bad.update(c for c in expected_sources.keys() | actual_sources.keys()
+                   if expected_sources.get(c) != actual_sources.get(c))
+        return sorted(bad)
+
+    def _check(self):
+        if not self.debug:
+            return
+        bad = self.verify()
+        if bad:
+            raise AliasGraphMismatch(f"alias graph out of sync for: {', '.join(bad[:20])}")
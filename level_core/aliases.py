@@ -0,0 +1,211 @@
+import re
+
+from level_core.rtid import CURRENT_LEVEL, rtid_name
+
+_WAVE_RE = re.compile(r"^Wave(\d+)$", re.IGNORECASE)
+_SUFFIX_RE = re.compile(r"^(.*?)(\d+)$")
+
+
+def parse_alias_list(text):
+    """"A, B ,C" -> ["A", "B", "C"] (empty entries dropped)."""
+    return [a.strip() for a in text.split(",") if a.strip()]
+
+
+def all_aliases(objects):
+    aliases = set()
+    for o in objects:
+        aliases.update(o.get("aliases", []))
+    return aliases
+
+
+def next_wave_alias(existing):
+    """Wave{N+1} for the highest WaveN in existing (case-insensitive)."""
+    max_n = 0
+    for a in existing:
+        m = _WAVE_RE.match(a)
+        if m:
+            max_n = max(max_n, int(m.group(1)))
+    return f"Wave{max_n + 1}"
+
+
+def unique_alias(base, existing):
+    """base if unused, else base1, base2, ... (first free)."""
+    if base not in existing:
+        return base
+    i = 1
+    while True:
+        candidate = f"{base}{i}"
+        if candidate not in existing:
+            return candidate
+        i += 1
+
+
+def split_suffix(alias):
+    """"Wave12" -> ("Wave", 12); ("Seed", None) when there is no numeric suffix."""
+    m = _SUFFIX_RE.match(alias)
+    if m is None:
+        return alias, None
+    return m.group(1), int(m.group(2))
+
+
+class AliasAllocator:
+    """Hands out fresh aliases from the highest numeric suffix seen per prefix.
+
+    Kept up to date alias by alias (add / discard), so allocating never scans
+    the level: next("Wave") is Wave{highest + 1}, and n names cost O(n).
+    Prefixes are compared case-insensitively, like next_wave_alias.
+    exists(alias) is the authority on which aliases are taken.
+    """
+
+    def __init__(self, exists):
+        self._exists = exists
+        self._suffixes = {}  # prefix.lower() -> {suffix: number of aliases}
+        self._max = {}       # prefix.lower() -> highest suffix
+
+    def clear(self):
+        self._suffixes = {}
+        self._max = {}
+
+    def add(self, alias):
+        prefix, n = split_suffix(alias)
+        if n is None:
+            return
+        key = prefix.lower()
+        counts = self._suffixes.setdefault(key, {})
+        counts[n] = counts.get(n, 0) + 1
+        if n >= self._max.get(key, 0):
+            self._max[key] = n  # set for suffix 0 too: discard() expects it
+
+    def discard(self, alias):
+        prefix, n = split_suffix(alias)
+        key = prefix.lower()
+        counts = self._suffixes.get(key)
+        if n is None or counts is None or n not in counts:
+            return
+        counts[n] -= 1
+        if counts[n]:
+            return
+        del counts[n]
+        if not counts:
+            del self._suffixes[key]
+            del self._max[key]
+        elif n == self._max[key]:
+            self._max[key] = max(counts)
+
+    def highest(self, prefix):
+        return self._max.get(prefix.lower(), 0)
+
+    def next(self, prefix, n=1, taken=()):
+        """n unused aliases prefix{highest + 1}, prefix{highest + 2}, ... (skipping taken)."""
+        result = []
+        i = self.highest(prefix)
+        while len(result) < n:
+            i += 1
+            candidate = f"{prefix}{i}"
+            if not self._exists(candidate) and candidate not in taken:
+                result.append(candidate)
+        return result
+
+    def allocate(self, base, n=1, taken=()):
+        """n unused aliases for base: base itself if free, then base's prefix numbered on."""
+        result = []
+        if not self._exists(base) and base not in taken:
+            result.append(base)
+        if len(result) < n:
+            prefix, _ = split_suffix(base)
+            result.extend(self.next(prefix, n - len(result), taken))
+        return result
+
+
+def alias_base_for_class(cls_name):
+    """Default alias stem for an objclass, e.g. SeedBankProperties -> SeedBank."""
+    # Generic: strip trailing 'Properties' (case-insensitive)
+    if cls_name.lower().endswith("challengeproperties"):
+        base = cls_name[: -len("challengeproperties")]
+    elif cls_name.lower().endswith("props"):
+        base = cls_name[: -len("props")]
+    elif cls_name.lower().endswith("properties"):
+        base = cls_name[: -len("properties")]
+    else:
+        base = cls_name
+
+    if base.lower().startswith("starchallenge"):
+        base = base[len("StarChallenge"):]
+    return base or "Object"
+
+
+def derive_alias_from_class(cls_name, existing):
+    # Special case
+    if cls_name == "SpawnZombiesJitteredWaveActionProps":
+        return next_wave_alias(existing)
+    return unique_alias(alias_base_for_class(cls_name), existing)
+
+
+# --------------------- REFERENCE EXTRACTION ---------------------
+def _current_level_alias(value):
+    return rtid_name(value, CURRENT_LEVEL)
+
+
+def extract_child_aliases(obj):
+    """Aliases this object references through RTID(xxx@CurrentLevel), without duplicates."""
+    child_aliases = {}  # dict as an ordered set
+
+    def add(name):
+        if name is not None:
+            child_aliases[name] = None
+
+    def walk(node):
+        if isinstance(node, dict):
+            for v in node.values():
+                walk(v)
+        elif isinstance(node, list):
+            for v in node:
+                walk(v)
+        elif isinstance(node, str):
+            add(_current_level_alias(node))
+
+    # Special handling for StarChallengeModuleProperties: Challenges can be list[list[str]] or list[str]
+    if obj.get("objclass") == "StarChallengeModuleProperties":
+        challenges = obj.get("objdata", {}).get("Challenges", [])
+        if isinstance(challenges, list):
+            for group in challenges:
+                if isinstance(group, list):
+                    for ref in group:
+                        if isinstance(ref, str):
+                            add(_current_level_alias(ref))
+                elif isinstance(group, str):
+                    add(_current_level_alias(group))
+    else:
+        walk(obj.get("objdata", {}))
+
+    return list(child_aliases)
+
+
+def build_alias_tree(objects):
+    """alias -> list of child aliases, for every object.
+
+    An alias carried by several objects gets the union of their children.
+    """
+    tree = {}
+    for obj in objects:
+        child_aliases = extract_child_aliases(obj)
+        for parent_alias in obj.get("aliases", []):
+            if parent_alias in tree:
+                tree[parent_alias] = list(dict.fromkeys(tree[parent_alias] + child_aliases))
+            else:
+                tree[parent_alias] = child_aliases
+    return tree
+
+
+def root_aliases(objects, alias_tree):
+    """Aliases (in object order) that no object references as a child."""
+    all_children = set()
+    for childs in alias_tree.values():
+        all_children.update(childs)
+
+    roots = []
+    for obj in objects:
+        for alias in obj.get("aliases", []):
+            if alias not in all_children:
+                roots.append(alias)
+    return roots
@@ -0,0 +1,92 @@
+import weakref
+
+
+class DocumentChange:
+    """What one LevelDocument mutation (or one batch of them) did.
+
+    added / removed / updated   objects, by identity
+    aliases_added / _removed    objclass -> set of aliases that appeared in /
+                                disappeared from that objclass
+    moved                       objects were reordered
+    reset                       everything was replaced; other fields are empty
+    """
+    __slots__ = ("added", "removed", "updated", "aliases_added", "aliases_removed", "moved", "reset")
+
+    def __init__(self, reset=False):
+        self.added = []
+        self.removed = []
+        self.updated = []
+        self.aliases_added = {}
+        self.aliases_removed = {}
+        self.moved = False
+        self.reset = reset
+
+    def objclasses(self):
+        """objclasses whose alias set changed."""
+        return self.aliases_added.keys() | self.aliases_removed.keys()
+
+    def is_empty(self):
+        return not (self.added or self.removed or self.updated or self.aliases_added
+                    or self.aliases_removed or self.moved or self.reset)
+
+    def merge(self, other):
+        if other.reset:
+            self.__init__(reset=True)
+            return
+        if self.reset:
+            return
+        self.added.extend(other.added)
+        self.removed.extend(other.removed)
+        self.updated.extend(other.updated)
+        for mine, theirs in ((self.aliases_added, other.aliases_added),
+                             (self.aliases_removed, other.aliases_removed)):
+            for objclass, aliases in theirs.items():
+                mine.setdefault(objclass, set()).update(aliases)
+        self.moved = self.moved or other.moved
+
+
+class ChangeBus:
+    """Delivers DocumentChange objects to subscribers held by weak reference.
+
+    Bound methods are held through WeakMethod, so a subscribed widget or
+    dialog does not stay alive just because the document does.
+    """
+
+    def __init__(self):
+        self._subscribers = []   # weak references to callables
+        self._depth = 0
+        self._pending = None
+
+    def subscribe(self, callback):
+        if hasattr(callback, "__self__"):
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = weakref.ref(callback)
+        self._subscribers.append(ref)
+
+    def unsubscribe(self, callback):
+        self._subscribers = [r for r in self._subscribers if r() not in (None, callback)]
+
+    def publish(self, change):
+        if self._depth:
+            self._pending.merge(change)
+            return
+        if change.is_empty():
+            return
+        for ref in list(self._subscribers):
+            callback = ref()
+            if callback is not None:
+                callback(change)
+        self._subscribers = [r for r in self._subscribers if r() is not None]
+
+    # --------------------------------------------------------
+    def begin(self):
+        if self._depth == 0:
+            self._pending = DocumentChange()
+        self._depth += 1
+
+    def end(self):
+        self._depth -= 1
+        if self._depth == 0:
+            change, self._pending = self._pending, None
+            self.publish(change)
@@ -0,0 +1,112 @@
+import json
+import uuid
+
+from level_core.aliases import split_suffix
+from level_core.references import remap_references
+
+FORMAT = "ge-editor-objects/1"
+
+
+def snapshot(obj):
+    """Copy-on-write snapshot of a document object: a new top-level dict, shared objdata.
+
+    LevelDocument replaces objdata and alias lists instead of editing them in
+    place, so the snapshot stays valid while the source level keeps changing.
+    """
+    return {k: v for k, v in obj.items()}
+
+
+def dependency_closure(document, graph, objects):
+    """objects plus everything they reach through @CurrentLevel references, in document order."""
+    picked = {id(obj) for obj in objects}
+    pending = [a for obj in objects for a in obj.get("aliases", [])]
+    seen = set(pending)
+    while pending:
+        for child in graph.children(pending.pop()):
+            if child in seen:
+                continue
+            seen.add(child)
+            owner = document.get(child)
+            if owner is not None and id(owner) not in picked:
+                picked.add(id(owner))
+                pending.extend(owner.get("aliases", []))
+    return [obj for obj in document if id(obj) in picked]
+
+
+class ObjectClipboard:
+    """Process-wide clipboard of object snapshots (shared by every open level).
+
+    The same objects are also offered as JSON (to_json) for the system
+    clipboard, so a level in another editor process can paste them; a
+    payload whose token matches the in-process one is taken from memory.
+    """
+
+    def __init__(self):
+        self.objects = []
+        self.token = None
+
+    def set(self, objects):
+        self.objects = [snapshot(obj) for obj in objects]
+        self.token = uuid.uuid4().hex
+
+    def is_empty(self):
+        return not self.objects
+
+    def to_json(self):
+        return json.dumps({"format": FORMAT, "token": self.token, "objects": self.objects})
+
+    def load_json(self, text):
+        """Take over a payload from the system clipboard; False if it is not ours."""
+        try:
+            payload = json.loads(text)
+        except ValueError:
+            return False
+        if not isinstance(payload, dict) or payload.get("format") != FORMAT:
+            return False
+        if payload.get("token") != self.token:
+            self.objects = [obj for obj in payload.get("objects", []) if isinstance(obj, dict)]
+            self.token = payload.get("token")
+        return True
+
+
+# one clipboard per process, whichever ObjectsTab copies into it
+CLIPBOARD = ObjectClipboard()
+
+
+def paste_plan(objects, document, rename=True, fallback="PastedObject"):
+    """New objects for pasting objects into document.
+
+    Returns (new objects, {old alias: new alias}). With rename, aliases that
+    collide with the document's (or with each other) are renumbered by the
+    document's alias allocator, one allocation per prefix, and references
+    between the pasted objects follow the renaming; references to anything
+    outside them are left alone. Objects without an alias get fallback.
+    Unchanged objdata subtrees are shared with the clipboard.
+    """
+    planned = [(obj, list(obj.get("aliases") or ([fallback] if rename else []))) for obj in objects]
+    renamed = {}
+    if rename:
+        kept = set()
+        colliding = {}  # prefix -> [(new alias list, position)] to renumber, in paste order
+        for _, new_aliases in planned:
+            for i, alias in enumerate(new_aliases):
+                if document.has_alias(alias) or alias in kept:
+                    colliding.setdefault(split_suffix(alias)[0], []).append((new_aliases, i))
+                else:
+                    kept.add(alias)
+        for prefix, slots in colliding.items():
+            for (new_aliases, i), new in zip(slots, document.allocator.next(prefix, len(slots), kept)):
+                if new_aliases[i] not in kept:  # a duplicate inside the paste keeps its references
+                    renamed.setdefault(new_aliases[i], new)
+                new_aliases[i] = new
+                kept.add(new)
+
+    result = []
+    for obj, new_aliases in planned:
+        new_obj = snapshot(obj)
+        if new_aliases:
+            new_obj["aliases"] = new_aliases
+        if renamed and "objdata" in obj:
+            new_obj["objdata"] = remap_references(obj["objdata"], renamed)
+        result.append(new_obj)
+    return result, renamed
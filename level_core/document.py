@@ -0,0 +1,351 @@
+from contextlib import contextmanager
+
+from level_core.aliases import AliasAllocator, alias_base_for_class
+from level_core.changes import ChangeBus, DocumentChange
+
+
+class LevelDocument:
+    """The level's objects (everything but LevelDefinition) plus lookup indexes.
+
+    Indexes (alias -> objects, objclass -> objects) are patched on every
+    mutation, so alias lookups and uniqueness checks are O(1) however large the
+    level is. Objects are keyed by identity; change an object's aliases or
+    objclass only through this class. objdata is immutable: the clipboard and
+    the undo history share it, so build a new value and hand it to
+    set_objdata() instead of editing it in place.
+
+    The document is a read-only sequence of object dicts (len, iteration,
+    indexing), so code written for a plain list of objects keeps working.
+
+    Every object also gets a uid, stable for as long as it stays in the
+    document (replace() hands it to the new object), for views and drag&drop.
+
+    Each mutation publishes a DocumentChange to subscribe()d callbacks; wrap
+    several mutations in `with document.batch():` to publish one merged change.
+
+    A journal (see level_core.history) is told about every mutation together
+    with its inverse, which is what undo/redo replays.
+    """
+
+    def __init__(self, objects=()):
+        self._objects = []
+        self._by_alias = {}   # alias -> {id(obj): obj}, usually one entry
+        self._by_class = {}   # objclass -> {id(obj): obj}, in insertion order
+        self._uids = {}       # id(obj) -> uid
+        self._next_uid = 1
+        self.allocator = AliasAllocator(self.has_alias)  # per-prefix suffix counters
+        self._bus = ChangeBus()
+        self._journal = None
+        self._positions = None  # id(obj) -> index, rebuilt lazily after structural changes
+        self.reset(objects)
+
+    # ---------------------- sequence ----------------------
+    def __len__(self):
+        return len(self._objects)
+
+    def __iter__(self):
+        return iter(self._objects)
+
+    def __getitem__(self, index):
+        return self._objects[index]
+
+    def __contains__(self, obj):
+        """Identity membership, O(1)."""
+        return id(obj) in self._uids
+
+    @property
+    def objects(self):
+        """The underlying list (do not mutate it directly)."""
+        return self._objects
+
+    def uid(self, obj):
+        return self._uids[id(obj)]
+
+    def uid_at(self, index):
+        return self._uids[id(self._objects[index])]
+
+    def index_of_uid(self, uid):
+        """Position of the object with uid; None once it has left the document.
+
+        uids are never reused, not even across reset(), so a uid kept while a
+        dialog was open cannot pick up some other object.
+        """
+        for index, obj in enumerate(self._objects):
+            if self._uids[id(obj)] == uid:
+                return index
+        return None
+
+    def index_of(self, obj):
+        """Position of obj; O(1) until the next insert/remove/move."""
+        if self._positions is None:
+            self._positions = {id(o): i for i, o in enumerate(self._objects)}
+        try:
+            return self._positions[id(obj)]
+        except KeyError:
+            raise ValueError("object is not in this document") from None
+
+    def objects_with_alias(self, alias):
+        """Every object carrying alias (normally at most one)."""
+        return list(self._by_alias.get(alias, {}).values())
+
+    # ---------------------- notifications ----------------------
+    def subscribe(self, callback):
+        """Call callback(DocumentChange) after every mutation (held weakly)."""
+        self._bus.subscribe(callback)
+
+    def unsubscribe(self, callback):
+        self._bus.unsubscribe(callback)
+
+    @contextmanager
+    def batch(self):
+        self._bus.begin()
+        try:
+            yield
+        finally:
+            self._bus.end()
+
+    def set_journal(self, journal):
+        """journal(op, inverse, retained) is called for each mutation; ops are (method, args)."""
+        self._journal = journal
+
+    def _log(self, op, inverse, retained=()):
+        if self._journal is not None:
+            self._journal(op, inverse, retained)
+
+    def _alias_left_class(self, alias, objclass):
+        owners = self._by_alias.get(alias, {})
+        return all(o.get("objclass", "") != objclass for o in owners.values())
+
+    def _publish(self, added=(), removed=(), updated=(), alias_changes=(), moved=False):
+        """alias_changes: (objclass, aliases before, aliases after) per touched object."""
+        change = DocumentChange()
+        change.added.extend(added)
+        change.removed.extend(removed)
+        change.updated.extend(updated)
+        change.moved = moved
+        for objclass, before, after in alias_changes:
+            gone = {a for a in before if a not in after and self._alias_left_class(a, objclass)}
+            new = set(after) - set(before)
+            if gone:
+                change.aliases_removed.setdefault(objclass, set()).update(gone)
+            if new:
+                change.aliases_added.setdefault(objclass, set()).update(new)
+        self._bus.publish(change)
+
+    @staticmethod
+    def _aliases_of(obj):
+        return obj.get("objclass", ""), obj.get("aliases", [])
+
+    # ---------------------- indexing ----------------------
+    def _index(self, obj, uid=None):
+        key = id(obj)
+        if uid is None:
+            uid, self._next_uid = self._next_uid, self._next_uid + 1
+        self._uids[key] = uid
+        for alias in obj.get("aliases", []):
+            owners = self._by_alias.get(alias)
+            if owners is None:
+                owners = self._by_alias[alias] = {}
+                self.allocator.add(alias)
+            owners[key] = obj
+        self._by_class.setdefault(obj.get("objclass", ""), {})[key] = obj
+
+    def _unindex(self, obj):
+        key = id(obj)
+        uid = self._uids.pop(key, None)
+        for alias in obj.get("aliases", []):
+            owners = self._by_alias.get(alias)
+            if owners is not None:
+                owners.pop(key, None)
+                if not owners:
+                    del self._by_alias[alias]
+                    self.allocator.discard(alias)
+        owners = self._by_class.get(obj.get("objclass", ""))
+        if owners is not None:
+            owners.pop(key, None)
+            if not owners:
+                del self._by_class[obj.get("objclass", "")]
+        return uid
+
+    # ---------------------- mutations ----------------------
+    def reset(self, objects=()):
+        """Replace every object (e.g. after loading a file)."""
+        self._objects = list(objects)
+        self._positions = None
+        self._by_alias = {}
+        self._by_class = {}
+        self._uids = {}
+        self.allocator.clear()
+        for obj in self._objects:
+            self._index(obj)
+        self._bus.publish(DocumentChange(reset=True))
+
+    def append(self, obj):
+        self._objects.append(obj)
+        if self._positions is not None:
+            self._positions[id(obj)] = len(self._objects) - 1
+        self._index(obj)
+        self._log(("insert", (len(self._objects) - 1, obj)), ("pop", (len(self._objects) - 1,)), (obj,))
+        cls, aliases = self._aliases_of(obj)
+        self._publish(added=[obj], alias_changes=[(cls, (), aliases)])
+        return len(self._objects) - 1
+
+    def extend(self, objects):
+        with self.batch():
+            for obj in objects:
+                self.append(obj)
+
+    def insert(self, index, obj):
+        self._objects.insert(index, obj)
+        self._positions = None
+        self._index(obj)
+        self._log(("insert", (index, obj)), ("pop", (index,)), (obj,))
+        cls, aliases = self._aliases_of(obj)
+        self._publish(added=[obj], alias_changes=[(cls, (), aliases)])
+
+    def pop(self, index):
+        obj = self._objects.pop(index)
+        self._positions = None
+        self._unindex(obj)
+        self._log(("pop", (index,)), ("insert", (index, obj)), (obj,))
+        cls, aliases = self._aliases_of(obj)
+        self._publish(removed=[obj], alias_changes=[(cls, aliases, ())])
+        return obj
+
+    def replace(self, index, obj):
+        """Put obj at index in place of the current object; returns the old one."""
+        old = self._objects[index]
+        uid = self._unindex(old)
+        self._objects[index] = obj
+        if self._positions is not None:
+            self._positions.pop(id(old), None)
+            self._positions[id(obj)] = index
+        self._index(obj, uid)
+        self._log(("replace", (index, obj)), ("replace", (index, old)), (old,))
+        old_cls, old_aliases = self._aliases_of(old)
+        new_cls, new_aliases = self._aliases_of(obj)
+        if old_cls == new_cls:
+            alias_changes = [(new_cls, old_aliases, new_aliases)]
+        else:
+            alias_changes = [(old_cls, old_aliases, ()), (new_cls, (), new_aliases)]
+        self._publish(added=[obj], removed=[old], alias_changes=alias_changes)
+        return old
+
+    def set_aliases(self, index, aliases):
+        obj = self._objects[index]
+        before = list(obj.get("aliases", []))
+        uid = self._unindex(obj)
+        obj["aliases"] = list(aliases)
+        self._index(obj, uid)
+        self._log(("set_aliases", (index, obj["aliases"])), ("set_aliases", (index, before)), (before,))
+        self._publish(updated=[obj], alias_changes=[(obj.get("objclass", ""), before, obj["aliases"])])
+
+    def set_objdata(self, index, objdata):
+        old = self._objects[index].get("objdata")
+        self._objects[index]["objdata"] = objdata
+        self._log(("set_objdata", (index, objdata)), ("set_objdata", (index, old)), (old,))
+        self._publish(updated=[self._objects[index]])
+
+    def move(self, src, dst):
+        """Move the object at src so that it ends up at index dst."""
+        obj = self._objects.pop(src)
+        self._objects.insert(dst, obj)
+        self._positions = None
+        self._log(("move", (src, dst)), ("move", (dst, src)))
+        self._publish(moved=True)
+
+    def move_block(self, first, count, dst):
+        """Move objects[first:first + count] before the object currently at dst.
+
+        Same convention as QAbstractItemModel.moveRows (dst counts rows before the move).
+        """
+        block = self._objects[first:first + count]
+        del self._objects[first:first + count]
+        if dst > first:
+            dst -= count
+        self._objects[dst:dst] = block
+        self._positions = None
+        back = first if first < dst else first + count
+        self._log(("move_block", (first, count, dst if dst < first else dst + count)),
+                  ("move_block", (dst, count, back)))
+        self._publish(moved=True)
+
+    def move_rows(self, rows, dst):
+        """Move the objects at rows (ascending) together before the object at dst.
+
+        dst counts rows before the move, as in move_block. Each contiguous run
+        of rows is one move_block, so undo keeps (first, count, dst) per run,
+        never the whole order.
+        """
+        runs = []  # [first row, count]
+        for row in rows:
+            if runs and sum(runs[-1]) == row:
+                runs[-1][1] += 1
+            else:
+                runs.append([row, 1])
+        # the block ends up right before the first unmoved object from dst on
+        picked = set(rows)
+        stay = next((r for r in range(dst, len(self._objects)) if r not in picked), None)
+        target = None if stay is None else self._objects[stay]
+        runs = [(self._objects[first], count, stay is None or first < stay) for first, count in runs]
+
+        def position(obj):
+            return len(self._objects) if obj is None else self.index_of(obj)
+
+        with self.batch():
+            # runs before target, last first: each ends where the moved block starts
+            block_start = target
+            for obj, count, _ in reversed([r for r in runs if r[2]]):
+                start, end = self.index_of(obj), position(block_start)
+                if start + count != end:
+                    self.move_block(start, count, end)
+                block_start = obj
+            # runs after target, in order: each follows the moved block
+            end = position(target)
+            for obj, count, _ in (r for r in runs if not r[2]):
+                start = self.index_of(obj)
+                if start != end:
+                    self.move_block(start, count, end)
+                end += count
+
+    # ---------------------- queries ----------------------
+    def has_alias(self, alias):
+        return alias in self._by_alias
+
+    def get(self, alias):
+        """First object carrying alias, or None."""
+        owners = self._by_alias.get(alias)
+        return next(iter(owners.values())) if owners else None
+
+    def aliases(self):
+        """Live set-like view of every alias in the document."""
+        return self._by_alias.keys()
+
+    def objclasses(self):
+        return self._by_class.keys()
+
+    def objects_of_class(self, objclass):
+        return list(self._by_class.get(objclass, {}).values())
+
+    def aliases_for_classes(self, objclasses=None):
+        """Aliases of the objects of the given objclasses (every object if None)."""
+        if objclasses is None:
+            return list(self._by_alias)
+        return [
+            a for objclass in dict.fromkeys(objclasses)
+            for obj in self._by_class.get(objclass, {}).values()
+            for a in obj.get("aliases", [])
+        ]
+
+    def unique_alias(self, base, taken=()):
+        """base if unused (and not in taken), else base's prefix with the next free suffix."""
+        return self.allocator.allocate(base, taken=taken)[0]
+
+    def next_wave_alias(self):
+        return self.allocator.next("Wave")[0]
+
+    def derive_alias_from_class(self, cls_name):
+        """Same rules as aliases.derive_alias_from_class, from the allocator's counters."""
+        if cls_name == "SpawnZombiesJitteredWaveActionProps":
+            return self.next_wave_alias()
+        return self.unique_alias(alias_base_for_class(cls_name))
@@ -0,0 +1,239 @@
+from level_core.alias_graph import AliasGraph
+from level_core.document import LevelDocument
+from level_core.level import split_level
+from level_core.resolver import ERROR, WARNING, Diagnostic
+from level_core.rtid import CURRENT_LEVEL, rtid_name
+
+# objclasses the game only reaches through another object (a wave manager,
+# a wave, a star challenge module), never directly from LevelDefinition.Modules
+CHILD_ONLY_CLASSES = {"WaveManagerProperties"}
+
+
+def is_child_only(objclass):
+    return objclass in CHILD_ONLY_CLASSES or objclass.endswith("Props")
+
+
+def strongly_connected_components(nodes, successors):
+    """Tarjan's SCC, iterative (no recursion limit on long wave chains).
+
+    nodes is an iterable of hashable nodes, successors(node) an iterable of
+    nodes. Returns the components as lists; O(nodes + edges).
+    """
+    index = {}
+    low = {}
+    on_stack = set()
+    stack = []
+    components = []
+    counter = 0
+    for root in nodes:
+        if root in index:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(successors(root)))]
+        while work:
+            node, children = work[-1]
+            for child in children:
+                if child not in index:
+                    index[child] = low[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack.add(child)
+                    work.append((child, iter(successors(child))))
+                    break
+                if child in on_stack and index[child] < low[node]:
+                    low[node] = index[child]
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[node] < low[parent]:
+                        low[parent] = low[node]
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+    return components
+
+
+class GraphReport:
+    """Cycles and orphans of a document's @CurrentLevel alias graph.
+
+    cycles   lists of aliases referencing each other in a loop (self-references included)
+    orphans  objects no path from the module roots reaches
+
+    Module roots are the @CurrentLevel aliases of LevelDefinition.Modules when
+    known (module_roots), otherwise what get_root_aliases would put there: the
+    unreferenced aliases, minus those of child-only objects (waves, star
+    challenges...) which are reported as orphans instead.
+
+    update() patches the report after the graph changed, re-running both
+    passes only over the part of the graph reachable from the changed
+    aliases. Orphans are in document order after a full analysis; update()
+    appends the new ones.
+    """
+
+    def __init__(self, document, graph, module_roots=None):
+        self.document = document
+        self.graph = graph
+        self._module_roots = None if module_roots is None else set(module_roots)
+        known = document.aliases()
+        # alias -> children that exist in the document, built once for both passes
+        edges = {a: [c for c in graph.children(a) if c in known] for a in known}
+        successors = edges.__getitem__
+
+        self.cycles = [
+            list(reversed(c)) for c in strongly_connected_components(edges, successors)
+            if len(c) > 1 or c[0] in edges[c[0]]
+        ]
+
+        if module_roots is None:
+            module_roots = [
+                a for a in graph.root_aliases()
+                if not is_child_only(document.get(a).get("objclass", ""))
+            ]
+        reached = set()
+        pending = [a for a in module_roots if a in known]
+        reached.update(pending)
+        while pending:
+            for child in successors(pending.pop()):
+                if child not in reached:
+                    reached.add(child)
+                    pending.append(child)
+        self.orphans = [
+            obj for obj in document
+            if obj.get("aliases") and not any(a in reached for a in obj["aliases"])
+        ]
+        self._reached = reached
+        self._index()
+
+    def _index(self):
+        self._cycle_of = {a: cycle for cycle in self.cycles for a in cycle}
+        self._orphan_ids = {id(obj) for obj in self.orphans}
+
+    def _successors(self, alias):
+        known = self.document.aliases()
+        return [c for c in self.graph.children(alias) if c in known]
+
+    def _is_root(self, alias):
+        if self._module_roots is not None:
+            return alias in self._module_roots
+        return (self.graph.in_degree(alias) == 0
+                and not is_child_only(self.document.get(alias).get("objclass", "")))
+
+    def update(self, changed):
+        """Patch the report for graph.take_changed(); returns the aliases whose
+        diagnostics may differ (their objects are the ones to re-check).
+
+        Every edge that appeared or went away points at a changed alias, so
+        cycles and paths from the roots can only differ among the aliases
+        reachable from a changed one; nothing else is walked.
+        """
+        known = self.document.aliases()
+        start = [a for a in changed if a in known]
+        affected = set(changed)
+
+        # what the changed aliases reach: the only part of the graph worth walking
+        region = set(start)
+        pending = list(start)
+        while pending:
+            for child in self._successors(pending.pop()):
+                if child not in region:
+                    region.add(child)
+                    pending.append(child)
+        affected |= region
+
+        # cycles: a component that formed, grew, split or broke lies in region
+        kept = []
+        for cycle in self.cycles:
+            if changed.isdisjoint(cycle) and region.isdisjoint(cycle):
+                kept.append(cycle)
+            else:
+                affected.update(cycle)
+        kept.extend(
+            list(reversed(c)) for c in strongly_connected_components(start, self._successors)
+            if len(c) > 1 or c[0] in self._successors(c[0])
+        )
+        self.cycles = kept
+
+        # reachability: only aliases in region can gain or lose a path from the roots
+        reached = self._reached
+        reached.difference_update(changed)
+        reached.difference_update(region)
+        pending = [
+            a for a in region
+            if self._is_root(a) or any(p in reached for p in self.graph.referrers(a))
+        ]
+        reached.update(pending)
+        while pending:
+            for child in self._successors(pending.pop()):
+                if child not in reached:
+                    reached.add(child)
+                    pending.append(child)
+
+        recheck = {}
+        for alias in region:
+            for obj in self.document.objects_with_alias(alias):
+                recheck[id(obj)] = obj
+        orphaned = {key for key, obj in recheck.items() if not any(a in reached for a in obj["aliases"])}
+        orphans = [
+            obj for obj in self.orphans
+            if (id(obj) in orphaned if id(obj) in recheck else obj in self.document)
+        ]
+        orphans.extend(obj for key, obj in recheck.items() if key in orphaned and key not in self._orphan_ids)
+        self.orphans = orphans
+        self._index()
+        return affected
+
+    def _cycle_diagnostic(self, cycle, alias):
+        path = " -> ".join(cycle + cycle[:1])
+        return Diagnostic(alias, "aliases", path, "reference cycle", ERROR)
+
+    def _orphan_diagnostic(self, obj):
+        alias = obj["aliases"][0]
+        if is_child_only(obj.get("objclass", "")):
+            reason = "not used by any module; it would be added to LevelDefinition.Modules as is"
+        else:
+            reason = "not reachable from LevelDefinition.Modules"
+        return Diagnostic(alias, "aliases", alias, reason, WARNING)
+
+    def diagnostics(self):
+        """(object, Diagnostic) pairs, cycles first."""
+        result = []
+        for cycle in self.cycles:
+            for alias in cycle:
+                result.append((self.document.get(alias), self._cycle_diagnostic(cycle, alias)))
+        for obj in self.orphans:
+            result.append((obj, self._orphan_diagnostic(obj)))
+        return result
+
+    def diagnostics_for(self, obj):
+        """The Diagnostics diagnostics() reports for obj."""
+        result = [
+            self._cycle_diagnostic(self._cycle_of[a], a) for a in obj.get("aliases", [])
+            if a in self._cycle_of and self.document.get(a) is obj
+        ]
+        if id(obj) in self._orphan_ids:
+            result.append(self._orphan_diagnostic(obj))
+        return result
+
+
+def module_roots_of(level_definition):
+    """@CurrentLevel aliases listed in a LevelDefinition object's Modules."""
+    modules = (level_definition or {}).get("objdata", {}).get("Modules", [])
+    return [a for a in (rtid_name(m, CURRENT_LEVEL) for m in modules) if a is not None]
+
+
+def analyse_level(data):
+    """GraphReport of a whole level dict, rooted at its LevelDefinition.Modules."""
+    level_def, objects = split_level(data)
+    document = LevelDocument(objects)
+    roots = module_roots_of(level_def) if level_def is not None else None
+    return GraphReport(document, AliasGraph(document, debug=False), roots)
@@ -0,0 +1,138 @@
+import sys
+from collections import deque
+
+DEFAULT_MAX_STEPS = 500
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def approx_size(value, _seen=None):
+    """Rough retained size in bytes of a JSON-like value (containers + leaves)."""
+    if _seen is None:
+        _seen = set()
+    if id(value) in _seen:
+        return 0
+    _seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for k, v in value.items():
+            size += approx_size(k, _seen) + approx_size(v, _seen)
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            size += approx_size(v, _seen)
+    return size
+
+
+class Command:
+    """One undo step: the document operations it did and their inverses.
+
+    Operations are (method name, args) pairs replayed on the LevelDocument.
+    They hold references to the object versions before/after the edit, never
+    copies, so a step costs memory proportional to what it changed.
+    """
+    __slots__ = ("redo_ops", "undo_ops", "nbytes")
+
+    def __init__(self):
+        self.redo_ops = []
+        self.undo_ops = []
+        self.nbytes = 0
+
+
+class History:
+    """Command-based undo/redo over a LevelDocument.
+
+    The document journals every mutation (with its inverse) to the history;
+    a step is closed when the document publishes its change, so one
+    `with document.batch():` is one undo step.
+
+    Object versions are structurally shared: replaced objdata / alias lists
+    are kept by reference and untouched objects are never copied. This
+    relies on values handed to the document not being mutated afterwards,
+    edit a copy and pass it to set_objdata() instead.
+
+    The oldest steps are dropped beyond max_steps or max_bytes (approximate
+    size of what the undo stack keeps alive).
+    """
+
+    def __init__(self, document, max_steps=DEFAULT_MAX_STEPS, max_bytes=DEFAULT_MAX_BYTES):
+        self.document = document
+        self.max_steps = max_steps
+        self.max_bytes = max_bytes
+        self._undo = deque()
+        self._redo = []
+        self._open = None      # Command being journaled
+        self._replaying = False
+        self.nbytes = 0
+        document.set_journal(self._record)
+        document.subscribe(self._on_document_changed)
+
+    # --------------------------------------------------------
+    def _record(self, op, inverse, retained=()):
+        if self._replaying:
+            return
+        if self._open is None:
+            self._open = Command()
+        self._open.redo_ops.append(op)
+        self._open.undo_ops.append(inverse)
+        self._open.nbytes += sum(approx_size(v) for v in retained)
+
+    def _on_document_changed(self, change):
+        if self._replaying:
+            return
+        if change.reset:
+            self.clear()
+            return
+        command, self._open = self._open, None
+        if command is None:
+            return
+        self._undo.append(command)
+        self.nbytes += command.nbytes
+        self._redo.clear()
+        self._trim()
+
+    def _trim(self):
+        while self._undo and (len(self._undo) > self.max_steps or self.nbytes > self.max_bytes):
+            self.nbytes -= self._undo.popleft().nbytes
+
+    def _replay(self, ops):
+        self._replaying = True
+        try:
+            with self.document.batch():
+                for name, args in ops:
+                    getattr(self.document, name)(*args)
+        finally:
+            self._replaying = False
+
+    # --------------------------------------------------------
+    def can_undo(self):
+        return bool(self._undo)
+
+    def can_redo(self):
+        return bool(self._redo)
+
+    def undo(self):
+        if not self._undo:
+            return False
+        command = self._undo.pop()
+        self.nbytes -= command.nbytes
+        self._replay(reversed(command.undo_ops))
+        self._redo.append(command)
+        return True
+
+    def redo(self):
+        if not self._redo:
+            return False
+        command = self._redo.pop()
+        self._replay(command.redo_ops)
+        self._undo.append(command)
+        self.nbytes += command.nbytes
+        self._trim()
+        return True
+
+    def clear(self):
+        self._undo.clear()
+        self._redo.clear()
+        self._open = None
+        self.nbytes = 0
+
+    def __len__(self):
+        return len(self._undo)
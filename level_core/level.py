@@ -0,0 +1,58 @@
+from level_core.aliases import build_alias_tree, root_aliases
+from level_core.level_definition import build_level_definition
+
+LEVEL_FORMAT_VERSION = 1
+
+DIFFICULTIES = ["Easy", "Normal", "Hard", "Extreme"]
+CATEGORIES = ["Adventure", "Survival", "Challenge", "MiniGame"]
+
+
+def default_information():
+    from datetime import datetime
+
+    today = datetime.now().strftime("%Y-%m-%d")
+    return {
+        "Author": "",
+        "Introduction": "",
+        "Version": "1.0",
+        "CreatedAt": today,
+        "UpdatedAt": today,
+        "Difficulty": "Normal",
+        "Category": "Survival",
+    }
+
+
+def build_information(author, introduction, version, created_at, updated_at, difficulty, category):
+    return {
+        "Author": author or "Unknown",
+        "Introduction": introduction or "",
+        "Version": version,
+        "CreatedAt": created_at,
+        "UpdatedAt": updated_at,
+        "Difficulty": difficulty,
+        "Category": category
+    }
+
+
+def assemble_level(information, level_settings, objects, alias_modules=None):
+    """Combine all sections into one final JSON structure.
+
+    alias_modules defaults to the root aliases of objects (the ones no other
+    object references), which is what the LevelDefinition lists as modules.
+    """
+    if alias_modules is None:
+        alias_modules = root_aliases(objects, build_alias_tree(objects))
+    level_def = build_level_definition(level_settings, alias_modules)
+    return {
+        "Information": information,
+        "objects": [level_def] + list(objects),
+        "version": LEVEL_FORMAT_VERSION,
+    }
+
+
+def split_level(data):
+    """(LevelDefinition object or None, every other object) of a level dict."""
+    objects = data.get("objects", [])
+    level_def = next((obj for obj in objects if obj.get("objclass") == "LevelDefinition"), None)
+    others = [o for o in objects if o.get("objclass") != "LevelDefinition"]
+    return level_def, others
@@ -0,0 +1,145 @@
+from data_loader import GameData, LevelModules
+from level_core.rtid import CURRENT_LEVEL, LEVEL_MODULES, format_rtid, rtid_name
+
+DEFAULT_LOOT = "RTID(DefaultLoot@LevelModules)"
+NORMAL_PRESENT_TABLE = "egypt_normal_01"
+SHINY_PRESENT_TABLE = "egypt_shiny_01"
+DEFAULT_STARTING_SUN = "50"
+
+# LevelModules objclasses of the stage and mower modules
+STAGE_CLASS = "LawnType"
+MOWER_CLASS = "LawnMowerProperties"
+
+# Modules checked for a new level
+DEFAULT_MODULES = frozenset({
+    "ZombiesDeadWinCon",
+    "DefaultZombieWinCondition",
+    "StandardIntro",
+    "DefaultSunDropper",
+})
+
+
+def default_settings():
+    """Field values of a new level, in the shape build_level_definition expects."""
+    return {
+        "description": "Description",
+        "level_number": "1",
+        "name": "Unnamed Level",
+        "written_by": "unnamed",
+        "starting_sun": DEFAULT_STARTING_SUN,
+        "music_type": None,
+        "stage": None,
+        "mower": None,
+        "modules": [m for m in GameData.get_flat_list("Modules") if m in DEFAULT_MODULES],
+    }
+
+
+# --------------------------------------------------------
+def build_level_definition(settings, alias_modules):
+    """Return the JSON object for LevelDefinition.
+
+    settings holds the editable fields (see default_settings); modules are
+    plain LevelModules names and alias_modules the CurrentLevel root aliases.
+    """
+    # Thu thập modules đã chọn, và bọc lại thành RTID(X@LevelModules)
+    modules = [format_rtid(name, LEVEL_MODULES) for name in settings.get("modules", [])]
+
+    # Add mower module if not None
+    if settings.get("mower"):
+        mower_ref = format_rtid(settings["mower"], LEVEL_MODULES)
+        if mower_ref not in modules:
+            modules.append(mower_ref)
+
+    # Add CurrentLevel modules based on aliases (auto)
+    for alias in alias_modules:
+        modules.append(format_rtid(alias, CURRENT_LEVEL))
+
+    # Remove duplicates while preserving order
+    modules = list(dict.fromkeys(modules))
+
+    objdata = {
+        "Description": settings.get("description", ""),
+        "LevelNumber": int(settings.get("level_number") or 1),
+        "Loot": DEFAULT_LOOT,
+        "Modules": modules,
+        "Name": settings.get("name", ""),
+        "WritenBy": settings.get("written_by", ""),
+        "NormalPresentTable": NORMAL_PRESENT_TABLE,
+        "ShinyPresentTable": SHINY_PRESENT_TABLE,
+        "StageModule": format_rtid(settings.get("stage") or "", LEVEL_MODULES)
+    }
+
+    # Handle MusicType: omit if None
+    if settings.get("music_type"):
+        objdata["MusicType"] = settings["music_type"]
+
+    # Handle Starting Sun
+    starting_sun = str(settings.get("starting_sun") or DEFAULT_STARTING_SUN)
+    if starting_sun != DEFAULT_STARTING_SUN:
+        objdata["StartingSun"] = starting_sun
+
+    return {
+        "objclass": "LevelDefinition",
+        "objdata": objdata
+    }
+
+
+def _module_choices(section, objclass):
+    """GameData names of section, then any other LevelModules objects of objclass."""
+    names = list(GameData.get_flat_list(section))
+    known = set(names)
+    names.extend(a for a in LevelModules.aliases_for(objclass) if a not in known)
+    return names
+
+
+def stage_choices():
+    return _module_choices("Stages", STAGE_CLASS)
+
+
+def mower_choices():
+    return _module_choices("Lawn Mowers", MOWER_CLASS)
+
+
+def _is_module(name, section, objclass):
+    return LevelModules.objclass_of(name) == objclass or GameData.has_code(section, name)
+
+
+def parse_level_definition(data):
+    """LevelDefinition objdata -> settings dict (inverse of build_level_definition).
+
+    Stage and mower are None unless LevelModules.json (or GameData) has them
+    as a stage / mower module; music is None unless GameData knows it.
+    """
+    stage = rtid_name(data.get("StageModule", ""), LEVEL_MODULES)
+    if stage is not None and not _is_module(stage, "Stages", STAGE_CLASS):
+        stage = None
+
+    music = data.get("MusicType")
+    if not GameData.has_code("Music Types", music):
+        music = None
+
+    # Detect mower module from existing Modules
+    mower = None
+    for m in data.get("Modules", []):
+        name = rtid_name(m, LEVEL_MODULES)
+        if name is not None and _is_module(name, "Lawn Mowers", MOWER_CLASS):
+            mower = name
+            break
+
+    modules = []
+    for m in data.get("Modules", []):
+        name = rtid_name(m, LEVEL_MODULES)
+        if name is not None:
+            modules.append(name)
+
+    return {
+        "description": data.get("Description", ""),
+        "level_number": str(data.get("LevelNumber", 1)),
+        "name": data.get("Name", ""),
+        "written_by": data.get("WritenBy", ""),
+        "starting_sun": str(data.get("StartingSun", DEFAULT_STARTING_SUN)),
+        "music_type": music,
+        "stage": stage,
+        "mower": mower,
+        "modules": modules,
+    }
@@ -0,0 +1,384 @@
+"""objdata shaping for every editable objclass.
+
+Each function takes plain Python values (what an editor dialog collected) and
+returns the JSON-ready objdata, applying the "omit when zero / unset" rules of
+the level format. The dialogs in editors/ only gather widget values and call
+these, so headless tools produce exactly the same JSON.
+"""
+from math import ceil
+
+
+class ObjdataError(ValueError):
+    """Collected values cannot form a valid objdata (message is user-facing)."""
+
+
+def _put_positive(out, entry, keys, cast=int):
+    # chỉ thêm khi > 0 để tránh rác JSON
+    for k in keys:
+        v = entry.get(k)
+        v = cast(v) if v is not None else cast(0)
+        if v > 0:
+            out[k] = v
+
+
+# ------------------------------------------------------------
+# Waves
+# ------------------------------------------------------------
+def spawn_zombie_entry(zombie_type, row=0, column=0, carry_sun=0):
+    """One Zombies[] entry; zombie_type is the RTID(...@ZombieTypes) string."""
+    z = {"Type": zombie_type}
+    if row != 0:
+        z["Row"] = row
+    if column != 0:
+        z["Column"] = column
+    if carry_sun > 0:
+        z["CarrySun"] = carry_sun
+    return z
+
+
+def spawn_zombies_jittered(zombies, additional_plantfood=0, dynamic_plantfood=(),
+                           must_kill_all=False, notification_event=None):
+    """SpawnZombiesJitteredWaveActionProps; zombies are dicts with Type/Row/Column/CarrySun."""
+    result = {"Zombies": [
+        spawn_zombie_entry(z["Type"], z.get("Row", 0), z.get("Column", 0), z.get("CarrySun", 0))
+        for z in zombies
+    ]}
+
+    if additional_plantfood > 0:
+        result["AdditionalPlantfood"] = additional_plantfood
+
+    dyn = list(dynamic_plantfood)
+    if any(val != 0 for val in dyn):
+        result["DynamicPlantfood"] = dyn
+
+    if must_kill_all:
+        result["MustKillAllToNextWave"] = True
+
+    if notification_event:
+        result["NotificationEvents"] = [notification_event]
+
+    return result
+
+
+def parse_int_list(text):
+    """"1, 2, x, 3" -> [1, 2, 3] (non-numeric entries dropped)."""
+    return [int(v.strip()) for v in text.split(",") if v.strip().isdigit()]
+
+
+def required_override_count(wave_count, flag_wave_interval):
+    return ceil(wave_count / flag_wave_interval)
+
+
+def wave_manager(flag_wave_interval, wave_count, waves, overrides=(),
+                 max_next_wave_health=0.0, min_next_wave_health=0.0,
+                 wave_spending_point_increment=0, wave_spending_points=0):
+    """WaveManagerProperties.
+
+    Raises ObjdataError unless overrides is empty or holds exactly
+    ceil(wave_count / flag_wave_interval) entries.
+    """
+    overrides = list(overrides)
+    required = required_override_count(wave_count, flag_wave_interval)
+    if len(overrides) not in (0, required):
+        raise ObjdataError(
+            f"The number of override types must equal ceil(WaveCount / FlagWaveInterval).\n"
+            f"Expected: {required}, got: {len(overrides)}"
+        )
+
+    data = {
+        "FlagWaveInterval": flag_wave_interval,
+        "WaveCount": wave_count,
+        "Waves": [list(w) for w in waves]
+    }
+    if overrides:
+        data["FlagWaveVeteranOverrideTypes"] = overrides
+
+    # Optional values — chỉ thêm khi khác 0
+    if max_next_wave_health > 0:
+        data["MaxNextWaveHealthPercentage"] = round(max_next_wave_health, 3)
+    if min_next_wave_health > 0:
+        data["MinNextWaveHealthPercentage"] = round(min_next_wave_health, 3)
+    if wave_spending_point_increment > 0:
+        data["WaveSpendingPointIncrement"] = wave_spending_point_increment
+    if wave_spending_points > 0:
+        data["WaveSpendingPoints"] = wave_spending_points
+
+    return data
+
+
+def dynamic_zombie(point_increment, starting_points, starting_wave, zombie_pool):
+    return {
+        "PointIncrementPerWave": point_increment,
+        "StartingPoints": starting_points,
+        "StartingWave": starting_wave,
+        "ZombiePool": list(zombie_pool)
+    }
+
+
+def wave_manager_module(wave_manager_ref, dynamic_zombies):
+    return {"DynamicZombies": dynamic_zombies, "WaveManagerProps": wave_manager_ref}
+
+
+# ------------------------------------------------------------
+# Seed bank / conveyor
+# ------------------------------------------------------------
+def seed_bank(preset_plants=(), exclude_plants=(), include_plants=(), selection_method="",
+              exclude_sun_producers=False, suppress_tip=False, override_slots=0):
+    """SeedBankProperties."""
+    obj = {}
+
+    if exclude_sun_producers:
+        obj["ExcludeListSunProducers"] = "true"
+
+    if preset_plants:
+        obj["PresetPlantList"] = [
+            {"PlantType": plant, "Level": -1} for plant in preset_plants
+        ]
+    if exclude_plants:
+        obj["PlantExcludeList"] = list(exclude_plants)
+    if include_plants:
+        obj["PlantIncludeList"] = list(include_plants)
+
+    if selection_method:
+        obj["SelectionMethod"] = selection_method
+
+    if suppress_tip:
+        obj["SuppressObjectiveTip"] = True
+
+    if override_slots > 0:
+        obj["OverrideSeedSlotsCount"] = override_slots
+
+    return obj
+
+
+_COUNT_KEYS = ("MaxCount", "MinCount", "MinCountCooldownSeconds", "MaxCountCooldownSeconds")
+_FACTOR_KEYS = ("MaxWeightFactor", "MinWeightFactor")
+
+
+def conveyor_plant(entry):
+    """One InitialPlantList entry (plain PlantType), zero fields omitted; None if Weight <= 0."""
+    if entry.get("Weight", 0) <= 0:
+        return None
+    out = {"PlantType": entry.get("PlantType", "").strip(), "Weight": int(entry.get("Weight", 0))}
+    _put_positive(out, entry, _COUNT_KEYS, int)
+    _put_positive(out, entry, _FACTOR_KEYS, float)
+    return out
+
+
+def conveyor_seed_bank(drop_conditions, plants, speed_conditions):
+    """ConveyorSeedBankProperties; plants with no weight are dropped."""
+    initial = [p for p in (conveyor_plant(e) for e in plants) if p is not None]
+    return {
+        "DropDelayConditions": [
+            {"Delay": int(c["Delay"]), "MaxPackets": int(c["MaxPackets"])} for c in drop_conditions
+        ],
+        "InitialPlantList": initial,
+        "SpeedConditions": [
+            {"MaxPackets": int(c["MaxPackets"]), "Speed": int(c["Speed"])} for c in speed_conditions
+        ]
+    }
+
+
+def modify_conveyor_plant(plant_type, weight, **optional):
+    """One Add/Remove entry of ModifyConveyorWaveActionProps, zero fields omitted.
+
+    plant_type is the RTID(...@PlantTypes) string.
+    """
+    d = {"Type": plant_type, "Weight": weight}
+    for k in _COUNT_KEYS + _FACTOR_KEYS:
+        if optional.get(k, 0) > 0:
+            d[k] = optional[k]
+    return d
+
+
+def modify_conveyor(add, remove):
+    return {"Add": list(add), "Remove": list(remove)}
+
+
+# ------------------------------------------------------------
+# Board setup
+# ------------------------------------------------------------
+def grid_placement(type_name, grid_x, grid_y, condition=""):
+    """InitialPlant/InitialZombie placement; Condition only when set."""
+    data = {
+        "TypeName": type_name.strip(),
+        "GridX": int(grid_x),
+        "GridY": int(grid_y),
+    }
+    if condition and condition.strip():
+        data["Condition"] = condition.strip()
+    return data
+
+
+def initial_plants(placements):
+    return {"InitialPlantPlacements": placements}
+
+
+def initial_zombies(placements):
+    return {"InitialZombiePlacements": placements}
+
+
+def initial_grid_items(placements):
+    """placements: iterable of (grid_x, grid_y, type_name)."""
+    return {"InitialGridItemPlacements": [
+        {"GridX": int(gx), "GridY": int(gy), "TypeName": t.strip()} for gx, gy, t in placements
+    ]}
+
+
+def gravestones(count=0, spawn_column_start=0, spawn_column_end=0, force_spawn=()):
+    """GravestoneProperties; force_spawn: iterable of (grid_x, grid_y, type_name)."""
+    data = {}
+    if count > 0:
+        data["GravestoneCount"] = count
+    if spawn_column_start > 0 or spawn_column_end > 0:
+        data["SpawnColumnStart"] = spawn_column_start
+        data["SpawnColumnEnd"] = spawn_column_end
+    force_data = [
+        {"GridX": int(gx), "GridY": int(gy), "TypeName": name} for gx, gy, name in force_spawn
+    ]
+    if force_data:
+        data["ForceSpawnData"] = force_data
+    return data
+
+
+def trap_tile(group, m_x, m_y, recover_delay):
+    return {
+        "Group": group,
+        "Location": {"mX": int(m_x), "mY": int(m_y)},
+        "RecoverDelay": float(recover_delay)
+    }
+
+
+def trap_tiles(tiles):
+    return {"TrapTiles": tiles}
+
+
+def power_tile_link(group, m_x, m_y, propagation_delay, propagation_initial_delay=0.0):
+    data = {
+        "Group": group,
+        "Location": {"mX": m_x, "mY": m_y},
+        "PropagationDelay": float(propagation_delay)
+    }
+    # chỉ thêm khi khác 0 để tránh rác JSON
+    if float(propagation_initial_delay or 0.0) != 0.0:
+        data["PropagationInitialDelay"] = propagation_initial_delay
+    return data
+
+
+def power_tiles(links):
+    """PowerTileProperties; links are power_tile_link() dicts."""
+    tiles = []
+    for link in links:
+        data = dict(link)
+        # ensure numeric types are correct on export
+        data["PropagationDelay"] = float(data.get("PropagationDelay", 0.0))
+        if float(data.get("PropagationInitialDelay", 0.0)) == 0.0:
+            # drop zero initial delay to keep JSON clean
+            data.pop("PropagationInitialDelay", None)
+        tiles.append(data)
+    return {"LinkedTiles": tiles}
+
+
+def railcarts(railcart_type, carts, rails):
+    """RailcartProperties; carts: (column, row), rails: (column, row_start, row_end)."""
+    return {
+        "RailcartType": railcart_type,
+        "Railcarts": [{"Column": c, "Row": r} for c, r in carts],
+        "Rails": [{"Column": c, "RowStart": s, "RowEnd": e} for c, s, e in rails]
+    }
+
+
+def pirate_planks(rows):
+    return {"PlankRows": sorted(rows)}
+
+
+def protect_the_plant(must_protect_count, plants):
+    """ProtectThePlantChallengeProperties; plants: (grid_x, grid_y, plant_type)."""
+    return {
+        "MustProtectCount": must_protect_count,
+        "Plants": [
+            {"GridX": int(gx), "GridY": int(gy), "PlantType": t} for gx, gy, t in plants
+        ]
+    }
+
+
+def mold_colony(matrix, suppress_tip=False):
+    """MoldColonyChallengeProps; matrix is rows of booleans."""
+    obj = {"MoldMatrix": ["".join("1" if cell else "0" for cell in row) for row in matrix]}
+    if suppress_tip:
+        obj["SuppressObjectiveTip"] = True
+    return obj
+
+
+def zombie_potions(initial_count, max_count, timer_min, timer_max, potion_types, suppress_tip=False):
+    obj = {
+        "InitialPotionCount": initial_count,
+        "MaxPotionCount": max_count,
+        "PotionSpawnTimer": {
+            "Min": round(timer_min, 2),
+            "Max": round(timer_max, 2)
+        },
+        "PotionTypes": list(potion_types)
+    }
+    if suppress_tip:
+        obj["SuppressObjectiveTip"] = True
+    return obj
+
+
+def last_stand(starting_plantfood, starting_sun):
+    return {
+        "StartingPlantfood": starting_plantfood,
+        "StartingSun": starting_sun
+    }
+
+
+# ------------------------------------------------------------
+# Star challenges
+# ------------------------------------------------------------
+def star_challenge_module(challenges, always_available=False):
+    obj = {
+        "Challenges": [list(group) for group in challenges]
+    }
+    if always_available:
+        obj["ChallengesAlwaysAvailable"] = True
+    return obj
+
+
+def language_entry(en="", zh=""):
+    d = {}
+    if en.strip():
+        d["en"] = en.strip()
+    if zh.strip():
+        d["zh"] = zh.strip()
+    return d
+
+
+def beat_the_level(descriptions, multi_language):
+    return {"Descriptions": list(descriptions), "DescriptionsMultiLanguage": list(multi_language)}
+
+
+def kill_zombies_in_time(time_limit, zombies_to_kill):
+    return {
+        "Time": time_limit,
+        "ZombiesToKill": zombies_to_kill
+    }
+
+
+def plants_lost(maximum):
+    return {"MaximumPlantsLost": maximum}
+
+
+def simultaneous_plants(maximum):
+    return {"MaximumPlants": maximum}
+
+
+def sun_produced(target):
+    return {"TargetSun": target}
+
+
+def sun_used(maximum):
+    return {"MaximumSun": maximum}
+
+
+def zombie_distance(target):
+    return {"TargetDistance": round(target, 2)}
@@ -0,0 +1,57 @@
+from level_core.references import remap_references
+
+
+class RenameError(ValueError):
+    pass
+
+
+def check_renames(document, mapping):
+    """Raise RenameError unless mapping {old: new} can be applied to document."""
+    targets = {}
+    for old, new in mapping.items():
+        if not new:
+            raise RenameError(f"empty new name for '{old}'")
+        if new in targets:
+            raise RenameError(f"'{targets[new]}' and '{old}' would both be renamed to '{new}'")
+        targets[new] = old
+        if not document.has_alias(old):
+            raise RenameError(f"there is no object with alias '{old}'")
+        if document.has_alias(new) and new not in mapping:
+            raise RenameError(f"alias '{new}' is already used")
+
+
+def rename_aliases(document, graph, mapping):
+    """Rename aliases {old: new} and rewrite every RTID(old@CurrentLevel) reference.
+
+    Only the objects carrying an old alias and the objects the graph lists
+    as referencing one (aliased or not) are touched, so the cost follows
+    the number of references, not the level size. Several renames (e.g.
+    renumbering Wave1..Wave500, swaps included) run as one document batch:
+    one change notification and one undo step.
+
+    Returns the number of objects whose objdata was rewritten.
+    """
+    mapping = {old: new for old, new in mapping.items() if old != new}
+    if not mapping:
+        return 0
+    check_renames(document, mapping)
+
+    owners = {}
+    referrers = {}
+    for old in mapping:
+        for obj in document.objects_with_alias(old):
+            owners[id(obj)] = obj
+        for obj in graph.referring_objects(old):
+            referrers[id(obj)] = obj
+
+    rewritten = 0
+    with document.batch():
+        for obj in owners.values():
+            document.set_aliases(document.index_of(obj), [mapping.get(a, a) for a in obj["aliases"]])
+        for obj in referrers.values():
+            objdata = obj.get("objdata")
+            new = remap_references(objdata, mapping)
+            if new is not objdata:
+                document.set_objdata(document.index_of(obj), new)
+                rewritten += 1
+    return rewritten
@@ -0,0 +1,72 @@
+from level_core.document import LevelDocument
+from level_core.rtid import CURRENT_LEVEL, format_rtid, rtid_name
+
+
+def current_level_alias(reference):
+    """"RTID(X@CurrentLevel)" -> "X"; None for anything else."""
+    return rtid_name(reference, CURRENT_LEVEL)
+
+
+def remap_references(value, mapping):
+    """value with every RTID(old@CurrentLevel) in mapping pointing at mapping[old].
+
+    Only the containers on the path to a rewritten reference are copied; every
+    untouched subtree is returned as is (shared with the input).
+    """
+    if isinstance(value, str):
+        alias = current_level_alias(value)
+        if alias is not None and alias in mapping:
+            return format_rtid(mapping[alias], CURRENT_LEVEL)
+        return value
+    if isinstance(value, dict):
+        out = None
+        for k, v in value.items():
+            new = remap_references(v, mapping)
+            if new is not v:
+                if out is None:
+                    out = dict(value)
+                out[k] = new
+        return value if out is None else out
+    if isinstance(value, list):
+        out = None
+        for i, v in enumerate(value):
+            new = remap_references(v, mapping)
+            if new is not v:
+                if out is None:
+                    out = list(value)
+                out[i] = new
+        return value if out is None else out
+    return value
+
+
+def _alias_lookup(objects):
+    """Something supporting `alias in ...` for objects (a LevelDocument or a plain list)."""
+    if isinstance(objects, LevelDocument):
+        return objects.aliases()
+    return {a for obj in objects for a in obj.get("aliases", [])}
+
+
+class ReferenceValidator:
+    """Cross-object RTID validator.
+
+    objects is the ObjectsTab's LevelDocument (O(1) alias lookups) or a plain
+    list of object dicts.
+    """
+    @staticmethod
+    def is_reference_valid(reference: str, objects) -> bool:
+        alias = current_level_alias(reference)
+        if alias is None:
+            return True
+        if isinstance(objects, LevelDocument):
+            return objects.has_alias(alias)
+        return any(alias in obj.get("aliases", []) for obj in objects)
+
+    @staticmethod
+    def list_missing_references(references: list[str], objects):
+        known = _alias_lookup(objects)
+        missing = []
+        for ref in references:
+            alias = current_level_alias(ref)
+            if alias is not None and alias not in known:
+                missing.append(alias)
+        return missing
@@ -0,0 +1,176 @@
+from collections import namedtuple
+
+from data_loader import GameData, LevelModules
+from level_core.document import LevelDocument
+from level_core.level_definition import DEFAULT_LOOT
+from level_core.rtid import (
+    CURRENT_LEVEL, GRID_ITEM, LEVEL_MODULES, PLANT_TYPES, ZOMBIE_TYPES, parse_rtid, rtid_name,
+)
+
+ERROR = "error"
+WARNING = "warning"
+
+Diagnostic = namedtuple("Diagnostic", "object path reference reason severity")
+Diagnostic.__doc__ = """One unresolved reference (or, from level_core.schemas, one invalid value).
+
+object     label of the object holding it (first alias, else objclass)
+path       JSON path inside that object, e.g. objdata.Waves[3][0]
+reference  the RTID string (schemas: the offending value as JSON, "" if missing)
+"""
+
+# namespace -> GameData sections whose codes it accepts
+GAME_DATA_NAMESPACES = {
+    ZOMBIE_TYPES: ("Zombies",),
+    PLANT_TYPES: ("Plants",),
+    GRID_ITEM: ("Grid Items",),
+}
+# GameData sections that name shared LevelModules objects
+LEVEL_MODULES_SECTIONS = ("Modules", "Stages", "Lawn Mowers")
+
+
+def object_label(obj):
+    aliases = obj.get("aliases") or ()
+    return aliases[0] if aliases else obj.get("objclass", "?")
+
+
+def format_path(keys):
+    path = "objdata"
+    for key in keys:
+        path += f"[{key}]" if isinstance(key, int) else f".{key}"
+    return path
+
+
+class Resolver:
+    """Checks RTID references against hashed namespace indexes.
+
+    @CurrentLevel       the level's own aliases
+    @ZombieTypes etc.   GameData codes (GAME_DATA_NAMESPACES)
+    @LevelModules       LevelModules.json aliases plus the GameData module,
+                        stage and mower codes
+
+    Build one per validation run (or keep one and call set_level_aliases);
+    each check is a parse-cache hit plus a set lookup. When game_data.json or
+    LevelModules.json is unavailable its namespaces are reported as warnings
+    instead of errors.
+    """
+
+    def __init__(self, level_aliases=()):
+        self.level_aliases = level_aliases
+        self._results = {}  # reference -> check() result, for this set of level aliases
+        try:
+            GameData.load()
+            self._game_data = True
+        except FileNotFoundError:
+            self._game_data = False
+        try:
+            LevelModules.load()
+            self._level_modules = True
+        except FileNotFoundError:
+            self._level_modules = False
+        modules = set()  # GameData names accepted in @LevelModules besides LevelModules.json
+        self._codes = {}  # namespace -> set of GameData codes
+        if self._game_data:
+            for section in LEVEL_MODULES_SECTIONS:
+                modules.update(GameData.get_flat_list(section))
+            for namespace, sections in GAME_DATA_NAMESPACES.items():
+                self._codes[namespace] = {c for s in sections for c in GameData.get_flat_list(s)}
+        modules.add(rtid_name(DEFAULT_LOOT, LEVEL_MODULES))
+        self._modules = modules
+
+    def set_level_aliases(self, level_aliases):
+        self.level_aliases = level_aliases
+        self._results = {}
+
+    def forget(self, references):
+        """Drop cached results (after those @CurrentLevel aliases appeared or went away)."""
+        for reference in references:
+            self._results.pop(reference, None)
+
+    def check(self, reference):
+        """None if reference resolves, else (reason, severity)."""
+        try:
+            return self._results[reference]
+        except KeyError:
+            result = self._results[reference] = self._check(reference)
+            return result
+
+    def _check(self, reference):
+        rtid = parse_rtid(reference)
+        if rtid is None:
+            return "malformed RTID", ERROR
+        name, namespace = rtid
+        if not name:
+            return "empty name", ERROR
+        if namespace == CURRENT_LEVEL:
+            if name in self.level_aliases:
+                return None
+            return f"no object with alias '{name}' in this level", ERROR
+        if namespace == LEVEL_MODULES:
+            if name in self._modules or LevelModules.has_alias(name):
+                return None
+            severity = ERROR if self._level_modules else WARNING
+            return f"'{name}' is not a known LevelModules object", severity
+        sections = GAME_DATA_NAMESPACES.get(namespace)
+        if sections is None:
+            return f"unknown namespace '{namespace}'", WARNING
+        if not self._game_data:
+            return f"cannot check '{name}': game data not loaded", WARNING
+        if name in self._codes[namespace]:
+            return None
+        return f"'{name}' is not in GameData {'/'.join(sections)}", ERROR
+
+    def check_object(self, obj, references=None):
+        """Diagnostics for every RTID string inside obj's objdata, in document order.
+
+        If references is a list, every RTID string seen is appended to it.
+        """
+        diagnostics = []
+        keys = []  # path to the current node, only formatted for a diagnostic
+
+        def visit(key, value):
+            if isinstance(value, str):
+                if value.startswith("RTID("):
+                    if references is not None:
+                        references.append(value)
+                    problem = self.check(value)
+                    if problem is not None:
+                        keys.append(key)
+                        diagnostics.append(Diagnostic(object_label(obj), format_path(keys), value, *problem))
+                        keys.pop()
+            elif isinstance(value, (dict, list)):
+                keys.append(key)
+                walk(value)
+                keys.pop()
+
+        def walk(node):
+            if isinstance(node, dict):
+                for k, v in node.items():
+                    visit(k, v)
+            else:
+                for i, v in enumerate(node):
+                    visit(i, v)
+
+        objdata = obj.get("objdata")
+        if isinstance(objdata, (dict, list)):
+            walk(objdata)
+        return diagnostics
+
+
+def resolve_level(objects, resolver=None):
+    """Diagnostics for every reference in objects (a LevelDocument or a list
+    of object dicts, LevelDefinition included), in one pass.
+
+    Pass a Resolver to reuse its GameData indexes across many levels.
+    """
+    if isinstance(objects, LevelDocument):
+        aliases = objects.aliases()
+    else:
+        aliases = {a for obj in objects for a in obj.get("aliases", [])}
+    if resolver is None:
+        resolver = Resolver(aliases)
+    else:
+        resolver.set_level_aliases(aliases)
+    diagnostics = []
+    for obj in objects:
+        diagnostics.extend(resolver.check_object(obj))
+    return diagnostics
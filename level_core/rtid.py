@@ -0,0 +1,60 @@
+import sys
+from collections import namedtuple
+from functools import lru_cache
+
+CURRENT_LEVEL = "CurrentLevel"
+LEVEL_MODULES = "LevelModules"
+ZOMBIE_TYPES = "ZombieTypes"
+PLANT_TYPES = "PlantTypes"
+GRID_ITEM = "GridItem"
+
+RTID = namedtuple("RTID", "name namespace")
+RTID.__doc__ = "A parsed RTID(name@namespace) reference."
+
+
+@lru_cache(maxsize=1 << 16)
+def parse_rtid(value):
+    """"RTID(name@namespace)" -> RTID(name, namespace); None for anything else.
+
+    Cached: a level repeats the same few hundred references many times, so
+    every distinct string is parsed once and equal strings share one
+    (interned) RTID value.
+    """
+    if not value.startswith("RTID(") or not value.endswith(")"):
+        return None
+    name, at, namespace = value[5:-1].rpartition("@")
+    if not at or not namespace:
+        return None
+    return RTID(sys.intern(name), sys.intern(namespace))
+
+
+def format_rtid(name, namespace):
+    return f"RTID({name}@{namespace})"
+
+
+def rtid_name(value, namespace):
+    """The name of an RTID(name@namespace) string in namespace; None for anything else."""
+    if not isinstance(value, str):
+        return None
+    rtid = parse_rtid(value)
+    if rtid is None or rtid.namespace != namespace:
+        return None
+    return rtid.name
+
+
+def strip_rtid(value, namespace):
+    """Bare name for a dialog field: RTID(x@namespace) -> x, anything else unchanged."""
+    name = rtid_name(value, namespace)
+    return value if name is None else name
+
+
+def as_rtid(text, namespace):
+    """Field text -> RTID string in namespace.
+
+    "" stays "" and text already starting with "RTID(" passes through as
+    typed (a malformed one is the validator's to report, not to re-wrap).
+    """
+    text = text.strip()
+    if not text or text.startswith("RTID("):
+        return text
+    return format_rtid(text, namespace)
@@ -0,0 +1,576 @@
+"""Declarative objdata schemas for every editable objclass.
+
+A schema is plain JSON-like data built with the helpers below (integer,
+number, record, array...), mirroring the ranges and shapes the editor dialogs
+enforce. compile_schema turns one into two functions, cached by the hash of
+the schema so each distinct (sub)schema is compiled once per process:
+
+    ok(value)                  True when value matches; generated source with
+                               nested lists and records unrolled into loops and
+                               the scalar checks inlined, the hot path
+    explain(value, keys, out)  appends (keys, reason, value) for each mismatch
+
+check_object only runs explain on objects ok rejected, so a valid level costs
+one ok() call per object.
+"""
+import hashlib
+import json
+import re
+
+from level_core.objdata import required_override_count
+from level_core.resolver import ERROR, Diagnostic, format_path, object_label
+from level_core.rtid import (
+    CURRENT_LEVEL, LEVEL_MODULES, PLANT_TYPES, ZOMBIE_TYPES,
+)
+
+# ------------------------------------------------------------
+# Schema nodes
+# ------------------------------------------------------------
+def integer(minimum=None, maximum=None):
+    return {"type": "int", "min": minimum, "max": maximum}
+
+
+def number(minimum=None, maximum=None):
+    """int or float."""
+    return {"type": "number", "min": minimum, "max": maximum}
+
+
+def boolean():
+    return {"type": "bool"}
+
+
+def string(pattern=None):
+    """Any string, or one fully matching the regex pattern."""
+    return {"type": "str", "pattern": pattern}
+
+
+def one_of(*values):
+    return {"type": "enum", "values": list(values)}
+
+
+def rtid(namespace=None):
+    """An RTID(name@namespace) string (any namespace if None); names are the resolver's job."""
+    return {"type": "rtid", "namespace": namespace}
+
+
+def array(items, min_items=0, max_items=None):
+    return {"type": "list", "items": items, "min": min_items, "max": max_items}
+
+
+def record(required=None, optional=None, rules=()):
+    """A dict with the given fields; other keys are allowed (the game ignores them).
+
+    rules name cross-field checks from RULES, run once the fields themselves match.
+    """
+    return {
+        "type": "dict",
+        "required": dict(required or {}),
+        "optional": dict(optional or {}),
+        "rules": list(rules),
+    }
+
+
+def any_of(*schemas):
+    return {"type": "any", "schemas": list(schemas)}
+
+
+# ------------------------------------------------------------
+# Cross-field rules: objdata -> None, or (key, reason)
+# ------------------------------------------------------------
+def _flag_wave_overrides(data):
+    overrides = data.get("FlagWaveVeteranOverrideTypes")
+    if overrides is None or "WaveCount" not in data or "FlagWaveInterval" not in data:
+        return None
+    required = required_override_count(data["WaveCount"], data["FlagWaveInterval"])
+    if len(overrides) in (0, required):
+        return None
+    return ("FlagWaveVeteranOverrideTypes",
+            f"expected 0 or ceil(WaveCount / FlagWaveInterval) = {required} entries, got {len(overrides)}")
+
+
+RULES = {
+    "flag_wave_overrides": _flag_wave_overrides,
+}
+
+
+# ------------------------------------------------------------
+# Per-objclass schemas
+# ------------------------------------------------------------
+def _grid_placement(max_x, max_y, type_name=None, **optional):
+    return record(
+        {"GridX": integer(0, max_x), "GridY": integer(0, max_y), "TypeName": type_name or string()},
+        optional,
+    )
+
+
+def _conveyor_plant(type_key, type_schema):
+    return record(
+        {type_key: type_schema, "Weight": integer(0, 1000)},
+        {
+            "MaxCount": integer(0, 100),
+            "MinCount": integer(0, 100),
+            "MinCountCooldownSeconds": number(0, 9999),
+            "MaxCountCooldownSeconds": number(0, 9999),
+            "MaxWeightFactor": number(0, 10),
+            "MinWeightFactor": number(0, 10),
+        },
+    )
+
+
+_TIP = {"SuppressObjectiveTip": boolean()}
+
+SCHEMAS = {
+    "LevelDefinition": record(
+        {"Modules": array(rtid()), "StageModule": rtid(LEVEL_MODULES)},
+        {
+            "Description": string(),
+            "LevelNumber": integer(0),
+            "Loot": rtid(LEVEL_MODULES),
+            "Name": string(),
+            "WritenBy": string(),
+            "NormalPresentTable": string(),
+            "ShinyPresentTable": string(),
+            "MusicType": string(),
+            "StartingSun": any_of(integer(0), string(r"\d+")),
+        },
+    ),
+
+    # Waves
+    # LevelModules' RevertedWaveManagerProperties only sets the timings, so nothing is required
+    "WaveManagerProperties": record(
+        {},
+        {
+            "FlagWaveInterval": integer(1, 999),
+            "WaveCount": integer(1, 999),
+            "Waves": array(array(rtid(CURRENT_LEVEL))),
+            "FlagWaveVeteranOverrideTypes": array(integer()),
+            "MaxNextWaveHealthPercentage": number(0, 1),
+            "MinNextWaveHealthPercentage": number(0, 1),
+            "WaveSpendingPointIncrement": integer(0, 99999),
+            "WaveSpendingPoints": integer(0, 99999),
+            "ZombieCountdownFirstWaveSecs": number(0, 9999),
+            "ZombieCountdownFirstWaveConveyorSecs": number(0, 9999),
+            "ZombieCountdownHugeWaveDelay": number(0, 9999),
+        },
+        rules=["flag_wave_overrides"],
+    ),
+    "WaveManagerModuleProperties": record(
+        {"WaveManagerProps": rtid(CURRENT_LEVEL)},
+        {"DynamicZombies": array(record(
+            {"ZombiePool": array(rtid(ZOMBIE_TYPES))},
+            {
+                "PointIncrementPerWave": integer(0, 999999),
+                "StartingPoints": integer(0, 999999),
+                "StartingWave": integer(0, 9999),
+            },
+        ))},
+    ),
+    "SpawnZombiesJitteredWaveActionProps": record(
+        {"Zombies": array(record(
+            {"Type": rtid(ZOMBIE_TYPES)},
+            {"Row": integer(0, 5), "Column": integer(0, 9), "CarrySun": integer(0, 999)},
+        ))},
+        {
+            "AdditionalPlantfood": integer(0, 10),
+            "DynamicPlantfood": array(integer(0, 10)),
+            "MustKillAllToNextWave": boolean(),
+            "NotificationEvents": array(string()),
+        },
+    ),
+
+    # Seed bank / conveyor
+    "SeedBankProperties": record(optional={
+        "ExcludeListSunProducers": any_of(boolean(), one_of("true", "false")),
+        "PresetPlantList": array(record({"PlantType": string(".+")}, {"Level": integer()})),
+        "PlantExcludeList": array(string()),
+        "PlantIncludeList": array(string()),
+        "SelectionMethod": one_of("chooser", "preset"),
+        "OverrideSeedSlotsCount": integer(0, 8),
+        **_TIP,
+    }),
+    "ConveyorSeedBankProperties": record(
+        {
+            "DropDelayConditions": array(record({"Delay": number(1, 999), "MaxPackets": integer(0, 99)})),
+            "InitialPlantList": array(_conveyor_plant("PlantType", string(".+"))),
+            "SpeedConditions": array(record({"MaxPackets": integer(0, 99), "Speed": number(0, 999)})),
+        },
+    ),
+    "ModifyConveyorWaveActionProps": record(optional={
+        "Add": array(_conveyor_plant("Type", rtid(PLANT_TYPES))),
+        "Remove": array(_conveyor_plant("Type", rtid(PLANT_TYPES))),
+    }),
+
+    # Board setup
+    "InitialPlantProperties": record(
+        {"InitialPlantPlacements": array(_grid_placement(8, 4, Condition=string()))},
+    ),
+    "InitialZombieProperties": record(
+        {"InitialZombiePlacements": array(_grid_placement(8, 4, Condition=string()))},
+    ),
+    "InitialGridItemProperties": record(
+        {"InitialGridItemPlacements": array(_grid_placement(8, 4))},
+    ),
+    "GravestoneProperties": record(optional={
+        "GravestoneCount": integer(0, 45),
+        "SpawnColumnStart": integer(0, 9),
+        "SpawnColumnEnd": integer(0, 9),
+        "ForceSpawnData": array(_grid_placement(20, 5)),
+    }),
+    "TrapTileProperties": record({"TrapTiles": array(record({
+        "Group": one_of("flame", "boulder_forward"),
+        "Location": record({"mX": integer(0, 8), "mY": integer(0, 4)}),
+        "RecoverDelay": number(0, 999),
+    }))}),
+    "PowerTileProperties": record({"LinkedTiles": array(record(
+        {
+            "Group": one_of("alpha", "beta", "gamma", "delta", "epsilon"),
+            "Location": record({"mX": integer(0, 8), "mY": integer(0, 5)}),
+            "PropagationDelay": number(0, 100),
+        },
+        {"PropagationInitialDelay": number(0, 100)},
+    ))}),
+    "RailcartProperties": record({
+        "RailcartType": one_of(
+            "railcart_cowboy", "railcart_tutorial", "railcart_egypt", "railcart_pirate",
+            "railcart_kongfu", "railcart_future", "railcart_dark", "railcart_sky",
+        ),
+        "Railcarts": array(record({"Column": integer(0, 8), "Row": integer(0, 4)})),
+        "Rails": array(record({"Column": integer(0, 8), "RowStart": integer(0, 4), "RowEnd": integer(0, 4)})),
+    }),
+    "PiratePlankProperties": record({"PlankRows": array(integer(0, 4))}),
+    "ProtectThePlantChallengeProperties": record({
+        "MustProtectCount": integer(0, 999),
+        "Plants": array(record({
+            "GridX": integer(0, 8), "GridY": integer(0, 5), "PlantType": rtid(PLANT_TYPES),
+        })),
+    }),
+    "MoldColonyChallengeProps": record(
+        {"MoldMatrix": array(string("[01]{9}"), 5, 5)},
+        _TIP,
+    ),
+    "ZombiePotionModuleProperties": record(
+        {
+            "InitialPotionCount": integer(0, 45),
+            "MaxPotionCount": integer(0, 45),
+            "PotionSpawnTimer": record({"Min": number(0, 999), "Max": number(0, 999)}),
+            "PotionTypes": array(string(".+")),
+        },
+        _TIP,
+    ),
+    "LastStandMinigameProperties": record({
+        "StartingPlantfood": integer(0, 10),
+        "StartingSun": integer(0, 9999),
+    }),
+
+    # Star challenges
+    "StarChallengeModuleProperties": record(
+        {"Challenges": array(any_of(array(rtid(CURRENT_LEVEL)), rtid(CURRENT_LEVEL)))},
+        {"ChallengesAlwaysAvailable": boolean()},
+    ),
+    "StarChallengeBeatTheLevelProps": record(optional={
+        "Descriptions": array(string()),
+        "DescriptionsMultiLanguage": array(record(optional={"en": string(), "zh": string()})),
+    }),
+    "StarChallengeKillZombiesInTimeProps": record({
+        "Time": integer(1, 9999),
+        "ZombiesToKill": integer(1, 9999),
+    }),
+    "StarChallengePlantsLostProps": record({"MaximumPlantsLost": integer(0, 999)}),
+    "StarChallengeSimultaneousPlantsProps": record({"MaximumPlants": integer(1, 999)}),
+    "StarChallengeSunProducedProps": record({"TargetSun": integer(0)}),
+    "StarChallengeSunUsedProps": record({"MaximumSun": integer(0, 99999)}),
+    "StarChallengeZombieDistanceProps": record({"TargetDistance": number(0.1, 99)}),
+}
+
+
+# ------------------------------------------------------------
+# Compilation
+# ------------------------------------------------------------
+_compiled = {}   # schema hash -> (ok, explain)
+_by_class = {}   # objclass -> (ok, explain), or None when it has no schema
+
+_MISSING = object()
+
+
+def schema_hash(schema):
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+
+def compile_schema(schema):
+    """(ok, explain) for schema; equal schemas (by schema_hash) share one compiled pair."""
+    key = schema_hash(schema)
+    compiled = _compiled.get(key)
+    if compiled is None:
+        compiled = _compiled[key] = _COMPILERS[schema["type"]](schema)
+    return compiled
+
+
+def _bind(env, value):
+    name = f"_{len(env)}"
+    env[name] = value
+    return name
+
+
+def _test(schema, var, env):
+    """Python expression checking variable var against schema.
+
+    Scalars are inlined; unions try each form, nested lists and records
+    through their own compiled ok().
+    """
+    kind = schema["type"]
+    if kind in ("int", "number"):
+        if kind == "int":
+            parts = [f"type({var}) is int"]
+        else:
+            parts = [f"(type({var}) is int or type({var}) is float)"]
+        bounds = [var]
+        if schema["min"] is not None:
+            bounds.insert(0, repr(schema["min"]))
+        if schema["max"] is not None:
+            bounds.append(repr(schema["max"]))
+        if len(bounds) > 1:
+            parts.append(" <= ".join(bounds))
+        return "(" + " and ".join(parts) + ")"
+    if kind == "bool":
+        return f"({var} is True or {var} is False)"
+    if kind == "str":
+        if schema["pattern"] is None:
+            return f"type({var}) is str"
+        match = _bind(env, re.compile(schema["pattern"]).fullmatch)
+        return f"(type({var}) is str and {match}({var}) is not None)"
+    if kind == "enum":
+        values = _bind(env, frozenset(schema["values"]))
+        return f"(type({var}) is str and {var} in {values})"
+    if kind == "rtid":
+        # parse_rtid's test inlined (slices beat method calls): RTID(name@namespace)
+        namespace = schema["namespace"]
+        if namespace is not None:
+            suffix = f"@{namespace})"
+            return f"(type({var}) is str and {var}[:5] == 'RTID(' and {var}[-{len(suffix)}:] == {suffix!r})"
+        return (f"(type({var}) is str and {var}[:5] == 'RTID(' and {var}[-1:] == ')'"
+                f" and '@' in {var} and {var}[-2:] != '@)')")
+    if kind == "any":
+        return "(" + " or ".join(_test(s, var, env) for s in schema["schemas"]) + ")"
+    return f"{_bind(env, compile_schema(schema)[0])}({var})"
+
+
+def _emit(schema, var, env, body, indent=""):
+    """Append statements that return False unless var matches schema.
+
+    Lists and records are unrolled into the enclosing function, so a whole
+    objdata is checked without a Python call per entry.
+    """
+    kind = schema["type"]
+    if kind == "list":
+        lo, hi = schema["min"], schema["max"]
+        test = f"type({var}) is list"
+        if lo or hi is not None:
+            test += f" and {lo} <= len({var})" + ("" if hi is None else f" <= {hi}")
+        item = f"x{len(env)}"
+        env[item] = None  # reserve the name
+        body += [
+            f"{indent}if not ({test}):",
+            f"{indent}    return False",
+            f"{indent}for {item} in {var}:",
+        ]
+        _emit(schema["items"], item, env, body, indent + "    ")
+    elif kind == "dict":
+        # one get() per known field beats iterating the dict's items
+        missing = _bind(env, _MISSING)
+        get, item = f"{var}.get", f"x{len(env)}"
+        env[item] = None
+        body += [
+            f"{indent}if type({var}) is not dict:",
+            f"{indent}    return False",
+        ]
+        for name, field in schema["required"].items():
+            body += [
+                f"{indent}{item} = {get}({name!r}, {missing})",
+                f"{indent}if {item} is {missing}:",
+                f"{indent}    return False",
+            ]
+            _emit(field, item, env, body, indent)
+        optional = [(n, f) for n, f in schema["optional"].items() if n not in schema["required"]]
+        if optional:
+            # keys not checked yet; once all are seen the other optional fields are absent
+            left = f"left{len(env)}"
+            env[left] = None
+            body.append(f"{indent}{left} = len({var}) - {len(schema['required'])}")
+        for name, field in optional:
+            body += [
+                f"{indent}if {left}:",
+                f"{indent}    {item} = {get}({name!r}, {missing})",
+                f"{indent}    if {item} is not {missing}:",
+                f"{indent}        {left} -= 1",
+            ]
+            _emit(field, item, env, body, indent + "        ")
+        for name in schema["rules"]:
+            body += [
+                f"{indent}if {_bind(env, RULES[name])}({var}) is not None:",
+                f"{indent}    return False",
+            ]
+    else:
+        body += [f"{indent}if not {_test(schema, var, env)}:", f"{indent}    return False"]
+    return body
+
+
+def _function(schema):
+    env = {}
+    body = _emit(schema, "v", env, [])
+    # bound values become defaults: fast locals in the loops instead of global lookups
+    bound = "".join(f", {name}={name}" for name, value in env.items() if value is not None)
+    source = f"def ok(v{bound}):\n" + "".join(f"    {line}\n" for line in body) + "    return True\n"
+    exec(source, env)
+    return env["ok"]
+
+
+def _expected(schema):
+    kind = schema["type"]
+    if kind in ("int", "number"):
+        what = "an integer" if kind == "int" else "a number"
+        lo, hi = schema["min"], schema["max"]
+        if lo is not None and hi is not None:
+            return f"expected {what} in {lo}..{hi}"
+        if lo is not None:
+            return f"expected {what} >= {lo}"
+        if hi is not None:
+            return f"expected {what} <= {hi}"
+        return f"expected {what}"
+    if kind == "bool":
+        return "expected true or false"
+    if kind == "str":
+        if schema["pattern"] is None:
+            return "expected a string"
+        return f"expected a string matching {schema['pattern']}"
+    if kind == "enum":
+        return "expected one of " + ", ".join(schema["values"])
+    if kind == "rtid":
+        return f"expected an RTID(name@{schema['namespace'] or 'namespace'}) string"
+    return "does not match any allowed form"
+
+
+def _compile_leaf(schema):
+    ok = _function(schema)
+    reason = _expected(schema)
+
+    def explain(value, keys, out):
+        if not ok(value):
+            out.append((keys, reason, value))
+    return ok, explain
+
+
+def _compile_list(schema):
+    ok = _function(schema)
+    lo, hi = schema["min"], schema["max"]
+    item_ok, item_explain = compile_schema(schema["items"])
+    if hi is None:
+        size = f"at least {lo} entries"
+    elif lo == hi:
+        size = f"exactly {lo} entries"
+    else:
+        size = f"{lo}..{hi} entries"
+
+    def explain(value, keys, out):
+        if type(value) is not list:
+            out.append((keys, "expected a list", value))
+            return
+        if len(value) < lo or (hi is not None and len(value) > hi):
+            out.append((keys, f"expected {size}, got {len(value)}", value))
+        for i, item in enumerate(value):
+            if not item_ok(item):
+                item_explain(item, keys + (i,), out)
+    return ok, explain
+
+
+def _compile_dict(schema):
+    ok = _function(schema)
+    fields = {**schema["optional"], **schema["required"]}
+    rules = [RULES[name] for name in schema["rules"]]
+    compiled = {k: compile_schema(s) for k, s in fields.items()}
+
+    def explain(value, keys, out):
+        if type(value) is not dict:
+            out.append((keys, "expected an object", value))
+            return
+        valid = True
+        for k in schema["required"]:
+            if k not in value:
+                out.append((keys + (k,), "missing required field", None))
+                valid = False
+        for k, item in value.items():
+            field = compiled.get(k)
+            if field is not None and not field[0](item):
+                field[1](item, keys + (k,), out)
+                valid = False
+        if valid:
+            for rule in rules:
+                problem = rule(value)
+                if problem is not None:
+                    k, reason = problem
+                    out.append((keys + (k,), reason, value.get(k)))
+    return ok, explain
+
+
+_COMPILERS = {
+    "int": _compile_leaf,
+    "number": _compile_leaf,
+    "bool": _compile_leaf,
+    "str": _compile_leaf,
+    "enum": _compile_leaf,
+    "rtid": _compile_leaf,
+    "list": _compile_list,
+    "dict": _compile_dict,
+    "any": _compile_leaf,
+}
+
+
+def validator_for(objclass):
+    """Compiled (ok, explain) for objclass's objdata; None if it has no schema."""
+    try:
+        return _by_class[objclass]
+    except KeyError:
+        schema = SCHEMAS.get(objclass)
+        compiled = _by_class[objclass] = None if schema is None else compile_schema(schema)
+        return compiled
+
+
+# ------------------------------------------------------------
+# Checking
+# ------------------------------------------------------------
+def _describe(value, limit=60):
+    if value is None:
+        return ""
+    text = json.dumps(value, ensure_ascii=False)
+    return text if len(text) <= limit else text[:limit - 3] + "..."
+
+
+def _explain(obj, explain):
+    problems = []
+    explain(obj.get("objdata"), (), problems)
+    label = object_label(obj)
+    return [
+        Diagnostic(label, format_path(keys), _describe(value), reason, ERROR)
+        for keys, reason, value in problems
+    ]
+
+
+def check_object(obj):
+    """Schema diagnostics for one object; [] for valid or unknown objclasses."""
+    compiled = validator_for(obj.get("objclass"))
+    if compiled is None or compiled[0](obj.get("objdata")):
+        return []
+    return _explain(obj, compiled[1])
+
+
+def validate_level(objects):
+    """Schema diagnostics for every object (a LevelDocument or a list of
+    object dicts, LevelDefinition included), in order."""
+    diagnostics = []
+    by_class = _by_class
+    for obj in objects:
+        objclass = obj.get("objclass")
+        compiled = by_class[objclass] if objclass in by_class else validator_for(objclass)
+        if compiled is not None and not compiled[0](obj.get("objdata")):
+            diagnostics += _explain(obj, compiled[1])
+    return diagnostics
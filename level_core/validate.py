@@ -0,0 +1,195 @@
+"""Validate many level files from the command line.
+
+    python -m level_core.validate [options] PATH_OR_GLOB ...
+
+Directories are searched recursively for *.json / *.json5. Every level is
+checked for syntax, objdata schemas (level_core.schemas), references
+(level_core.resolver) and alias cycles / orphans (level_core.graph_analysis)
+on a pool of worker processes, each loading GameData and LevelModules once.
+One JSON object per level is written to stdout as it completes (JSON Lines,
+in path order) and a summary to stderr. The exit status is 1 if any level has
+an error, 0 otherwise.
+"""
+import json
+import os
+import sys
+
+from data_loader import GameData, LevelModules
+from level_core.graph_analysis import analyse_level
+from level_core.resolver import ERROR, Resolver, resolve_level
+from level_core.schemas import validate_level
+from level_parser import parse_level
+
+LEVEL_EXTENSIONS = (".json", ".json5")
+
+_resolver = None  # per worker process, see init_worker
+
+
+def init_worker(game_data="game_data.json", level_modules="LevelModules.json"):
+    """Load GameData / LevelModules once for this process (missing files only
+    turn their reference checks into warnings)."""
+    global _resolver
+    try:
+        GameData.load(game_data)
+    except FileNotFoundError:
+        pass
+    LevelModules.set_path(level_modules)
+    _resolver = Resolver()
+
+
+def level_paths(targets):
+    """Level files named by targets (files, directories or glob patterns),
+    sorted and without duplicates."""
+    import glob
+
+    paths = set()
+    for target in targets:
+        if os.path.isdir(target):
+            for root, _, files in os.walk(target):
+                paths.update(os.path.join(root, f) for f in files if f.lower().endswith(LEVEL_EXTENSIONS))
+        elif os.path.isfile(target):
+            paths.add(target)
+        else:
+            paths.update(p for p in glob.glob(target, recursive=True) if os.path.isfile(p))
+    return sorted(paths)
+
+
+def _problem(check, reason, path="", reference=""):
+    return {"check": check, "object": "", "path": path, "reference": reference,
+            "reason": reason, "severity": ERROR}
+
+
+def structure_problems(objects):
+    """Problems with the shape of objects that the other checks assume:
+    each is a dict with a str objclass, a dict objdata and a list of str aliases."""
+    problems = []
+    for i, obj in enumerate(objects):
+        where = f"objects[{i}]"
+        if not isinstance(obj, dict):
+            problems.append(_problem("structure", "expected an object", where))
+            continue
+        if not isinstance(obj.get("objclass"), str):
+            problems.append(_problem("structure", "objclass must be a string", where + ".objclass"))
+        if not isinstance(obj.get("objdata"), dict):
+            problems.append(_problem("structure", "objdata must be an object", where + ".objdata"))
+        aliases = obj.get("aliases", [])
+        if not isinstance(aliases, list) or not all(isinstance(a, str) for a in aliases):
+            problems.append(_problem("structure", "aliases must be a list of strings", where + ".aliases"))
+    return problems
+
+
+def _parse(raw):
+    """Level data from raw bytes; ValueError with the parser's message if invalid."""
+    try:
+        return parse_level(raw).data
+    except ImportError:
+        # json5 is not installed: the strict JSON error is the best we have
+        return json.loads(raw.decode("utf-8-sig"))
+
+
+def check_level(path):
+    """JSON-ready result for one level file:
+
+    {"path", "ok", "errors", "warnings", "diagnostics": [{"check", "object",
+    "path", "reference", "reason", "severity"}, ...]}
+    """
+    if _resolver is None:
+        init_worker()
+    problems = []
+    try:
+        with open(path, "rb") as f:
+            data = _parse(f.read())
+    except OSError as e:
+        problems.append(_problem("read", e.strerror or str(e)))
+    except ValueError as e:
+        problems.append(_problem("syntax", str(e)))
+    else:
+        objects = data.get("objects") if isinstance(data, dict) else None
+        if not isinstance(objects, list):
+            problems.append(_problem("structure", "expected an object whose \"objects\" is a list"))
+        else:
+            problems.extend(structure_problems(objects))
+        if not problems:
+            try:
+                for check, diagnostics in (
+                    ("schema", validate_level(objects)),
+                    ("reference", resolve_level(objects, _resolver)),
+                    ("graph", [d for _, d in analyse_level(data).diagnostics()]),
+                ):
+                    problems.extend({"check": check, **d._asdict()} for d in diagnostics)
+            except Exception as e:  # one odd file must not stop the batch
+                problems.append(_problem("internal", f"{type(e).__name__}: {e}"))
+
+    errors = sum(1 for p in problems if p["severity"] == ERROR)
+    return {
+        "path": path,
+        "ok": errors == 0,
+        "errors": errors,
+        "warnings": len(problems) - errors,
+        "diagnostics": problems,
+    }
+
+
+# ------------------------------------------------------------
+def main(argv=None):
+    import argparse
+    import time
+    from concurrent.futures import ProcessPoolExecutor
+
+    parser = argparse.ArgumentParser(
+        prog="python -m level_core.validate",
+        description="Validate level files (syntax, schemas, references, alias graph).",
+    )
+    parser.add_argument("targets", nargs="+", metavar="PATH_OR_GLOB",
+                        help="level file, directory (searched recursively) or glob pattern")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: one per CPU; 1 runs in this process)")
+    parser.add_argument("--game-data", default="game_data.json")
+    parser.add_argument("--level-modules", default="LevelModules.json")
+    parser.add_argument("--problems-only", action="store_true",
+                        help="only write lines for levels with errors or warnings")
+    args = parser.parse_args(argv)
+
+    paths = level_paths(args.targets)
+    if not paths:
+        parser.error("no level files found")
+    jobs = max(1, min(args.jobs, len(paths)))
+
+    t0 = time.perf_counter()
+    failed = warned = 0
+    if jobs == 1:
+        init_worker(args.game_data, args.level_modules)
+        results = map(check_level, paths)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(jobs, initializer=init_worker,
+                                   initargs=(args.game_data, args.level_modules))
+        # chunks amortise the inter-process round trips without starving workers at the end
+        chunksize = max(1, min(64, len(paths) // (jobs * 8)))
+        results = pool.map(check_level, paths, chunksize=chunksize)
+    try:
+        out = sys.stdout
+        for result in results:
+            if result["errors"]:
+                failed += 1
+            elif result["warnings"]:
+                warned += 1
+            if result["diagnostics"] or not args.problems_only:
+                out.write(json.dumps(result, ensure_ascii=False) + "\n")
+                out.flush()
+    except BrokenPipeError:
+        # e.g. piped into head: stop quietly, and keep Python's exit-time flush from failing too
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    elapsed = time.perf_counter() - t0
+    print(f"{len(paths)} level(s): {failed} with errors, {warned} with warnings only "
+          f"({elapsed:.1f} s, {jobs} worker(s))", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
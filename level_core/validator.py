@@ -0,0 +1,182 @@
+from level_core.graph_analysis import GraphReport
+from level_core.resolver import ERROR, Resolver
+from level_core.rtid import CURRENT_LEVEL, format_rtid, rtid_name
+from level_core.schemas import check_object
+
+
+class IncrementalValidator:
+    """Live reference and schema diagnostics for a LevelDocument.
+
+    Diagnostics are kept per object, together with a dependency map
+    (@CurrentLevel alias -> objects referencing it). On each document change
+    only the added / edited objects and the dependents of aliases that
+    appeared or disappeared are re-checked; a level load is one full pass.
+
+    Given the document's AliasGraph, cycles and orphans (graph_analysis) are
+    reported too. That analysis is linear in the level size, so it runs in
+    full on a level load only; afterwards the report is patched with the
+    aliases the graph says changed, and only their objects are re-checked.
+
+    listeners are called with the list of objects whose diagnostics changed
+    (removed objects included), or with None after a full revalidation.
+    """
+
+    def __init__(self, document, graph=None):
+        self.document = document
+        self.graph = graph
+        self._graph_report = None
+        self._graph_diagnostics = {}  # id(obj) -> [Diagnostic] from the graph report
+        self.listeners = []
+        self._resolver = Resolver(document.aliases())
+        self._diagnostics = {}  # id(obj) -> [Diagnostic]
+        self._refs = {}         # id(obj) -> @CurrentLevel aliases it references
+        self._dependents = {}   # alias -> {id(obj): obj}
+        self.revalidate_all()
+        document.subscribe(self._on_document_changed)
+
+    # --------------------------------------------------------
+    def _drop(self, key):
+        self._diagnostics.pop(key, None)
+        for alias in self._refs.pop(key, ()):
+            dependents = self._dependents.get(alias)
+            if dependents is not None:
+                dependents.pop(key, None)
+                if not dependents:
+                    del self._dependents[alias]
+
+    def _validate(self, obj):
+        """Re-check obj; returns whether its diagnostics changed."""
+        key = id(obj)
+        old_diagnostics = self._diagnostics.get(key, [])
+        self._drop(key)
+        references = []
+        diagnostics = check_object(obj) + self._resolver.check_object(obj, references)
+        if diagnostics:
+            self._diagnostics[key] = diagnostics
+        refs = set()
+        for reference in references:
+            alias = rtid_name(reference, CURRENT_LEVEL)
+            if alias is not None:
+                refs.add(alias)
+                self._dependents.setdefault(alias, {})[key] = obj
+        if refs:
+            self._refs[key] = refs
+        return diagnostics != old_diagnostics
+
+    def _rebuild_graph_report(self):
+        """Rerun the whole graph analysis (level load)."""
+        self._graph_diagnostics = {}
+        if self.graph is None:
+            return
+        self.graph.take_changed()
+        self._graph_report = GraphReport(self.document, self.graph)
+        for obj, d in self._graph_report.diagnostics():
+            self._graph_diagnostics.setdefault(id(obj), []).append(d)
+
+    def _update_graph_report(self, touched):
+        """Patch the graph report; returns the objects whose graph diagnostics changed."""
+        if self.graph is None:
+            return []
+        aliases = self.graph.take_changed()
+        if aliases:
+            aliases = self._graph_report.update(aliases)
+        objects = dict(touched)
+        for alias in aliases:
+            for obj in self.document.objects_with_alias(alias):
+                objects[id(obj)] = obj
+        changed = []
+        for key, obj in objects.items():
+            diagnostics = self._graph_report.diagnostics_for(obj)
+            if diagnostics == self._graph_diagnostics.get(key, []):
+                continue
+            if diagnostics:
+                self._graph_diagnostics[key] = diagnostics
+            else:
+                del self._graph_diagnostics[key]
+            changed.append(obj)
+        return changed
+
+    def _notify(self, changed):
+        for callback in list(self.listeners):
+            callback(changed)
+
+    def revalidate_all(self):
+        self._resolver.set_level_aliases(self.document.aliases())
+        self._diagnostics = {}
+        self._refs = {}
+        self._dependents = {}
+        for obj in self.document:
+            self._validate(obj)
+        self._rebuild_graph_report()
+        self._notify(None)
+
+    def _on_document_changed(self, change):
+        if change.reset:
+            self.revalidate_all()
+            return
+        if change.moved and not (change.added or change.removed or change.updated):
+            return  # same diagnostics; the order is the document's
+
+        changed = {}
+        for obj in change.removed:
+            if obj not in self.document:
+                key = id(obj)
+                if key in self._diagnostics or key in self._graph_diagnostics:
+                    changed[key] = obj
+                self._drop(key)
+                self._graph_diagnostics.pop(key, None)
+
+        touched = {}
+        for obj in change.added + change.updated:
+            if obj in self.document:
+                touched[id(obj)] = obj
+        aliases = set()
+        for names in (change.aliases_added, change.aliases_removed):
+            for group in names.values():
+                aliases.update(group)
+        self._resolver.forget(format_rtid(alias, CURRENT_LEVEL) for alias in aliases)
+        for alias in aliases:
+            touched.update(self._dependents.get(alias, {}))
+
+        for key, obj in touched.items():
+            if self._validate(obj):
+                changed[key] = obj
+
+        for obj in self._update_graph_report(touched):
+            changed[id(obj)] = obj
+        if changed:
+            self._notify(list(changed.values()))
+
+    # --------------------------------------------------------
+    def graph_report(self):
+        return self._graph_report
+
+    def diagnostics(self):
+        """Every current diagnostic as (object, Diagnostic): schemas and
+        references in document order, then cycles and orphans."""
+        result = []
+        if self._diagnostics:
+            result = [(obj, d) for obj in self.document for d in self._diagnostics.get(id(obj), ())]
+        if self._graph_report is not None:
+            result.extend(self._graph_report.diagnostics())
+        return result
+
+    def diagnostics_for(self, obj):
+        """Schema, reference and graph diagnostics of one object."""
+        key = id(obj)
+        return self._diagnostics.get(key, []) + self._graph_diagnostics.get(key, [])
+
+    def dependents(self, alias):
+        """Objects whose objdata references RTID(alias@CurrentLevel)."""
+        return list(self._dependents.get(alias, {}).values())
+
+    def _all(self):
+        for group in (self._diagnostics, self._graph_diagnostics):
+            for diagnostics in group.values():
+                yield from diagnostics
+
+    def error_count(self):
+        return sum(d.severity == ERROR for d in self._all())
+
+    def problem_count(self):
+        return sum(1 for _ in self._all())
@@ -0,0 +1,113 @@
+import json
+import os
+import threading
+
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
+
+from level_core.level import split_level
+from level_core.schemas import validate_level
+from level_parser import parse_level
+
+
+class LoadCancelled(Exception):
+    pass
+
+
+def read_level(path, progress=None, is_cancelled=None, chunk_size=1 << 20):
+    """Read, parse and pretty-print a level file (no Qt, safe to call from a worker thread).
+
+    progress(percent) is called as the file is read and parsed; is_cancelled()
+    is polled between steps and raises LoadCancelled when it returns True.
+    """
+    progress = progress or (lambda percent: None)
+    is_cancelled = is_cancelled or (lambda: False)
+
+    def checkpoint(percent):
+        if is_cancelled():
+            raise LoadCancelled()
+        progress(percent)
+
+    # Reading: 0-40 %
+    size = os.path.getsize(path) or 1
+    chunks = []
+    done = 0
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            done += len(chunk)
+            checkpoint(min(40, done * 40 // size))
+    # Parsing: 40-80 %
+    data, backend = parse_level(b"".join(chunks))
+    checkpoint(80)
+
+    # Text for the JSON editor tab: 80-100 %
+    pretty = json.dumps(data, indent=2, ensure_ascii=False)
+    level_def, other_objs = split_level(data)
+    schema_diagnostics = validate_level(data.get("objects", []))
+    checkpoint(100)
+
+    return {
+        "path": path,
+        "data": data,
+        "text": pretty,
+        "parser": backend,
+        "level_definition": level_def,
+        "objects": other_objs,
+        "schema_diagnostics": schema_diagnostics,
+    }
+
+
+class LevelLoadWorker(QObject):
+    """Runs read_level() on a QThread and reports back through signals."""
+    progress = pyqtSignal(int)
+    loaded = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+    finished = pyqtSignal()
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self._cancel_requested = threading.Event()
+
+    def cancel(self):
+        """Safe to call from any thread. Call it directly, not through a signal:
+        a queued slot on this worker would only run once run() has returned."""
+        self._cancel_requested.set()
+
+    def is_cancelled(self):
+        return self._cancel_requested.is_set()
+
+    def run(self):
+        try:
+            result = read_level(self.path, self.progress.emit, self.is_cancelled)
+        except LoadCancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            if self.is_cancelled():
+                self.cancelled.emit()
+            else:
+                self.loaded.emit(result)
+        finally:
+            self.finished.emit()
+
+
+def start_level_load(path, parent):
+    """Start a LevelLoadWorker for path on its own QThread; returns (thread, worker).
+
+    Connect the worker's signals before the event loop runs again. The thread
+    quits and both objects are deleted once the worker finishes.
+    """
+    thread = QThread(parent)
+    worker = LevelLoadWorker(path)
+    worker.moveToThread(thread)
+    thread.started.connect(worker.run)
+    worker.finished.connect(thread.quit)
+    worker.finished.connect(worker.deleteLater)
+    thread.finished.connect(thread.deleteLater)
+    return thread, worker
@@ -0,0 +1,56 @@
+"""Level file parsing: strict JSON first, json5 only when that fails.
+
+Almost every level is strict JSON, which the C-accelerated parsers handle
+orders of magnitude faster than the pure-Python json5 package. If orjson is
+installed it is tried first.
+"""
+import json
+from collections import namedtuple
+
+try:
+    import orjson
+except ImportError:  # optional fast backend
+    orjson = None
+
+ParsedLevel = namedtuple("ParsedLevel", ["data", "backend"])
+
+BACKEND_ORJSON = "orjson"
+BACKEND_JSON = "json"
+BACKEND_JSON5 = "json5"
+
+
+def available_backends():
+    backends = [BACKEND_JSON, BACKEND_JSON5]
+    if orjson is not None:
+        backends.insert(0, BACKEND_ORJSON)
+    return backends
+
+
+def parse_level(raw, fast=True):
+    """Parse level text (str or UTF-8 bytes) and return ParsedLevel(data, backend).
+
+    backend names the parser that succeeded. Errors come from json5, the most
+    permissive parser, so its message describes the real problem.
+    """
+    if isinstance(raw, (bytes, bytearray)):
+        if fast and orjson is not None:
+            try:
+                return ParsedLevel(orjson.loads(raw), BACKEND_ORJSON)
+            except orjson.JSONDecodeError:
+                pass
+        text = bytes(raw).decode("utf-8-sig")
+    else:
+        text = raw[1:] if raw.startswith("\ufeff") else raw
+        if fast and orjson is not None:
+            try:
+                return ParsedLevel(orjson.loads(text), BACKEND_ORJSON)
+            except orjson.JSONDecodeError:
+                pass
+
+    try:
+        return ParsedLevel(json.loads(text), BACKEND_JSON)
+    except ValueError:
+        pass
+
+    import json5  # imported lazily: slow to import and rarely needed
+    return ParsedLevel(json5.loads(text), BACKEND_JSON5)
@@ -5,7 +5,9 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 from data_loader import GameData
-import re
+from level_core.level_definition import (
+    build_level_definition, default_settings, mower_choices, parse_level_definition, stage_choices
+)
 
 class LevelDefinitionTab(QWidget):
     """Tab for customizing the LevelDefinition core object."""
@@ -16,16 +18,12 @@ class LevelDefinitionTab(QWidget):
         form = QFormLayout()
 
         # Editable fields
-        self.description = QLineEdit("Description")
-        self.level_number = QLineEdit("1")
-        self.name = QLineEdit("Unnamed Level")
-        self.written_by = QLineEdit("unnamed")
-        self.starting_sun = QLineEdit("50")
-
-        # Fixed internal fields (not user editable)
-        self.loot = "RTID(DefaultLoot@LevelModules)"
-        self.normal_table = "egypt_normal_01"
-        self.shiny_table = "egypt_shiny_01"
+        defaults = default_settings()
+        self.description = QLineEdit(defaults["description"])
+        self.level_number = QLineEdit(defaults["level_number"])
+        self.name = QLineEdit(defaults["name"])
+        self.written_by = QLineEdit(defaults["written_by"])
+        self.starting_sun = QLineEdit(defaults["starting_sun"])
 
         # MusicType selection
         self.music_type = QComboBox()
@@ -34,12 +32,12 @@ class LevelDefinitionTab(QWidget):
 
         # Stage module selection
         self.stage_module = QComboBox()
-        self.stage_module.addItems(GameData.get_flat_list("Stages"))
+        self.stage_module.addItems(stage_choices())
 
         # Mower module selection
         self.mower_module = QComboBox()
         self.mower_module.addItem("None")
-        self.mower_module.addItems(GameData.get_flat_list("Lawn Mowers"))
+        self.mower_module.addItems(mower_choices())
 
         # -------- Modules selection (3 columns, show plain names) --------
         self.modules_area = QScrollArea()
@@ -54,19 +52,11 @@ class LevelDefinitionTab(QWidget):
         self.module_checkboxes = []
         modules = GameData.get_flat_list("Modules")  # list các tên (X), không phải RTID
 
-        # Auto-check specific default modules
-        default_auto_check = {
-            "ZombiesDeadWinCon",
-            "DefaultZombieWinCondition",
-            "StandardIntro",
-            "DefaultSunDropper",
-        }
-
         # tạo checkbox theo lưới 3 cột
         cols = 3
         for idx, name in enumerate(modules):
             cb = QCheckBox(name)
-            if name in default_auto_check:
+            if name in defaults["modules"]:  # auto-check default modules
                 cb.setCheckState(Qt.CheckState.Checked)
             self.module_checkboxes.append((name, cb))
             r = idx // cols
@@ -93,95 +83,45 @@ class LevelDefinitionTab(QWidget):
         self.setLayout(self.layout)
 
     # --------------------------------------------------------
-    def build_level_definition(self, alias_modules):
-        """Return the JSON object for LevelDefinition."""
-        # Thu thập modules đã check, và bọc lại thành RTID(X@LevelModules)
-        modules = []
-        for name, cb in self.module_checkboxes:
-            if cb.checkState() == Qt.CheckState.Checked:
-                modules.append(f"RTID({name}@LevelModules)")
-
-        # Add mower module if not None
-        if self.mower_module.currentText() != "None":
-            mower_ref = f"RTID({self.mower_module.currentText()}@LevelModules)"
-            if mower_ref not in modules:
-                modules.append(mower_ref)
-
-        # Add CurrentLevel modules based on aliases (auto)
-        for alias in alias_modules:
-            modules.append(f"RTID({alias}@CurrentLevel)")
-
-        # Remove duplicates while preserving order
-        seen = set()
-        modules = [m for m in modules if not (m in seen or seen.add(m))]
-
-        objdata = {
-            "Description": self.description.text(),
-            "LevelNumber": int(self.level_number.text() or 1),
-            "Loot": self.loot,
-            "Modules": modules,
-            "Name": self.name.text(),
-            "WritenBy": self.written_by.text(),
-            "NormalPresentTable": self.normal_table,
-            "ShinyPresentTable": self.shiny_table,
-            "StageModule": f"RTID({self.stage_module.currentText()}@LevelModules)"
-        }
-
-        # Handle MusicType: omit if "None"
-        if self.music_type.currentText() != "None":
-            objdata["MusicType"] = self.music_type.currentText()
-
-        # Handle Starting Sun
-        if self.starting_sun.text() != "50":
-            objdata["StartingSun"] = self.starting_sun.text() 
+    def get_settings(self):
+        """Current field values, in the shape level_core.level_definition expects."""
+        def optional(combo):
+            return None if combo.currentText() == "None" else combo.currentText()
 
         return {
-            "objclass": "LevelDefinition",
-            "objdata": objdata
+            "description": self.description.text(),
+            "level_number": self.level_number.text(),
+            "name": self.name.text(),
+            "written_by": self.written_by.text(),
+            "starting_sun": self.starting_sun.text(),
+            "music_type": optional(self.music_type),
+            "stage": self.stage_module.currentText(),
+            "mower": optional(self.mower_module),
+            "modules": [
+                name for name, cb in self.module_checkboxes
+                if cb.checkState() == Qt.CheckState.Checked
+            ],
         }
 
+    def build_level_definition(self, alias_modules):
+        """Return the JSON object for LevelDefinition."""
+        return build_level_definition(self.get_settings(), alias_modules)
+
     # --------------------------------------------------------
     def load_from_json(self, data):
         """Restore UI from JSON data."""
-        self.description.setText(data.get("Description", ""))
-        self.level_number.setText(str(data.get("LevelNumber", 1)))
-        self.name.setText(data.get("Name", ""))
-        self.written_by.setText(data.get("WritenBy", ""))
-        self.starting_sun.setText(data.get("Starting", "50"))
-
-        # Stage module
-        stage = data.get("StageModule", "")
-        if "@LevelModules" in stage:
-            name = stage.replace("RTID(", "").replace("@LevelModules)", "")
-            if name in [self.stage_module.itemText(i) for i in range(self.stage_module.count())]:
-                self.stage_module.setCurrentText(name)
-
-        # Music type
-        music = data.get("MusicType", "None")
-        if music in ["MiniGame_A", "MiniGame_B"]:
-            self.music_type.setCurrentText(music)
-        else:
-            self.music_type.setCurrentText("None")
-
-        # Detect mower module from existing Modules
-        mower_found = None
-        for m in data.get("Modules", []):
-            if "mower" in m.lower():  # check substring
-                mower_name = m.replace("RTID(", "").replace("@LevelModules)", "")
-                mower_found = mower_name
-                break
-
-        if mower_found and mower_found in [self.mower_module.itemText(i) for i in range(self.mower_module.count())]:
-            self.mower_module.setCurrentText(mower_found)
-        else:
-            self.mower_module.setCurrentText("None")
-
-        # Restore module check states (parse RTID(X@LevelModules) -> name)
-        checked_names = set()
-        for m in data.get("Modules", []):
-            if m.startswith("RTID(") and "@LevelModules)" in m:
-                name = m[len("RTID("):m.index("@LevelModules)")]
-                checked_names.add(name)
-
+        settings = parse_level_definition(data)
+        self.description.setText(settings["description"])
+        self.level_number.setText(settings["level_number"])
+        self.name.setText(settings["name"])
+        self.written_by.setText(settings["written_by"])
+        self.starting_sun.setText(settings["starting_sun"])
+
+        if settings["stage"]:
+            self.stage_module.setCurrentText(settings["stage"])
+        self.music_type.setCurrentText(settings["music_type"] or "None")
+        self.mower_module.setCurrentText(settings["mower"] or "None")
+
+        checked_names = set(settings["modules"])
         for name, cb in self.module_checkboxes:
-            cb.setCheckState(Qt.CheckState.Checked if name in checked_names else Qt.CheckState.Unchecked)
\ No newline at end of file
+            cb.setCheckState(Qt.CheckState.Checked if name in checked_names else Qt.CheckState.Unchecked)
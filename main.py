@@ -1,73 +1,83 @@
+import argparse
 import sys
-from PyQt6.QtWidgets import QApplication
-from editor_window import EditorWindow
+
+from startup_profiler import StartupProfiler
 from data_loader import GameData
 
-def __init__():
-    from editors.protect_the_plant import ProtectThePlantDialog
-    from editors.base import ObjectEditorFactory
-    from editors.spawn_zombies import SpawnZombiesJitteredDialog
-    from editors.wave_manager import WaveManagerDialog
-    from editors.wave_manager_module import WaveManagerModuleDialog
-    from editors.gravestone_properties import GravestonePropertiesDialog
-    from editors.zombie_potion_module import ZombiePotionModuleDialog
-    from editors.seedbank_properties import SeedBankPropertiesDialog
-    from editors.last_stand import LastStandMinigameDialog
-    from editors.conveyor_seedbank import ConveyorSeedBankDialog
-    from editors.modify_conveyor import ModifyConveyorDialog
-    from editors.power_tile_properties import PowerTileDialog
-    from editors.mold_colony_challenge import MoldColonyChallengeDialog
-    from editors.pirate_plank_properties import PiratePlankDialog
-    from editors.star_challenge_beat_level import StarChallengeBeatTheLevelDialog
-    from editors.star_challenge_kill_zombies_time import StarChallengeKillZombiesInTimeDialog
-    from editors.star_challenge_plants_lost import StarChallengePlantsLostDialog
-    from editors.star_challenge_simultaneous_plants import StarChallengeSimultaneousPlantsDialog
-    from editors.star_challenge_sun_produced import StarChallengeSunProducedDialog
-    from editors.star_challenge_zombie_distance import StarChallengeZombieDistanceDialog
-    from editors.star_challenge_module import StarChallengeModuleDialog
-    from editors.star_challenge_sun_used import StarChallengeSunUsedPropsDialog
-    from editors.initial_grid_item import InitialGridItemDialog
-    from editors.initial_plant_properties import InitialPlantPropertiesEditor
-    from editors.initial_zombie_properties import InitialZombiePropertiesEditor
-    from editors.trap_tile_properties import TrapTilePropertiesEditor
-    from editors.railcart_properties import RailcartPropertiesDialog
-
-    ObjectEditorFactory.register("RailcartProperties", RailcartPropertiesDialog)
-    ObjectEditorFactory.register("TrapTileProperties", TrapTilePropertiesEditor)
-    ObjectEditorFactory.register("InitialZombieProperties", InitialZombiePropertiesEditor)
-    ObjectEditorFactory.register("InitialPlantProperties", InitialPlantPropertiesEditor)
-    ObjectEditorFactory.register("InitialGridItemProperties", InitialGridItemDialog)
-    ObjectEditorFactory.register("PiratePlankProperties", PiratePlankDialog)
-    ObjectEditorFactory.register("MoldColonyChallengeProps", MoldColonyChallengeDialog)
-    ObjectEditorFactory.register("PowerTileProperties", PowerTileDialog)
-    ObjectEditorFactory.register("ModifyConveyorWaveActionProps", ModifyConveyorDialog)
-    ObjectEditorFactory.register("ConveyorSeedBankProperties", ConveyorSeedBankDialog)
-    ObjectEditorFactory.register("LastStandMinigameProperties", LastStandMinigameDialog)
-    ObjectEditorFactory.register("SeedBankProperties", SeedBankPropertiesDialog)
-    ObjectEditorFactory.register("GravestoneProperties", GravestonePropertiesDialog)
-    ObjectEditorFactory.register("ZombiePotionModuleProperties", ZombiePotionModuleDialog)
-    ObjectEditorFactory.register("ProtectThePlantChallengeProperties", ProtectThePlantDialog)
-    ObjectEditorFactory.register("WaveManagerProperties", WaveManagerDialog)
-    ObjectEditorFactory.register("SpawnZombiesJitteredWaveActionProps", SpawnZombiesJitteredDialog)
-    ObjectEditorFactory.register("WaveManagerModuleProperties", WaveManagerModuleDialog)
-    ObjectEditorFactory.register("StarChallengeBeatTheLevelProps", StarChallengeBeatTheLevelDialog)
-    ObjectEditorFactory.register("StarChallengeKillZombiesInTimeProps", StarChallengeKillZombiesInTimeDialog)
-    ObjectEditorFactory.register("StarChallengePlantsLostProps", StarChallengePlantsLostDialog)
-    ObjectEditorFactory.register("StarChallengeSimultaneousPlantsProps", StarChallengeSimultaneousPlantsDialog)
-    ObjectEditorFactory.register("StarChallengeSunProducedProps", StarChallengeSunProducedDialog)
-    ObjectEditorFactory.register("StarChallengeZombieDistanceProps", StarChallengeZombieDistanceDialog)
-    ObjectEditorFactory.register("StarChallengeModuleProperties", StarChallengeModuleDialog)
-    ObjectEditorFactory.register("StarChallengeSunUsedProps", StarChallengeSunUsedPropsDialog)
-
-    try:
-        GameData.load("game_data.json")
-    except Exception as e:
-        print(f"⚠️ Failed to load game_data.json: {e}")
+def __init__(profiler=None):
+    profiler = profiler or StartupProfiler(enabled=False)
+
+    with profiler.phase("editor registration"):
+        from editors.base import ObjectEditorFactory
+        from editors.manifest import EDITOR_MANIFEST
+
+        # Dialog modules are imported on the first create() for their objclass
+        ObjectEditorFactory.register_manifest(EDITOR_MANIFEST)
+
+    with profiler.phase("GameData.load"):
+        try:
+            GameData.load("game_data.json")
+        except Exception as e:
+            print(f"⚠️ Failed to load game_data.json: {e}")
+
+
+def parse_args(argv):
+    """Split our own options from the ones left for QApplication."""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument(
+        "--profile-startup", nargs="?", const="", default=None, metavar="REPORT.json",
+        help="print a per-phase startup breakdown; also write it as JSON if a path is given"
+    )
+    args, rest = parser.parse_known_args(argv[1:])
+    return args, argv[:1] + rest
+
+
+def main(argv):
+    args, qt_argv = parse_args(argv)
+    profiler = StartupProfiler(enabled=args.profile_startup is not None)
+
+    with profiler.phase("Qt import"):
+        from PyQt6.QtWidgets import QApplication
+        from PyQt6.QtCore import QTimer
+
+    __init__(profiler)
+
+    with profiler.phase("QApplication"):
+        app = QApplication(qt_argv)
+
+    with profiler.phase("EditorWindow import"):
+        from editor_window import EditorWindow
+
+    with profiler.phase("EditorWindow build"):
+        window = EditorWindow()
+
+    startup_load = window.load_startup_level()  # timed by the "tutorial level loaded" mark
+
+    with profiler.phase("window.show"):
+        window.show()
+
+    if profiler.enabled:
+        # The tutorial level is read on a worker thread and put into the tabs
+        # from the event loop: the report waits for both.
+        waiting = {"first event loop tick"}
+        if startup_load is not None:
+            waiting.add("tutorial level loaded")
+
+        def reached(name):
+            profiler.mark(name)
+            waiting.discard(name)
+            if not waiting:
+                print(profiler.format_table())
+                if args.profile_startup:
+                    profiler.write_json(args.profile_startup)
+
+        QTimer.singleShot(0, lambda: reached("first event loop tick"))
+        if startup_load is not None:
+            # finished is queued after loaded, so this runs once _on_level_loaded is done
+            startup_load.finished.connect(lambda: reached("tutorial level loaded"))
+
+    return app.exec()
 
 
 if __name__ == "__main__":
-    __init__()
-    app = QApplication(sys.argv)
-    window = EditorWindow()
-    window.show()
-    sys.exit(app.exec())
\ No newline at end of file
+    sys.exit(main(sys.argv))
@@ -0,0 +1,147 @@
+import json
+
+from PyQt6.QtCore import QAbstractListModel, QMimeData, QModelIndex, Qt
+from PyQt6.QtWidgets import QAbstractItemView, QListView
+
+
+def object_label(obj):
+    alias_text = ", ".join(obj.get("aliases", []))
+    return f"{obj.get('objclass', '?')} (aliases: {alias_text or 'None'})"
+
+
+class ObjectsListModel(QAbstractListModel):
+    """List model over a LevelDocument for the Objects tab.
+
+    Rows are the document's objects; labels are computed on demand, so
+    loading a level is one model reset whatever its size. Drag & drop carries
+    the document uids of the dragged rows and moves them by index.
+    """
+    MIME_TYPE = "application/x-ge-editor-object-uids"
+    ObjectRole = Qt.ItemDataRole.UserRole
+    UidRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, document, parent=None):
+        super().__init__(parent)
+        self.document = document
+
+    # ---------------------- read ----------------------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.document)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self.document):
+            return None
+        obj = self.document[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return object_label(obj)
+        if role == self.ObjectRole:
+            return obj
+        if role == self.UidRole:
+            return self.document.uid(obj)
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.ItemIsDropEnabled
+        return (Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+                | Qt.ItemFlag.ItemIsDragEnabled)
+
+    # ---------------------- edits ----------------------
+    def reset(self, objects):
+        """Replace the whole document (level load) with a single model reset."""
+        self.beginResetModel()
+        self.document.reset(objects)
+        self.endResetModel()
+
+    def append(self, obj):
+        row = len(self.document)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.document.append(obj)
+        self.endInsertRows()
+        return row
+
+    def remove_row(self, row):
+        """Remove and return the object at row."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        obj = self.document.pop(row)
+        self.endRemoveRows()
+        return obj
+
+    def refresh_row(self, row):
+        """The object at row changed (aliases/objdata); repaint its label."""
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def replay(self, fn):
+        """Run fn (undo/redo: any mix of row changes) under one model reset."""
+        self.beginResetModel()
+        try:
+            return fn()
+        finally:
+            self.endResetModel()
+
+    def moveRows(self, source_parent, source_row, count, destination_parent, destination_child):
+        if source_parent.isValid() or destination_parent.isValid() or count <= 0:
+            return False
+        if source_row <= destination_child <= source_row + count:
+            return False  # dropped onto itself
+        if not self.beginMoveRows(QModelIndex(), source_row, source_row + count - 1,
+                                  QModelIndex(), destination_child):
+            return False
+        self.document.move_block(source_row, count, destination_child)
+        self.endMoveRows()
+        return True
+
+    # ---------------------- drag & drop ----------------------
+    def supportedDropActions(self):
+        return Qt.DropAction.MoveAction
+
+    def mimeTypes(self):
+        return [self.MIME_TYPE]
+
+    def mimeData(self, indexes):
+        rows = sorted({i.row() for i in indexes if i.isValid()})
+        mime = QMimeData()
+        mime.setData(self.MIME_TYPE, json.dumps([self.document.uid_at(r) for r in rows]).encode())
+        return mime
+
+    def dropMimeData(self, data, action, row, column, parent):
+        if action != Qt.DropAction.MoveAction or not data.hasFormat(self.MIME_TYPE):
+            return False
+        uids = set(json.loads(bytes(data.data(self.MIME_TYPE)).decode()))
+        dest = row if row >= 0 else (parent.row() if parent.isValid() else len(self.document))
+
+        # uid -> row, one pass; rows are only moved by index afterwards
+        rows = [r for r in range(len(self.document)) if self.document.uid_at(r) in uids]
+        if not rows:
+            return False
+        self._move_rows(rows, dest)
+        # The rows are already moved: returning False stops the view from
+        # removing the "source" rows afterwards as it would for a copy+delete move.
+        return False
+
+    def _move_rows(self, rows, dest):
+        """The whole drop as one document.move_rows: one change, one undo step."""
+        self.layoutAboutToBeChanged.emit()
+        old_objects = list(self.document)
+        with self.document.batch():
+            self.document.move_rows(rows, dest)
+
+        new_row = {id(o): r for r, o in enumerate(self.document)}
+        old_indexes = self.persistentIndexList()
+        self.changePersistentIndexList(
+            old_indexes, [self.index(new_row[id(old_objects[i.row()])]) for i in old_indexes]
+        )
+        self.layoutChanged.emit()
+
+
+class ObjectsListView(QListView):
+    """QListView whose internal moves go through the model's dropMimeData.
+
+    With InternalMove, QListView.dropEvent moves a selection with one moveRow
+    call per row (one undo step each); QAbstractItemView.dropEvent hands the
+    whole drop to dropMimeData instead.
+    """
+
+    def dropEvent(self, event):
+        QAbstractItemView.dropEvent(self, event)
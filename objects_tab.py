@@ -1,24 +1,32 @@
 import json
-import re
 import copy
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QFormLayout, QHBoxLayout,
     QComboBox, QLineEdit, QPushButton, QLabel,
-    QListWidget, QMessageBox, QDialog, QInputDialog
+    QListView, QMessageBox, QInputDialog
 )
-from PyQt6.QtGui import QShortcut, QKeySequence
-from editors.base import ObjectEditorFactory, ReferenceLineEdit
+from PyQt6.QtGui import QShortcut, QKeySequence, QGuiApplication
+from editors.base import ObjectEditorFactory
 from data_loader import GameData
-from PyQt6.QtCore import Qt
+from level_core import aliases
+from level_core.alias_graph import AliasGraph
+from level_core.clipboard import CLIPBOARD, dependency_closure, paste_plan
+from level_core.document import LevelDocument
+from level_core.references import remap_references
+from level_core.refactor import RenameError, rename_aliases
+from level_core.validator import IncrementalValidator
+from level_core.history import History
+from objects_model import ObjectsListModel, ObjectsListView
+from PyQt6.QtCore import Qt, QMimeData
 
 class ObjectsTab(QWidget):
     """Tab for creating and managing 'objects' array in JSON."""
-    clipboard = None  # in-memory full-object clipboard
+    CLIPBOARD_MIME = "application/x-ge-editor-objects"
 
     def __init__(self, editor_reference):
         super().__init__()
         self.editor_reference = editor_reference
-        self.objects = []  # List of added objects
+        self.document = LevelDocument()  # added objects + alias/objclass indexes
 
         # Layouts
         main_layout = QVBoxLayout()
@@ -27,17 +35,10 @@ class ObjectsTab(QWidget):
         # --- Build mapping display_name -> code_name ---
         self.objclass_display_map = {}
 
-        objclasses = GameData.get("Objclasses")
-        # Build mapping: display name -> code (sorted by display name)
-        temp_map = {}
-
-        for entry in objclasses:
-            code = entry.get("code", "")
-            name = entry.get("name", code)
-            temp_map[name] = code
-
         # Sort alphabetically by display name
-        self.objclass_display_map = dict(sorted(temp_map.items(), key=lambda x: x[0].lower()))
+        self.objclass_display_map = dict(
+            sorted(GameData.name_map("Objclasses").items(), key=lambda x: x[0].lower())
+        )
 
         # Object selection and alias
         self.objclass = QComboBox()
@@ -61,33 +62,49 @@ class ObjectsTab(QWidget):
         btn_copy = QPushButton("📋 Copy")
         btn_copy.clicked.connect(self.copy_object)
 
+        btn_copy_deps = QPushButton("📋 Copy + Dependencies")
+        btn_copy_deps.clicked.connect(self.copy_with_dependencies)
+
         btn_paste = QPushButton("📥 Paste")
         btn_paste.clicked.connect(self.paste_object)
 
+        btn_where_used = QPushButton("🔎 Where Used")
+        btn_where_used.clicked.connect(self.show_where_used)
+
         button_layout = QHBoxLayout()
         button_layout.addWidget(btn_add)
         button_layout.addWidget(btn_remove)
         button_layout.addWidget(btn_copy)
+        button_layout.addWidget(btn_copy_deps)
         button_layout.addWidget(btn_paste)
+        button_layout.addWidget(btn_where_used)
 
         # List of added objects
-        self.objects_list = QListWidget()
-        self.objects_list.itemDoubleClicked.connect(self.edit_object)
-
-        # Enable drag & drop reordering
-        self.objects_list.setDragDropMode(QListWidget.DragDropMode.InternalMove)
+        self.objects_model = ObjectsListModel(self.document, self)
+        self.objects_list = ObjectsListView()
+        self.objects_list.setModel(self.objects_model)
+        self.objects_list.setUniformItemSizes(True)  # no per-row size queries on big levels
+        self.objects_list.doubleClicked.connect(self.edit_object)
+
+        # Enable drag & drop reordering (one drop = one document.move_rows)
+        self.objects_list.setDragDropMode(QListView.DragDropMode.InternalMove)
         self.objects_list.setDefaultDropAction(Qt.DropAction.MoveAction)
 
-        # Sync data after reordering
-        self.objects_list.model().rowsMoved.connect(self.on_rows_moved)
-
-        # Keyboard shortcuts (Ctrl+C / Ctrl+V)
+        # Keyboard shortcuts (Ctrl+C / Ctrl+Shift+C / Ctrl+V / Ctrl+Shift+V)
         self.sc_copy = QShortcut(QKeySequence.StandardKey.Copy, self)
         self.sc_copy.activated.connect(self.copy_object)
+        self.sc_copy_deps = QShortcut(QKeySequence("Ctrl+Shift+C"), self)
+        self.sc_copy_deps.activated.connect(self.copy_with_dependencies)
         self.sc_paste = QShortcut(QKeySequence.StandardKey.Paste, self)
         self.sc_paste.activated.connect(self.paste_object)
         self.sc_paste_raw = QShortcut(QKeySequence("Ctrl+Shift+V"), self)
         self.sc_paste_raw.activated.connect(self.paste_object_raw)
+        self.sc_where_used = QShortcut(QKeySequence("Ctrl+U"), self)
+        self.sc_where_used.activated.connect(self.show_where_used)
+        self.sc_undo = QShortcut(QKeySequence.StandardKey.Undo, self)
+        self.sc_undo.activated.connect(self.undo)
+        self.sc_redo = QShortcut(QKeySequence("Ctrl+Y"), self)
+        self.sc_redo.activated.connect(self.redo)
 
         main_layout.addLayout(form_layout)
         main_layout.addLayout(button_layout)
@@ -95,60 +112,51 @@ class ObjectsTab(QWidget):
         main_layout.addWidget(self.objects_list)
 
         self.setLayout(main_layout)
-        self.alias_tree = {}  # key = parent alias, value = list of child aliases
+        # parent alias -> child aliases; follows the document's change notifications
+        self.alias_graph = AliasGraph(self.document)
+        # undo/redo steps keep references to old object versions, not copies
+        self.history = History(self.document)
+        # per-object reference diagnostics (re-checked only where an edit can matter),
+        # plus reference cycles and orphans
+        self.validator = IncrementalValidator(self.document, self.alias_graph)
 
     # ----------------------- HELPERS -----------------------
+    @property
+    def objects(self):
+        """Added objects; the LevelDocument itself, usable as a read-only list."""
+        return self.document
+
+    def current_row(self):
+        index = self.objects_list.currentIndex()
+        return index.row() if index.isValid() else -1
+
+    def selected_rows(self):
+        return sorted({i.row() for i in self.objects_list.selectionModel().selectedRows()})
+
+    def select_object(self, obj):
+        """Make obj the current row (e.g. from the Problems panel)."""
+        if obj in self.document:
+            index = self.objects_model.index(self.document.index_of(obj))
+            self.objects_list.setCurrentIndex(index)
+            self.objects_list.scrollTo(index)
+
+    def show_status(self, message, timeout=3000):
+        window = self.window()
+        if hasattr(window, "statusBar"):
+            window.statusBar().showMessage(message, timeout)
+
     def existing_aliases(self):
-        aliases = []
-        for o in self.objects:
-            for a in o.get("aliases", []):
-                aliases.append(a)
-        return set(aliases)
+        return self.document.aliases()
 
     def next_wave_alias(self):
-        # Find highest WaveN and return Wave{N+1}
-        max_n = 0
-        wave_re = re.compile(r"^Wave(\d+)$", re.IGNORECASE)
-        for a in self.existing_aliases():
-            m = wave_re.match(a)
-            if m:
-                try:
-                    max_n = max(max_n, int(m.group(1)))
-                except ValueError:
-                    pass
-        return f"Wave{max_n+1 if max_n >= 0 else 1}"
+        return self.document.next_wave_alias()
 
-    def unique_alias(self, base):
+    def unique_alias(self, base, taken=()):
         # Ensure alias is unique by appending numeric suffixes if needed
-        existing = self.existing_aliases()
-        if base not in existing:
-            return base
-        i = 1
-        while True:
-            candidate = f"{base}{i}"
-            if candidate not in existing:
-                return candidate
-            i += 1
+        return self.document.unique_alias(base, taken)
 
     def derive_alias_from_class(self, cls_name):
-        # Special case
-        if cls_name == "SpawnZombiesJitteredWaveActionProps":
-            return self.next_wave_alias()
-
-        # Generic: strip trailing 'Properties' (case-insensitive)
-        if cls_name.lower().endswith("challengeproperties"):
-            base = cls_name[: -len("challengeproperties")]
-        elif cls_name.lower().endswith("props"):
-            base = cls_name[: -len("props")]
-        elif cls_name.lower().endswith("properties"):
-            base = cls_name[: -len("properties")]
-        else:
-            base = cls_name
-
-        if base.lower().startswith("starchallenge"):
-            base = base[len("StarChallenge"):]
-        base = base or "Object"
-        return self.unique_alias(base)
+        return self.document.derive_alias_from_class(cls_name)
 
     def suggest_alias_for_current_class(self):
         display_name = self.objclass.currentText()
@@ -159,50 +167,14 @@ class ObjectsTab(QWidget):
         self.aliases_input.setText(suggested)
 
     # --------------------- ALIAS EXTRACTION ---------------------
-    def _extract_aliases_from_objdata(self, obj):
-        """Recursively extract RTID(xxx@CurrentLevel) children for 1 object."""
-        child_aliases = []
-
-        def extract_aliases(node):
-            if isinstance(node, dict):
-                for v in node.values():
-                    extract_aliases(v)
-            elif isinstance(node, list):
-                for v in node:
-                    extract_aliases(v)
-            elif isinstance(node, str):
-                if node.startswith("RTID(") and "@CurrentLevel)" in node:
-                    name = node.replace("RTID(", "").replace("@CurrentLevel)", "")
-                    if name not in child_aliases:
-                        child_aliases.append(name)
-
-        # Special handling for StarChallengeModuleProperties: Challenges can be list[list[str]] or list[str]
-        if obj["objclass"] == "StarChallengeModuleProperties":
-            challenges = obj["objdata"].get("Challenges", [])
-            if isinstance(challenges, list):
-                for group in challenges:
-                    if isinstance(group, list):
-                        for ref in group:
-                            if isinstance(ref, str) and ref.startswith("RTID(") and "@CurrentLevel)" in ref:
-                                name = ref.replace("RTID(", "").replace("@CurrentLevel)", "")
-                                if name not in child_aliases:
-                                    child_aliases.append(name)
-                    elif isinstance(group, str) and "RTID(" in group:
-                        name = group.replace("RTID(", "").replace("@CurrentLevel)", "")
-                        if name not in child_aliases:
-                            child_aliases.append(name)
-        else:
-            extract_aliases(obj["objdata"])
-
-        return list(set(child_aliases))
+    @property
+    def alias_tree(self):
+        """key = parent alias, value = list of child aliases"""
+        return self.alias_graph.tree()
 
     def rebuild_alias_tree(self):
         """Recompute alias->children mapping from scratch for all objects."""
-        self.alias_tree = {}
-        for obj in self.objects:
-            child_aliases = self._extract_aliases_from_objdata(obj)
-            for parent_alias in obj.get("aliases", []):
-                self.alias_tree[parent_alias] = child_aliases
+        self.alias_graph.reset()
 
     # ----------------------------------------------------------
     def add_object(self):
@@ -249,66 +221,64 @@ class ObjectsTab(QWidget):
         # Add object to list
         obj = {"objclass": objclass, "objdata": objdata}
         if aliases_text:
-            obj["aliases"] = [a.strip() for a in aliases_text.split(",") if a.strip()]
+            obj["aliases"] = aliases.parse_alias_list(aliases_text)
 
-        self.objects.append(obj)
-        self.objects_list.addItem(f"{objclass} (aliases: {aliases_text or 'None'})")
+        self.objects_model.append(obj)
         self.aliases_input.clear()
 
         # Convenience: if user is adding many Waves in a row, prefill next WaveN
         if objclass == "SpawnZombiesJitteredWaveActionProps":
             self.aliases_input.setText(self.next_wave_alias())
 
-        # --- rebuild alias tree globally (robust for all ops)
-        self.rebuild_alias_tree()
-
-        # refresh reference completers everywhere
-        for dlg in self.findChildren(QDialog):
-            for edit in dlg.findChildren(QLineEdit):
-                if isinstance(edit, ReferenceLineEdit):
-                    edit.object_list = self.objects
-                    edit.refresh_suggestions()
 
     # ----------------------------------------------------------
-    def edit_object(self, item):
-        """Double-click to open the registered dialog for editing (including aliases)."""
-        index = self.objects_list.row(item)
-        obj = self.objects[index]
+    def edit_object(self, model_index):
+        """Double-click to open the registered dialog for editing (including aliases).
+
+        Both dialogs run before anything is applied: a level load may replace
+        the document while they are open, so the object is looked up again by
+        uid afterwards and its new aliases + objdata go in as one undo step.
+        """
+        obj = self.objects[model_index.row()]
+        uid = self.document.uid(obj)
+        edit = self._ask_object_edit(obj)
+        if edit is None:
+            return
+        index = self.document.index_of_uid(uid)
+        if index is None:
+            QMessageBox.warning(self, "Object Gone", "The object was removed while it was being edited.")
+            return
+        self._apply_object_edit(index, *edit)
+        # Update list display text
+        self.objects_model.refresh_row(index)
+
+    def _ask_object_edit(self, obj):
+        """(alias list or None, objdata or None) from the dialogs; None to give up."""
         objclass = obj["objclass"]
 
         # --- Edit aliases first
-        alias_before = list(obj.get("aliases", []))
-        alias_text = ", ".join(alias_before)
-
+        alias_text = ", ".join(obj.get("aliases", []))
         new_aliases_text, ok_alias = QInputDialog.getText(
             self,
             "Edit Aliases",
             f"Edit aliases for {objclass} (comma separated):",
             text=alias_text
         )
+        new_aliases = None
         if ok_alias:
-            new_aliases = [a.strip() for a in new_aliases_text.split(",") if a.strip()]
+            new_aliases = aliases.parse_alias_list(new_aliases_text)
             if not new_aliases:
                 QMessageBox.warning(self, "Alias Required", "You must keep at least one alias for this object.")
-                return
-            # Enforce uniqueness when user edits (ignore collisions with self)
-            deduped = []
-            current_aliases = self.existing_aliases() - set(alias_before)
-            for a in new_aliases:
-                if a in current_aliases:
-                    a = self.unique_alias(a)
-                deduped.append(a)
-            obj["aliases"] = deduped
+                return None
 
         # --- Edit objdata
-        dlg = ObjectEditorFactory.create(objclass, parent=self, existing_data=obj["objdata"])
+        # Dialogs may edit what they are given in place; history still holds this objdata
+        newdata = None
+        dlg = ObjectEditorFactory.create(objclass, parent=self, existing_data=copy.deepcopy(obj["objdata"]))
         if dlg is not None:
             dlg.object_list_ref = self.objects
             if dlg.exec() == dlg.DialogCode.Accepted:
                 newdata = dlg.get_data()
-                if newdata is None:
-                    return
-                obj["objdata"] = newdata
         else:
             # fallback manual JSON edit
             text, ok = QInputDialog.getMultiLineText(
@@ -319,171 +289,164 @@ class ObjectsTab(QWidget):
             )
             if ok:
                 try:
-                    obj["objdata"] = json.loads(text)
+                    newdata = json.loads(text)
                 except Exception as e:
                     QMessageBox.warning(self, "Invalid JSON", str(e))
-                    return
-
-        # Update list display text
-        alias_display = ", ".join(obj.get("aliases", [])) or "None"
-        item.setText(f"{objclass} (aliases: {alias_display})")
-        self.objects[index] = obj
-
-        # --- rebuild alias tree since aliases/objdata may have changed
-        self.rebuild_alias_tree()
-
-        # refresh completers
-        for dlg in self.findChildren(QDialog):
-            for edit in dlg.findChildren(QLineEdit):
-                if isinstance(edit, ReferenceLineEdit):
-                    edit.object_list = self.objects
-                    edit.refresh_suggestions()
+                    return None
+        return new_aliases, newdata
+
+    def _apply_object_edit(self, index, new_aliases, newdata):
+        obj = self.document[index]
+        renames = {}
+        deduped = None
+        if new_aliases is not None:
+            alias_before = list(obj.get("aliases", []))
+            # Enforce uniqueness when user edits (ignore collisions with self)
+            deduped = []
+            for a in new_aliases:
+                if self.document.has_alias(a) and a not in alias_before:
+                    a = self.unique_alias(a, taken=deduped)
+                if a in deduped:
+                    continue  # typed twice
+                deduped.append(a)
+            # An alias replaced in place is a rename: rewrite the RTIDs that point at it
+            renames = {
+                old: new for old, new in zip(alias_before, deduped)
+                if old != new and old not in deduped and new not in alias_before
+            }
+
+        rewritten = 0
+        try:
+            with self.document.batch():  # aliases + objdata = one undo step
+                if renames:
+                    rewritten = rename_aliases(self.document, self.alias_graph, renames)
+                if deduped is not None and obj.get("aliases", []) != deduped:
+                    self.document.set_aliases(index, deduped)
+                if newdata is not None:
+                    # the dialog started from the objdata before the renames
+                    self.document.set_objdata(index, remap_references(newdata, renames))
+        except RenameError as e:
+            QMessageBox.warning(self, "Cannot Rename", f"Nothing was changed: {e}")
+            return
+        if rewritten:
+            self.show_status(
+                f"Renamed {len(renames)} alias(es), updated references in {rewritten} object(s)", 3000
+            )
 
     # ----------------------------------------------------------
     def remove_object(self):
         """Remove selected item(s)."""
-        selected = self.objects_list.selectedItems()
+        selected = self.selected_rows()
         if not selected:
             return
-        # Remove from data & UI
-        for item in selected:
-            idx = self.objects_list.row(item)
-            self.objects_list.takeItem(idx)
-            self.objects.pop(idx)
-
-        # --- rebuild alias tree after removal
-        self.rebuild_alias_tree()
-
-        # refresh completers
-        for dlg in self.findChildren(QDialog):
-            for edit in dlg.findChildren(QLineEdit):
-                if isinstance(edit, ReferenceLineEdit):
-                    edit.object_list = self.objects
-                    edit.refresh_suggestions()
+        # Remove from data & UI (bottom-up so the remaining rows keep their index)
+        with self.document.batch():
+            for idx in reversed(selected):
+                self.objects_model.remove_row(idx)
+
+    # ----------------------- UNDO / REDO -----------------------
+    def undo(self):
+        self.objects_model.replay(self.history.undo)
+
+    def redo(self):
+        self.objects_model.replay(self.history.redo)
 
     # ----------------------- COPY / PASTE -----------------------
+    # The clipboard is process-wide (level_core.clipboard.CLIPBOARD) and is
+    # mirrored as JSON on the system clipboard for other editor windows.
+    def _copy_objects(self, objects):
+        CLIPBOARD.set(objects)
+        mime = QMimeData()
+        payload = CLIPBOARD.to_json()
+        mime.setData(self.CLIPBOARD_MIME, payload.encode("utf-8"))
+        mime.setText(payload)
+        QGuiApplication.clipboard().setMimeData(mime)
+
+    def _selected_objects(self, title):
+        rows = self.selected_rows() or ([self.current_row()] if self.current_row() >= 0 else [])
+        if not rows:
+            QMessageBox.warning(self, title, "Please select an object to copy.")
+        return [self.objects[r] for r in rows]
+
     def copy_object(self):
-        """Copy selected object (deep) into in-memory clipboard."""
-        idx = self.objects_list.currentRow()
-        if idx < 0:
-            QMessageBox.warning(self, "Copy Object", "Please select an object to copy.")
+        """Copy the selected object(s) into the clipboard (copy-on-write snapshots)."""
+        objects = self._selected_objects("Copy Object")
+        if objects:
+            self._copy_objects(objects)
+
+    def copy_with_dependencies(self):
+        """Copy the selected object(s) plus every object they reference, transitively."""
+        objects = self._selected_objects("Copy with Dependencies")
+        if not objects:
             return
-        ObjectsTab.clipboard = copy.deepcopy(self.objects[idx])
+        closure = dependency_closure(self.document, self.alias_graph, objects)
+        self._copy_objects(closure)
+        self.show_status(
+            f"Copied {len(closure)} object(s) ({len(closure) - len(objects)} dependencies)", 3000
+        )
 
-    def paste_object(self):
-        """Paste a copied object as a new one; aliases auto-uniq'ed."""
-        if not ObjectsTab.clipboard:
+    def _clipboard_objects(self):
+        mime = QGuiApplication.clipboard().mimeData()
+        if mime is not None and mime.hasFormat(self.CLIPBOARD_MIME):
+            CLIPBOARD.load_json(bytes(mime.data(self.CLIPBOARD_MIME)).decode("utf-8"))
+        if CLIPBOARD.is_empty():
             QMessageBox.warning(self, "Paste Object", "Clipboard is empty. Copy an object first.")
-            return
-
-        new_obj = copy.deepcopy(ObjectsTab.clipboard)
+            return None
+        return CLIPBOARD.objects
 
-        # Ensure aliases exist and are unique
-        aliases = new_obj.get("aliases", [])
-        if not aliases:
-            aliases = ["PastedObject"]
-        aliases = [self.unique_alias(a) for a in aliases]
-        new_obj["aliases"] = aliases
-
-        # Append & show
-        self.objects.append(new_obj)
-        alias_text = ", ".join(aliases)
-        self.objects_list.addItem(f"{new_obj['objclass']} (aliases: {alias_text})")
-
-        # --- rebuild alias tree after paste
-        self.rebuild_alias_tree()
+    def _paste(self, rename):
+        objects = self._clipboard_objects()
+        if objects is None:
+            return
+        new_objects, _ = paste_plan(objects, self.document, rename=rename)
+        with self.document.batch():  # one notification, one undo step
+            for obj in new_objects:
+                self.objects_model.append(obj)
 
-        # Refresh reference completers
-        for dlg in self.findChildren(QDialog):
-            for edit in dlg.findChildren(QLineEdit):
-                if isinstance(edit, ReferenceLineEdit):
-                    edit.object_list = self.objects
-                    edit.refresh_suggestions()
+    def paste_object(self):
+        """Paste the copied object(s); colliding aliases are renamed and references follow."""
+        self._paste(rename=True)
 
     def paste_object_raw(self):
-        """Paste a copied object as a new one, keeping original alias names."""
-        if not ObjectsTab.clipboard:
-            QMessageBox.warning(self, "Paste Object", "Clipboard is empty. Copy an object first.")
+        """Paste the copied object(s), keeping original alias names."""
+        objects = self._clipboard_objects()
+        if objects is None:
             return
-
-        new_obj = copy.deepcopy(ObjectsTab.clipboard)
-        aliases = new_obj.get("aliases", [])
-
-        if not aliases:
+        if any(not obj.get("aliases") for obj in objects):
             QMessageBox.warning(self, "Invalid Object", "The copied object has no aliases.")
             return
-
-        # Append object as-is
-        self.objects.append(new_obj)
-        alias_text = ", ".join(aliases)
-        self.objects_list.addItem(f"{new_obj['objclass']} (aliases: {alias_text})")
-
-        # --- rebuild alias tree after paste raw
-        self.rebuild_alias_tree()
-
-        # Refresh all completers
-        for dlg in self.findChildren(QDialog):
-            for edit in dlg.findChildren(QLineEdit):
-                if isinstance(edit, ReferenceLineEdit):
-                    edit.object_list = self.objects
-                    edit.refresh_suggestions()
+        self._paste(rename=False)
 
     # ----------------------------------------------------------
     def load_from_json(self, objects):
         """Load existing objects from file."""
-        self.objects = []
-        self.objects_list.clear()
-        for obj in objects:
-            self.objects.append(obj)
-            alias_text = ", ".join(obj.get("aliases", []))
-            self.objects_list.addItem(f"{obj['objclass']} (aliases: {alias_text or 'None'})")
-
-        # --- rebuild alias tree after loading
-        self.rebuild_alias_tree()
+        # one model reset, labels are built on demand; the alias graph rebuilds on the reset notification
+        self.objects_model.reset(objects)
 
     def get_root_aliases(self):
         """Return only aliases that are not referenced as children anywhere."""
-        all_children = set()
-        for childs in self.alias_tree.values():
-            all_children.update(childs)
-
-        roots = []
-        for obj in self.objects:
-            for alias in obj.get("aliases", []):
-                if alias not in all_children:
-                    roots.append(alias)
-        return roots
-    
-    def on_rows_moved(self, parent, start, end, destination, row):
-        """
-        Sync internal self.objects[] when user drag/drops items in QListWidget.
-        """
-        # QListWidget has already moved the visible item.
-        # Now we must reorder self.objects to match the list.
-
-        # Build new order from QListWidget
-        new_order = []
-        for i in range(self.objects_list.count()):
-            text = self.objects_list.item(i).text()
-            # find matching object
-            for obj in self.objects:
-                alias_text = ", ".join(obj.get("aliases", [])) or "None"
-                if text == f"{obj['objclass']} (aliases: {alias_text})":
-                    new_order.append(obj)
-                    break
-
-        # Replace internal array
-        if len(new_order) == len(self.objects):
-            self.objects = new_order
-        else:
-            print("Warning: reorder sync mismatch!")
-
-        # Rebuild alias tree because order might affect module chains
-        self.rebuild_alias_tree()
-
-        # Refresh all autocomplete reference editors
-        for dlg in self.findChildren(QDialog):
-            for edit in dlg.findChildren(QLineEdit):
-                if hasattr(edit, "object_list"):
-                    edit.object_list = self.objects
-                    edit.refresh_suggestions()
\ No newline at end of file
+        return self.alias_graph.root_aliases()
+
+    def where_used(self, alias):
+        """[(referencing alias, its objclass)] for alias, from the reverse index."""
+        result = []
+        for ref in self.alias_graph.referrers(alias):
+            owner = self.document.get(ref)
+            result.append((ref, owner["objclass"] if owner else "?"))
+        return result
+
+    def show_where_used(self):
+        """List the objects referencing the selected object's aliases."""
+        idx = self.current_row()
+        if idx < 0:
+            QMessageBox.warning(self, "Where Used", "Please select an object first.")
+            return
+        lines = []
+        for alias in self.document[idx].get("aliases", []):
+            users = self.where_used(alias)
+            if users:
+                lines.append(f"{alias} is referenced by:")
+                lines.extend(f"  - {ref} ({objclass})" for ref, objclass in users)
+            else:
+                lines.append(f"{alias} is not referenced (added to LevelDefinition.Modules)")
+        QMessageBox.information(self, "Where Used", "\n".join(lines) or "This object has no aliases.")
@@ -0,0 +1,126 @@
+from PyQt6.QtWidgets import QDockWidget, QListWidget, QListWidgetItem
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+
+from level_core.resolver import ERROR
+
+
+class ProblemsPanel(QDockWidget):
+    """Dock listing the Objects tab's live schema and reference diagnostics.
+
+    Follows an IncrementalValidator: only the rows of objects whose
+    diagnostics changed are replaced, and several changes in one event-loop
+    turn are applied together. Each object's rows are kept together, so the
+    row of an object comes from a cached map rather than from searching the
+    list. Activating a row emits object_activated(obj).
+    """
+    object_activated = pyqtSignal(object)
+    ObjectRole = Qt.ItemDataRole.UserRole
+    SeverityRole = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, parent=None):
+        super().__init__("Problems", parent)
+        self.setObjectName("ProblemsPanel")
+        self.validator = None
+        self._rows = {}        # id(obj) -> [QListWidgetItem], in list order
+        self._first_row = None  # id(obj) -> row of its first item; None once sizes changed
+        self._pending = {}     # id(obj) -> obj, waiting for _apply
+        self._rebuild = False  # a full rebuild is waiting instead
+        self._scheduled = False
+        self._errors = 0
+        self._warnings = 0
+
+        self.list = QListWidget()
+        self.list.setUniformItemSizes(True)
+        self.list.itemActivated.connect(self._on_item_activated)
+        self.setWidget(self.list)
+
+    def set_validator(self, validator):
+        self.validator = validator
+        validator.listeners.append(self.schedule_refresh)
+        self.refresh()
+
+    def schedule_refresh(self, changed=None):
+        """changed: objects whose diagnostics changed, None for all of them."""
+        if changed is None:
+            self._rebuild = True
+            self._pending.clear()
+        elif not self._rebuild:
+            self._pending.update((id(obj), obj) for obj in changed)
+        if not self._scheduled:
+            self._scheduled = True
+            QTimer.singleShot(0, self._apply)
+
+    def _apply(self):
+        self._scheduled = False
+        if self._rebuild:
+            self.refresh()
+            return
+        pending, self._pending = self._pending, {}
+        first_row = self._row_map()
+        # bottom-up, so replacing rows never moves those still to be replaced;
+        # objects without rows yet go last, appended at the end
+        for key in sorted(pending, key=lambda k: first_row.get(k, -1), reverse=True):
+            self._replace_rows(key, pending[key], first_row.get(key, self.list.count()))
+        self._update_title()
+
+    def refresh(self):
+        """Rebuild the whole list from the validator."""
+        self._rebuild = False
+        self._pending = {}
+        self.list.clear()
+        self._rows = {}
+        self._first_row = None
+        self._errors = self._warnings = 0
+        if self.validator is not None:
+            for obj, d in self.validator.diagnostics():
+                self._rows.setdefault(id(obj), []).append(self._make_item(obj, d))
+            for items in self._rows.values():
+                for item in items:
+                    self.list.addItem(item)
+        self._update_title()
+
+    # --------------------------------------------------------
+    def _make_item(self, obj, d):
+        if d.severity == ERROR:
+            self._errors += 1
+        else:
+            self._warnings += 1
+        icon = "❌" if d.severity == ERROR else "⚠️"
+        item = QListWidgetItem(f"{icon} {d.object}  {d.path}: {d.reference} — {d.reason}")
+        item.setData(self.ObjectRole, obj)
+        item.setData(self.SeverityRole, d.severity)
+        return item
+
+    def _row_map(self):
+        if self._first_row is None:
+            self._first_row = {}
+            row = 0
+            for key, items in self._rows.items():
+                self._first_row[key] = row
+                row += len(items)
+        return self._first_row
+
+    def _replace_rows(self, key, obj, row):
+        """Swap obj's rows (starting at row) for its current diagnostics."""
+        old = self._rows.get(key, ())
+        for item in old:
+            if item.data(self.SeverityRole) == ERROR:
+                self._errors -= 1
+            else:
+                self._warnings -= 1
+            self.list.takeItem(row)
+        items = [self._make_item(obj, d) for d in self.validator.diagnostics_for(obj)]
+        for offset, item in enumerate(items):
+            self.list.insertItem(row + offset, item)
+        if items:
+            self._rows[key] = items  # a new key goes last, like its rows
+        else:
+            self._rows.pop(key, None)
+        if len(items) != len(old):
+            self._first_row = None
+
+    def _update_title(self):
+        self.setWindowTitle(f"Problems ({self._errors} errors, {self._warnings} warnings)")
+
+    def _on_item_activated(self, item):
+        self.object_activated.emit(item.data(self.ObjectRole))
@@ -0,0 +1,71 @@
+import json
+import platform
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+
+class StartupProfiler:
+    """Times named startup phases with a monotonic clock (main.py --profile-startup)."""
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.phases = []  # [(name, seconds)] in execution order
+        self._t0 = time.perf_counter()
+        self._last = self._t0  # end of the latest phase or mark
+
+    @contextmanager
+    def phase(self, name):
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._last = time.perf_counter()
+            self.phases.append((name, self._last - start))
+
+    def mark(self, name):
+        """Record the time elapsed since the end of the previous phase or mark."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.phases.append((name, now - self._last))
+        self._last = now
+
+    def measured(self):
+        return sum(seconds for _, seconds in self.phases)
+
+    def total(self):
+        return time.perf_counter() - self._t0
+
+    # --------------------------------------------------------
+    def format_table(self):
+        total = self.total()
+        width = max([len(name) for name, _ in self.phases] + [len("Phase")])
+        lines = [f"{'Phase':<{width}}  {'ms':>9}  {'share':>6}", "-" * (width + 19)]
+        for name, seconds in self.phases:
+            share = seconds / total * 100 if total else 0.0
+            lines.append(f"{name:<{width}}  {seconds * 1000:9.1f}  {share:5.1f}%")
+        lines.append("-" * (width + 19))
+        lines.append(f"{'total':<{width}}  {total * 1000:9.1f}")
+        return "\n".join(lines)
+
+    def as_dict(self):
+        return {
+            "version": 1,
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "frozen": bool(getattr(sys, "frozen", False)),
+            "total_ms": round(self.total() * 1000, 3),
+            "phases": [
+                {"name": name, "ms": round(seconds * 1000, 3)} for name, seconds in self.phases
+            ],
+        }
+
+    def write_json(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.as_dict(), f, indent=2)
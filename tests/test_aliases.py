@@ -0,0 +1,17 @@
+from level_core.document import LevelDocument
+
+
+def test_unique_alias_skips_taken():
+    document = LevelDocument([{"aliases": ["A"], "objclass": "StageModuleProperties", "objdata": {}}])
+
+    # "A1, A" typed for another object: A1 is accepted first, so A must not become A1 too
+    assert document.unique_alias("A") == "A1"
+    assert document.unique_alias("A", taken=["A1"]) == "A2"
+    assert document.unique_alias("B", taken=["A1"]) == "B"
+
+
+def test_zero_suffix_alias_can_be_removed():
+    document = LevelDocument([{"aliases": ["Wave0"], "objclass": "SpawnZombiesJitteredWaveActionProps", "objdata": {}}])
+
+    document.set_aliases(0, ["Opening"])
+    assert document.next_wave_alias() == "Wave1"
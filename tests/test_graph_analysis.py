@@ -0,0 +1,43 @@
+import random
+
+from level_core.alias_graph import AliasGraph
+from level_core.document import LevelDocument
+from level_core.graph_analysis import GraphReport
+
+
+def ref(alias):
+    return f"RTID({alias}@CurrentLevel)"
+
+
+def make_object(alias, children):
+    return {"aliases": [alias], "objclass": "StageModuleProperties",
+            "objdata": {"Refs": [ref(c) for c in children]}}
+
+
+def summary(report):
+    cycles = {frozenset(c) for c in report.cycles}
+    return cycles, {id(obj) for obj in report.orphans}
+
+
+def test_update_matches_full_analysis():
+    rng = random.Random(7)
+    names = [f"N{i}" for i in range(30)]
+    document = LevelDocument([make_object(n, rng.sample(names, 2)) for n in names[:20]])
+    graph = AliasGraph(document, debug=True)
+    report = GraphReport(document, graph)
+
+    for _ in range(300):
+        op = rng.random()
+        if op < 0.5 and len(document):
+            # point an object at other aliases
+            index = rng.randrange(len(document))
+            document.set_objdata(index, {"Refs": [ref(c) for c in rng.sample(names, rng.randint(0, 3))]})
+        elif op < 0.7 and len(document):
+            index = rng.randrange(len(document))
+            document.set_aliases(index, [rng.choice(names)])
+        elif op < 0.85 and len(document):
+            document.pop(rng.randrange(len(document)))
+        else:
+            document.append(make_object(rng.choice(names), rng.sample(names, 2)))
+        report.update(graph.take_changed())
+        assert summary(report) == summary(GraphReport(document, graph))
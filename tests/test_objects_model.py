@@ -0,0 +1,43 @@
+import pytest
+
+from level_core.document import LevelDocument
+from level_core.history import History
+
+
+def make_objects(n=5):
+    return [{"aliases": [f"Obj{i}"], "objclass": "StageModuleProperties", "objdata": {}} for i in range(n)]
+
+
+def names(document):
+    return [obj["aliases"][0] for obj in document]
+
+
+def test_move_rows_is_one_undo_step():
+    document = LevelDocument(make_objects())
+    history = History(document)
+
+    document.move_rows([0, 2], 5)
+    assert names(document) == ["Obj1", "Obj3", "Obj4", "Obj0", "Obj2"]
+    assert len(history) == 1
+
+    history.undo()
+    assert names(document) == ["Obj0", "Obj1", "Obj2", "Obj3", "Obj4"]
+
+
+def test_drop_of_scattered_rows_is_one_undo_step():
+    pytest.importorskip("PyQt6")
+    from PyQt6.QtCore import QModelIndex, Qt
+
+    from objects_model import ObjectsListModel
+
+    document = LevelDocument(make_objects())
+    history = History(document)
+    model = ObjectsListModel(document)
+
+    mime = model.mimeData([model.index(0), model.index(3)])
+    model.dropMimeData(mime, Qt.DropAction.MoveAction, 2, 0, QModelIndex())
+    assert names(document) == ["Obj1", "Obj0", "Obj3", "Obj2", "Obj4"]
+    assert len(history) == 1
+
+    model.replay(history.undo)
+    assert names(document) == ["Obj0", "Obj1", "Obj2", "Obj3", "Obj4"]
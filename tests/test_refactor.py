@@ -0,0 +1,41 @@
+from level_core.alias_graph import AliasGraph
+from level_core.document import LevelDocument
+from level_core.history import History
+from level_core.refactor import rename_aliases
+
+
+def make_document():
+    return LevelDocument([
+        {"aliases": ["Wave1"], "objclass": "SpawnZombiesJitteredWaveActionProps", "objdata": {"Zombies": []}},
+        {"aliases": ["WaveManager"], "objclass": "WaveManagerProperties",
+         "objdata": {"Waves": [["RTID(Wave1@CurrentLevel)"]]}},
+        # no alias of its own, still references Wave1
+        {"objclass": "WaveManagerModuleProperties", "objdata": {"WaveManagerProps": "RTID(Wave1@CurrentLevel)"}},
+    ])
+
+
+def test_rename_rewrites_referrer_without_alias():
+    document = make_document()
+    graph = AliasGraph(document, debug=True)
+
+    rewritten = rename_aliases(document, graph, {"Wave1": "Opening"})
+
+    assert rewritten == 2
+    assert document[0]["aliases"] == ["Opening"]
+    assert document[1]["objdata"]["Waves"] == [["RTID(Opening@CurrentLevel)"]]
+    assert document[2]["objdata"]["WaveManagerProps"] == "RTID(Opening@CurrentLevel)"
+    assert graph.verify() == []
+
+
+def test_rename_is_one_undo_step():
+    document = make_document()
+    graph = AliasGraph(document, debug=True)
+    history = History(document)
+
+    rename_aliases(document, graph, {"Wave1": "Opening"})
+    assert len(history) == 1
+    history.undo()
+
+    assert document[0]["aliases"] == ["Wave1"]
+    assert document[2]["objdata"]["WaveManagerProps"] == "RTID(Wave1@CurrentLevel)"
+    assert {id(obj) for obj in graph.referring_objects("Wave1")} == {id(document[1]), id(document[2])}